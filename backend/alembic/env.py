@@ -5,7 +5,18 @@ from sqlalchemy import engine_from_config, pool
 
 from app.config import settings
 from app.database import Base
-from app.models import User, RefreshToken, Project  # noqa: F401
+from app.models import (  # noqa: F401
+    User,
+    RefreshToken,
+    Project,
+    ProjectDailyStats,
+    ProjectDailyBrand,
+    ProjectMonthlyCube,
+    ProjectMonthlyBrand,
+    ProjectStatusEvent,
+    BrandSketch,
+    DataVersion,
+)
 
 config = context.config
 config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
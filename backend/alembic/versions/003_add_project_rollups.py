@@ -0,0 +1,59 @@
+"""Add daily project rollups for dashboard metrics
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum types already created by 001
+region_enum = postgresql.ENUM(name="region", create_type=False)
+category_enum = postgresql.ENUM(name="category", create_type=False)
+project_status_enum = postgresql.ENUM(name="projectstatus", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_daily_stats",
+        sa.Column("request_date", sa.Date(), nullable=False),
+        sa.Column("region", region_enum, nullable=False),
+        sa.Column("category", category_enum, nullable=False),
+        sa.Column("status", project_status_enum, nullable=False),
+        sa.Column("project_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("request_date", "region", "category", "status"),
+    )
+    op.create_table(
+        "project_daily_brands",
+        sa.Column("request_date", sa.Date(), nullable=False),
+        sa.Column("region", region_enum, nullable=False),
+        sa.Column("brand_name", sa.String(200), nullable=False),
+        sa.Column("project_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("request_date", "region", "brand_name"),
+    )
+
+    # Backfill from existing projects
+    op.execute(
+        "INSERT INTO project_daily_stats (request_date, region, category, status, project_count) "
+        "SELECT request_date, region, category, status, count(*) FROM projects "
+        "GROUP BY request_date, region, category, status"
+    )
+    op.execute(
+        "INSERT INTO project_daily_brands (request_date, region, brand_name, project_count) "
+        "SELECT request_date, region, brand_name, count(*) FROM projects "
+        "GROUP BY request_date, region, brand_name"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_daily_brands")
+    op.drop_table("project_daily_stats")
@@ -0,0 +1,52 @@
+"""Add append-only project status event log
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum type already created by 001
+project_status_enum = postgresql.ENUM(name="projectstatus", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_status_events",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "project_id",
+            sa.Integer(),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("from_status", project_status_enum, nullable=True),
+        sa.Column("status", project_status_enum, nullable=False),
+        sa.Column("at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        "ix_project_status_events_project_id_at", "project_status_events", ["project_id", "at"]
+    )
+    op.create_index(
+        "ix_project_status_events_status_at", "project_status_events", ["status", "at"]
+    )
+
+    # Seed one event per existing project with its current status
+    op.execute(
+        "INSERT INTO project_status_events (project_id, from_status, status, at) "
+        "SELECT id, NULL, status, COALESCE(updated_at, created_at, now()) FROM projects"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_status_events")
@@ -0,0 +1,71 @@
+"""Add per-day, per-region HyperLogLog brand sketches
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+import hashlib
+import struct
+import zlib
+from collections import defaultdict
+from typing import Iterable, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum type already created by 001
+region_enum = postgresql.ENUM(name="region", create_type=False)
+
+# The sketch format as of this revision, copied from app.services.sketches so
+# the backfill stays the same whatever later happens to the service.
+PRECISION = 12
+REGISTERS = 1 << PRECISION
+
+
+def _sketch(brands: Iterable[str]) -> bytes:
+    registers = bytearray(REGISTERS)
+    for brand in brands:
+        x = int.from_bytes(hashlib.blake2b(brand.encode(), digest_size=8).digest(), "big")
+        index = x >> (64 - PRECISION)
+        remaining = x & ((1 << (64 - PRECISION)) - 1)
+        rank = (64 - PRECISION) - remaining.bit_length() + 1
+        if rank > registers[index]:
+            registers[index] = rank
+    entries = [(i, r) for i, r in enumerate(registers) if r]
+    if len(entries) * 3 < REGISTERS // 4:
+        return b"\x01" + b"".join(struct.pack(">HB", i, r) for i, r in entries)
+    return b"\x00" + zlib.compress(bytes(registers))
+
+
+def upgrade() -> None:
+    brand_sketches = op.create_table(
+        "brand_sketches",
+        sa.Column("request_date", sa.Date(), nullable=False),
+        sa.Column("region", region_enum, nullable=False),
+        sa.Column("sketch", sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint("request_date", "region"),
+    )
+
+    # Backfill from the brand rollup populated by 003
+    brands = defaultdict(list)
+    rows = op.get_bind().execute(
+        sa.text("SELECT request_date, region, brand_name FROM project_daily_brands")
+    )
+    for day, region, brand in rows:
+        brands[(day, region)].append(brand)
+    if brands:
+        op.bulk_insert(brand_sketches, [
+            {"request_date": day, "region": region, "sketch": _sketch(names)}
+            for (day, region), names in brands.items()
+        ])
+
+
+def downgrade() -> None:
+    op.drop_table("brand_sketches")
@@ -0,0 +1,44 @@
+"""Add composite indexes for date-range and list queries
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so these
+# are built in autocommit mode and do not lock out writes on large tables.
+INDEXES = [
+    ("ix_projects_request_date_status_region", "projects", ["request_date", "status", "region"]),
+    ("ix_projects_created_at_id", "projects", [sa.text("created_at DESC"), sa.text("id DESC")]),
+    ("ix_project_status_events_at", "project_status_events", ["at"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
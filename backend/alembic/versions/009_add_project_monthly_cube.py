@@ -0,0 +1,48 @@
+"""Add monthly project cube for dashboard drill-downs
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum types already created by 001
+region_enum = postgresql.ENUM(name="region", create_type=False)
+category_enum = postgresql.ENUM(name="category", create_type=False)
+project_status_enum = postgresql.ENUM(name="projectstatus", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_monthly_cube",
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("region", region_enum, nullable=False),
+        sa.Column("category", category_enum, nullable=False),
+        sa.Column("status", project_status_enum, nullable=False),
+        sa.Column("salesperson_name", sa.String(150), nullable=False),
+        sa.Column("project_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("month", "region", "category", "status", "salesperson_name"),
+    )
+
+    # Backfill from existing projects
+    op.execute(
+        "INSERT INTO project_monthly_cube "
+        "(month, region, category, status, salesperson_name, project_count) "
+        "SELECT date_trunc('month', request_date)::date, region, category, status, "
+        "salesperson_name, count(*) FROM projects "
+        "GROUP BY 1, region, category, status, salesperson_name"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_monthly_cube")
@@ -0,0 +1,45 @@
+"""Add monthly brand rollup for leaderboards
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum types already created by 001
+region_enum = postgresql.ENUM(name="region", create_type=False)
+project_status_enum = postgresql.ENUM(name="projectstatus", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_monthly_brands",
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("region", region_enum, nullable=False),
+        sa.Column("status", project_status_enum, nullable=False),
+        sa.Column("brand_name", sa.String(200), nullable=False),
+        sa.Column("project_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("month", "region", "status", "brand_name"),
+    )
+
+    # Backfill from existing projects
+    op.execute(
+        "INSERT INTO project_monthly_brands "
+        "(month, region, status, brand_name, project_count) "
+        "SELECT date_trunc('month', request_date)::date, region, status, brand_name, count(*) "
+        "FROM projects GROUP BY 1, region, status, brand_name"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_monthly_brands")
@@ -0,0 +1,37 @@
+"""Copy the project region onto status events
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum type already created by 001
+region_enum = postgresql.ENUM(name="region", create_type=False)
+
+
+def upgrade() -> None:
+    op.add_column("project_status_events", sa.Column("region", region_enum, nullable=True))
+    op.execute(
+        "UPDATE project_status_events AS e SET region = p.region "
+        "FROM projects AS p WHERE p.id = e.project_id"
+    )
+    op.alter_column("project_status_events", "region", nullable=False)
+    op.create_index(
+        "ix_project_status_events_region_at", "project_status_events", ["region", "at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_status_events_region_at", table_name="project_status_events")
+    op.drop_column("project_status_events", "region")
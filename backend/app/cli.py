@@ -0,0 +1,64 @@
+"""Command-line tasks, run from ``backend/``::
+
+    python -m app.cli import-projects legacy.xlsx --user marcom@example.com --errors errors.csv
+"""
+import argparse
+import csv
+import sys
+import time
+
+from app.database import SessionLocal
+from app.exceptions import AppException
+from app.models.user import User
+from app.services import imports as import_service
+
+
+def import_projects(args: argparse.Namespace) -> int:
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == args.user).first()
+        if user is None:
+            print(f"No user with email {args.user}", file=sys.stderr)
+            return 1
+        started = time.perf_counter()
+        with open(args.path, "rb") as file:
+            result = import_service.import_projects(
+                db, file, args.path, user, args.batch_size
+            )
+        elapsed = time.perf_counter() - started
+    except AppException as exc:
+        print(exc.message, file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    if args.errors:
+        with open(args.errors, "w", newline="") as report:
+            writer = csv.DictWriter(report, fieldnames=["row", "field", "message"])
+            writer.writeheader()
+            writer.writerows(result["errors"])
+    print(
+        f"Imported {result['imported']} of {result['rows']} rows "
+        f"({result['failed']} failed) in {elapsed:.1f} s, "
+        f"{result['rows'] / elapsed if elapsed else 0:.0f} rows/s"
+    )
+    return 0 if not result["failed"] else 2
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("import-projects", help="Create projects from a CSV or XLSX file")
+    command.add_argument("path")
+    command.add_argument("--user", required=True, help="Email of the Marcom user importing")
+    command.add_argument("--errors", help="Write the row-level error report to this CSV file")
+    command.add_argument("--batch-size", type=int, default=import_service.BATCH_SIZE)
+    command.set_defaults(run=import_projects)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,18 @@ class Settings(BaseSettings):
         "http://localhost:5173",
     ]
     FRONTEND_URL: str = "http://localhost:5173"
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 256
+    DASHBOARD_CACHE_TTL_SECONDS: int = 300
+    LIVE_STREAM_QUEUE_SIZE: int = 100
+    LIVE_STREAM_KEEPALIVE_SECONDS: int = 15
+    DASHBOARD_SNAPSHOT_ENABLED: bool = True
+    BULK_CHUNK_SIZE: int = 500
+    BULK_MAX_ITEMS: int = 5000
+    EXPORT_DIR: str = "exports"
+    EXPORT_WORKERS: int = 2
+    EXPORT_MAX_QUEUED: int = 8
+    EXPORT_MAX_AGE_SECONDS: int = 86400
+    EXPORT_DISK_BUDGET_BYTES: int = 1 << 30
 
     class Config:
         env_file = ".env"
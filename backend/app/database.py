@@ -1,5 +1,5 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.config import settings
 
@@ -14,3 +14,16 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def begin_snapshot(db: Session) -> None:
+    """Make every read in ``db``'s transaction come from one snapshot.
+
+    PostgreSQL gets a read-only ``REPEATABLE READ`` transaction. SQLite
+    already reads a single snapshot within one transaction. Call it before
+    the session's first query.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.connection(
+            execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+        )
@@ -0,0 +1,39 @@
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.auth.dependencies import get_current_user, require_role
+from app.database import get_db
+from app.models.user import User, UserRole
+from app.services import etags as etag_service
+
+management_only = require_role([UserRole.management])
+
+
+def _conditional_get(request: Request, response: Response, db: Session) -> str:
+    """Answer 304 when the client's copy is current, before any real work runs."""
+    version = etag_service.current_version(db)
+    etag = etag_service.make_etag(request.url.path, request.url.query, version)
+    if etag_service.matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return etag
+
+
+def dashboard_etag(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(management_only),
+) -> str:
+    return _conditional_get(request, response, db)
+
+
+def projects_etag(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> str:
+    return _conditional_get(request, response, db)
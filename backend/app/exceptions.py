@@ -5,6 +5,11 @@ class AppException(Exception):
         self.status_code = status_code
 
 
+class BadRequestError(AppException):
+    def __init__(self, message: str):
+        super().__init__(message, "BAD_REQUEST", 400)
+
+
 class NotFoundError(AppException):
     def __init__(self, resource: str):
         super().__init__(f"{resource} not found", "NOT_FOUND", 404)
@@ -15,6 +20,11 @@ class ConflictError(AppException):
         super().__init__(message, "CONFLICT", 409)
 
 
+class PreconditionFailedError(AppException):
+    def __init__(self, message: str):
+        super().__init__(message, "PRECONDITION_FAILED", 412)
+
+
 class ForbiddenError(AppException):
     def __init__(self, message: str = "You do not have permission to perform this action"):
         super().__init__(message, "FORBIDDEN", 403)
@@ -23,3 +33,8 @@ class ForbiddenError(AppException):
 class UnauthorizedError(AppException):
     def __init__(self, message: str = "Invalid or expired credentials"):
         super().__init__(message, "UNAUTHORIZED", 401)
+
+
+class TooManyRequestsError(AppException):
+    def __init__(self, message: str):
+        super().__init__(message, "TOO_MANY_REQUESTS", 429)
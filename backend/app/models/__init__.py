@@ -1,5 +1,14 @@
 from app.models.user import User, RefreshToken, UserRole
 from app.models.project import Project, Region, Category, ProjectStatus
+from app.models.stats import (
+    ProjectDailyStats,
+    ProjectDailyBrand,
+    ProjectMonthlyBrand,
+    ProjectMonthlyCube,
+)
+from app.models.sketch import BrandSketch
+from app.models.status_event import ProjectStatusEvent
+from app.models.data_version import DataVersion
 
 __all__ = [
     "User",
@@ -9,4 +18,11 @@ __all__ = [
     "Region",
     "Category",
     "ProjectStatus",
+    "ProjectDailyStats",
+    "ProjectDailyBrand",
+    "ProjectMonthlyCube",
+    "ProjectMonthlyBrand",
+    "ProjectStatusEvent",
+    "BrandSketch",
+    "DataVersion",
 ]
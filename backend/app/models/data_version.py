@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String
+
+from app.database import Base
+
+
+class DataVersion(Base):
+    """Monotonic change counter per resource, bumped by every write."""
+
+    __tablename__ = "data_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
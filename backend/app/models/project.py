@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import Column, Date, Integer, String, Enum, ForeignKey, Index
+from sqlalchemy import Column, Date, Integer, String, Enum, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -58,6 +58,8 @@ class Project(Base, TimestampMixin):
         default=ProjectStatus.brand_description_generated,
         nullable=False,
     )
+    # Bumped by every update; clients send it back in If-Match.
+    version = Column(Integer, nullable=False, server_default=text("1"))
 
     created_by_user = relationship("User", back_populates="projects")
 
@@ -66,4 +68,16 @@ class Project(Base, TimestampMixin):
         Index("ix_projects_status", "status"),
         Index("ix_projects_category", "category"),
         Index("ix_projects_user_id", "user_id"),
+        Index("ix_projects_request_date_status_region", "request_date", "status", "region"),
+        Index("ix_projects_created_at_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_projects_updated_at", "updated_at"),
+        *[
+            Index(
+                f"ix_projects_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+            for column in ("brand_name", "salesperson_name", "city")
+        ],
     )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Date, Enum, LargeBinary
+
+from app.database import Base
+from app.models.project import Region
+
+
+class BrandSketch(Base):
+    """Serialized HyperLogLog sketch of the brands per (request_date, region)."""
+
+    __tablename__ = "brand_sketches"
+
+    request_date = Column(Date, primary_key=True)
+    region = Column(
+        Enum(Region, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    sketch = Column(LargeBinary, nullable=False)
@@ -0,0 +1,88 @@
+from sqlalchemy import Column, Date, Integer, String, Enum
+
+from app.database import Base
+from app.models.project import Category, ProjectStatus, Region
+
+
+class ProjectDailyStats(Base):
+    """Project counts per (request_date, region, category, status)."""
+
+    __tablename__ = "project_daily_stats"
+
+    request_date = Column(Date, primary_key=True)
+    region = Column(
+        Enum(Region, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    category = Column(
+        Enum(Category, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    status = Column(
+        Enum(ProjectStatus, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    project_count = Column(Integer, nullable=False, default=0)
+
+
+class ProjectDailyBrand(Base):
+    """Reference count of projects per (request_date, region, brand_name).
+
+    Distinct brands over a date range are the distinct ``brand_name`` values
+    of the rows in that range, which is far fewer rows than ``projects``.
+    """
+
+    __tablename__ = "project_daily_brands"
+
+    request_date = Column(Date, primary_key=True)
+    region = Column(
+        Enum(Region, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    brand_name = Column(String(200), primary_key=True)
+    project_count = Column(Integer, nullable=False, default=0)
+
+
+class ProjectMonthlyCube(Base):
+    """Project counts per (month, region, category, status, salesperson_name).
+
+    ``month`` is the first day of the request date's month. Drill-downs over
+    whole months are answered from here; partial months at the edges of a
+    date range are read from ``projects``.
+    """
+
+    __tablename__ = "project_monthly_cube"
+
+    month = Column(Date, primary_key=True)
+    region = Column(
+        Enum(Region, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    category = Column(
+        Enum(Category, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    status = Column(
+        Enum(ProjectStatus, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    salesperson_name = Column(String(150), primary_key=True)
+    project_count = Column(Integer, nullable=False, default=0)
+
+
+class ProjectMonthlyBrand(Base):
+    """Project counts per (month, region, status, brand_name), for brand leaderboards."""
+
+    __tablename__ = "project_monthly_brands"
+
+    month = Column(Date, primary_key=True)
+    region = Column(
+        Enum(Region, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    status = Column(
+        Enum(ProjectStatus, values_callable=lambda e: [m.value for m in e]),
+        primary_key=True,
+    )
+    brand_name = Column(String(200), primary_key=True)
+    project_count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer
+from sqlalchemy.sql import func
+
+from app.database import Base
+from app.models.project import ProjectStatus, Region
+
+
+class ProjectStatusEvent(Base):
+    """Append-only log of project status transitions.
+
+    ``region`` is the project's current region, copied here so the stage
+    reports never join ``projects``; it follows the project when that changes.
+    """
+
+    __tablename__ = "project_status_events"
+
+    id = Column(Integer, primary_key=True)
+    project_id = Column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    from_status = Column(
+        Enum(ProjectStatus, values_callable=lambda e: [m.value for m in e]),
+        nullable=True,
+    )
+    status = Column(
+        Enum(ProjectStatus, values_callable=lambda e: [m.value for m in e]),
+        nullable=False,
+    )
+    region = Column(
+        Enum(Region, values_callable=lambda e: [m.value for m in e]),
+        nullable=False,
+    )
+    at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_project_status_events_project_id_at", "project_id", "at"),
+        Index("ix_project_status_events_status_at", "status", "at"),
+        Index("ix_project_status_events_at", "at"),
+        Index("ix_project_status_events_region_at", "region", "at"),
+    )
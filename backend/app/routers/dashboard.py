@@ -1,83 +1,304 @@
+import asyncio
 from datetime import date
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.auth.dependencies import require_role
 from app.database import get_db
-from app.models.user import User, UserRole
-from app.schemas.dashboard import MetricsResponse, RegionCount
+from app.dependencies import dashboard_etag, management_only
+from app.models.project import Category, ProjectStatus, Region
+from app.models.user import User
+from app.schemas.dashboard import (
+    BatchMetricsRequest,
+    CacheStatsResponse,
+    CubeDimension,
+    CubeResponse,
+    FunnelStage,
+    Leaderboard,
+    LeaderboardEntry,
+    MetricsBucket,
+    MetricsResponse,
+    RegionCount,
+    SeriesBucket,
+    SliceDimension,
+    SliceResponse,
+    StageDuration,
+)
 from app.services import dashboard as dashboard_service
+from app.services import live as live_service
+from app.services import status_events as status_event_service
+from app.services.cache import dashboard_cache, dashboard_flight
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
+# Aggregation endpoints are plain ``def`` so they run in the threadpool:
+# the database calls no longer block the event loop, and concurrent requests
+# for the same range can be coalesced by the cache's single-flight layer.
 
-@router.get("/metrics", response_model=MetricsResponse)
-async def get_metrics(
+APPROXIMATE_DESCRIPTION = (
+    "Estimate distinct clients per region from HyperLogLog sketches "
+    "(about 1.6% standard error) instead of counting them exactly."
+)
+
+
+@router.get(
+    "/metrics",
+    response_model=MetricsResponse,
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_metrics(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
+    approximate: bool = Query(False, description=APPROXIMATE_DESCRIPTION),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.management])),
+    current_user: User = Depends(management_only),
 ) -> MetricsResponse:
-    return dashboard_service.get_metrics(db, start_date, end_date)
+    return dashboard_service.get_metrics(db, start_date, end_date, approximate)
+
+
+@router.post("/metrics/batch", response_model=List[MetricsResponse])
+def get_metrics_batch(
+    data: BatchMetricsRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(management_only),
+) -> List[MetricsResponse]:
+    ranges = [(r.start_date, r.end_date) for r in data.ranges]
+    return dashboard_service.get_metrics_batch(db, ranges)
+
+
+def _json_array(items: Iterator[MetricsBucket]) -> Iterator[str]:
+    yield "["
+    for i, item in enumerate(items):
+        yield ("," if i else "") + item.model_dump_json()
+    yield "]"
+
+
+@router.get("/series", response_model=List[MetricsBucket])
+async def get_metrics_series(
+    bucket: SeriesBucket = Query(SeriesBucket.day),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(management_only),
+    etag: str = Depends(dashboard_etag),
+) -> StreamingResponse:
+    series = dashboard_service.iter_metrics_series(db, bucket, start_date, end_date)
+    return StreamingResponse(
+        _json_array(series), media_type="application/json", headers={"ETag": etag}
+    )
 
 
-@router.get("/clients-by-region", response_model=List[RegionCount])
-async def get_clients_by_region(
+@router.get("/stream")
+async def stream_metrics(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.management])),
+    current_user: User = Depends(management_only),
+) -> StreamingResponse:
+    """Server-sent events: the current metrics, then deltas as projects change."""
+    # The request's session only served the auth lookup. Release its
+    # connection now, or every open stream would hold one idle in a
+    # transaction until it ends; the initial state loads in its own session.
+    await run_in_threadpool(db.close)
+    subscription, snapshot = await run_in_threadpool(
+        live_service.metrics_hub.subscribe,
+        db,
+        asyncio.get_running_loop(),
+        start_date,
+        end_date,
+    )
+    return StreamingResponse(
+        live_service.iter_events(subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/slice",
+    response_model=SliceResponse,
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_slice(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    region: Optional[List[Region]] = Query(None),
+    category: Optional[List[Category]] = Query(None),
+    status: Optional[List[ProjectStatus]] = Query(None),
+    salesperson: Optional[List[str]] = Query(None),
+    group_by: Optional[SliceDimension] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(management_only),
+) -> SliceResponse:
+    """Projects and distinct clients for any filters; repeat a filter to match several values."""
+    return dashboard_service.get_slice(
+        db, start_date, end_date, region, category, status, salesperson, group_by
+    )
+
+
+@router.get(
+    "/query",
+    response_model=CubeResponse,
+    dependencies=[Depends(dashboard_etag)],
+)
+def query_cube(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    region: Optional[List[Region]] = Query(None),
+    category: Optional[List[Category]] = Query(None),
+    status: Optional[List[ProjectStatus]] = Query(None),
+    salesperson: Optional[List[str]] = Query(None),
+    group_by: List[CubeDimension] = Query([]),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(management_only),
+) -> CubeResponse:
+    """Project counts by any dimensions; repeat ``group_by`` or a filter for several values."""
+    return dashboard_service.query_cube(
+        db, start_date, end_date, region, category, status, salesperson, group_by
+    )
+
+
+@router.get(
+    "/leaderboards/{board}",
+    response_model=List[LeaderboardEntry],
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_leaderboard(
+    board: Leaderboard,
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    region: Optional[List[Region]] = Query(None),
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(management_only),
+) -> List[LeaderboardEntry]:
+    """Top salespeople by campaigns signed up, or top brands by videos approved."""
+    return dashboard_service.get_leaderboard(db, board, start_date, end_date, region, limit)
+
+
+@router.get(
+    "/clients-by-region",
+    response_model=List[RegionCount],
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_clients_by_region(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    approximate: bool = Query(False, description=APPROXIMATE_DESCRIPTION),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(management_only),
 ) -> List[RegionCount]:
-    return dashboard_service.get_clients_by_region(db, start_date, end_date)
+    return dashboard_service.get_clients_by_region(db, start_date, end_date, approximate)
 
 
-@router.get("/campaigns-by-region", response_model=List[RegionCount])
-async def get_campaigns_by_region(
+@router.get(
+    "/campaigns-by-region",
+    response_model=List[RegionCount],
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_campaigns_by_region(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.management])),
+    current_user: User = Depends(management_only),
 ) -> List[RegionCount]:
     return dashboard_service.get_campaigns_by_region(db, start_date, end_date)
 
 
-@router.get("/briefs-approved", response_model=dict)
-async def get_briefs_approved(
+@router.get(
+    "/briefs-approved",
+    response_model=dict,
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_briefs_approved(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.management])),
+    current_user: User = Depends(management_only),
 ) -> dict:
     return {"briefs_approved": dashboard_service.get_briefs_approved(db, start_date, end_date)}
 
 
-@router.get("/videos-generated", response_model=dict)
-async def get_videos_generated(
+@router.get(
+    "/videos-generated",
+    response_model=dict,
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_videos_generated(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.management])),
+    current_user: User = Depends(management_only),
 ) -> dict:
     return {"videos_generated": dashboard_service.get_videos_generated(db, start_date, end_date)}
 
 
-@router.get("/videos-approved", response_model=dict)
-async def get_videos_approved(
+@router.get(
+    "/videos-approved",
+    response_model=dict,
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_videos_approved(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.management])),
+    current_user: User = Depends(management_only),
 ) -> dict:
     return {"videos_approved": dashboard_service.get_videos_approved(db, start_date, end_date)}
 
 
-@router.get("/campaigns-completed", response_model=dict)
-async def get_campaigns_completed(
+@router.get(
+    "/campaigns-completed",
+    response_model=dict,
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_campaigns_completed(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.management])),
+    current_user: User = Depends(management_only),
 ) -> dict:
     return {"campaigns_completed": dashboard_service.get_campaigns_completed(db, start_date, end_date)}
+
+
+@router.get(
+    "/funnel",
+    response_model=List[FunnelStage],
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_funnel(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    region: Optional[Region] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(management_only),
+) -> List[FunnelStage]:
+    return status_event_service.get_funnel(db, start_date, end_date, region)
+
+
+@router.get(
+    "/time-in-stage",
+    response_model=List[StageDuration],
+    dependencies=[Depends(dashboard_etag)],
+)
+def get_time_in_stage(
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(management_only),
+) -> List[StageDuration]:
+    return status_event_service.get_time_in_stage(db, start_date, end_date)
+
+
+@router.get("/cache-stats", response_model=CacheStatsResponse)
+async def get_cache_stats(
+    current_user: User = Depends(management_only),
+) -> dict:
+    return {
+        **dashboard_cache.stats(),
+        **dashboard_flight.stats(),
+        **dashboard_service.snapshot_stats(),
+    }
@@ -1,21 +1,48 @@
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic_core import to_json
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import get_current_user
 from app.database import get_db
+from app.dependencies import projects_etag
 from app.models.project import Category, ProjectStatus, Region
 from app.models.user import User
-from app.schemas.project import ProjectCreate, ProjectListResponse, ProjectResponse, ProjectUpdate
+from app.schemas.project import (
+    ExportCompression,
+    ExportFormat,
+    ExportJobCreate,
+    ExportJobResponse,
+    ImportResponse,
+    ProjectBulkRequest,
+    ProjectBulkResponse,
+    ProjectCreate,
+    ProjectField,
+    ProjectListResponse,
+    ProjectResponse,
+    ProjectUpdate,
+    SuggestField,
+    Suggestion,
+)
+from app.services import etags as etag_service
+from app.services import export_jobs as export_job_service
+from app.services import exports as export_service
+from app.services import imports as import_service
 from app.services import projects as project_service
+from app.services import suggestions as suggestion_service
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-@router.get("/", response_model=ProjectListResponse)
+@router.get(
+    "/",
+    response_model=ProjectListResponse,
+    dependencies=[Depends(projects_etag)],
+)
 async def list_projects(
+    response: Response,
     page: int = 1,
     per_page: int = 20,
     region: Optional[Region] = None,
@@ -23,12 +50,34 @@ async def list_projects(
     category: Optional[Category] = None,
     salesperson: Optional[str] = None,
     brand: Optional[str] = None,
+    cursor: Optional[str] = Query(
+        None, description="``next_cursor`` from the previous page; replaces ``page``."
+    ),
+    include_total: bool = Query(True, description="Set to false to skip counting."),
+    estimate_total: bool = Query(
+        False, description="Allow an estimated total for large result sets."
+    ),
+    q: Optional[str] = Query(
+        None, description="Search brand, salesperson and city; results are ranked by relevance."
+    ),
+    fields: Optional[List[ProjectField]] = Query(
+        None, description="Return only these fields of each project, plus its id."
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> dict:
-    return project_service.get_projects(
-        db, page, per_page, region, status, category, salesperson, brand
+):
+    result = project_service.get_projects(
+        db, page, per_page, region, status, category, salesperson, brand, cursor,
+        include_total, estimate_total, q, fields,
     )
+    if fields:
+        # Sparse items do not fit ProjectResponse; serialize the plain dicts as they are.
+        return Response(
+            to_json(result),
+            media_type="application/json",
+            headers={"ETag": response.headers["etag"]},
+        )
+    return result
 
 
 @router.post("/", response_model=ProjectResponse, status_code=201)
@@ -40,42 +89,146 @@ async def create_project(
     return project_service.create_project(db, data, current_user)
 
 
+@router.post("/bulk", response_model=ProjectBulkResponse)
+async def bulk_write_projects(
+    data: ProjectBulkRequest,
+    chunk_size: Optional[int] = Query(
+        None, ge=1, le=5000, description="Rows per statement; defaults to BULK_CHUNK_SIZE."
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    """Create, update and delete projects in one transaction.
+
+    Invalid items are reported per item in ``results`` and skipped.
+    """
+    return project_service.bulk_write(db, data, current_user, chunk_size)
+
+
+@router.post("/import", response_model=ImportResponse)
+def import_projects(
+    file: UploadFile,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    """Create projects from an uploaded CSV or XLSX file; invalid rows are reported."""
+    return import_service.import_projects(db, file.file, file.filename or "", current_user)
+
+
 @router.get("/export")
 async def export_projects(
+    format: ExportFormat = ExportFormat.csv,
+    compression: Optional[ExportCompression] = Query(
+        None, description="Compress the file; for Parquet, the column codec."
+    ),
+    region: Optional[Region] = None,
+    status: Optional[ProjectStatus] = None,
+    category: Optional[Category] = None,
+    salesperson: Optional[str] = None,
+    brand: Optional[str] = None,
+    q: Optional[str] = Query(None, description="Search brand, salesperson and city."),
+    fields: Optional[List[ProjectField]] = Query(
+        None,
+        description="Export only these columns; user_id, updated_at and version are not exported.",
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> StreamingResponse:
-    csv_content = project_service.export_projects_csv(db)
+    export = export_service.export_projects(
+        db, format, compression, region, status, category, salesperson, brand, q, fields
+    )
     return StreamingResponse(
-        iter([csv_content]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=projects.csv"},
+        export.chunks,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f"attachment; filename={export.filename}"},
     )
 
 
+@router.get("/suggest", response_model=List[Suggestion])
+async def suggest_values(
+    field: SuggestField,
+    prefix: str = Query("", description="Case-insensitive start of the value."),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> List[dict]:
+    return suggestion_service.suggestion_index.suggest(db, field, prefix, limit)
+
+
+@router.post("/exports", response_model=ExportJobResponse, status_code=202)
+async def start_export(
+    data: ExportJobCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> ExportJobResponse:
+    """Write the export to a file in the background; poll the job for progress."""
+    return export_job_service.export_jobs.submit(db, data, current_user)
+
+
+@router.get("/exports/{job_id}", response_model=ExportJobResponse)
+async def get_export(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+) -> ExportJobResponse:
+    return export_job_service.export_jobs.get(job_id, current_user)
+
+
+@router.get("/exports/{job_id}/download")
+async def download_export(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+) -> FileResponse:
+    """The finished file; ``Range`` requests let interrupted downloads resume."""
+    job = export_job_service.export_jobs.get_file(job_id, current_user)
+    return FileResponse(job.path, media_type=job.media_type, filename=job.filename)
+
+
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> ProjectResponse:
-    return project_service.get_project(db, project_id)
+    """The ETag is the project's version, which PUT and DELETE take in ``If-Match``.
+
+    A revalidation reads only the version; the row is loaded on a miss.
+    """
+    if if_none_match:
+        etag = etag_service.version_etag(project_service.get_project_version(db, project_id))
+        if etag_service.matches(if_none_match, etag):
+            raise HTTPException(status_code=304, headers={"ETag": etag})
+    project = project_service.get_project(db, project_id)
+    response.headers["ETag"] = etag_service.version_etag(project.version)
+    return project
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: int,
     data: ProjectUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> ProjectResponse:
-    return project_service.update_project(db, project_id, data, current_user)
+    """Send the project's ``version`` as ``If-Match: "<version>"`` to update
+    only if nobody else has since; a stale version gets 412."""
+    project = project_service.update_project(
+        db, project_id, data, current_user, etag_service.parse_if_match(if_match)
+    )
+    response.headers["ETag"] = etag_service.version_etag(project["version"])
+    return project
 
 
 @router.delete("/{project_id}", status_code=204)
 async def delete_project(
     project_id: int,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> None:
-    project_service.delete_project(db, project_id, current_user)
+    project_service.delete_project(
+        db, project_id, current_user, etag_service.parse_if_match(if_match)
+    )
@@ -1,6 +1,36 @@
-from typing import List
+import enum
+from datetime import date
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.models.project import Category, ProjectStatus, Region
+
+
+class SeriesBucket(str, enum.Enum):
+    day = "day"
+    week = "week"
+    month = "month"
+
+
+class SliceDimension(str, enum.Enum):
+    region = "region"
+    category = "category"
+    status = "status"
+    salesperson = "salesperson"
+
+
+class CubeDimension(str, enum.Enum):
+    month = "month"
+    region = "region"
+    category = "category"
+    status = "status"
+    salesperson = "salesperson"
+
+
+class Leaderboard(str, enum.Enum):
+    salespeople = "salespeople"
+    brands = "brands"
 
 
 class RegionCount(BaseModel):
@@ -16,3 +46,80 @@ class MetricsResponse(BaseModel):
     videos_approved: int
     campaigns_completed: int
     campaigns_by_region: List[RegionCount]
+
+
+class DateRange(BaseModel):
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
+class BatchMetricsRequest(BaseModel):
+    ranges: List[DateRange] = Field(..., min_length=1, max_length=24)
+
+
+class MetricsBucket(MetricsResponse):
+    bucket_start: date
+
+
+class CacheStatsResponse(BaseModel):
+    entries: int
+    max_entries: int
+    ttl_seconds: int
+    data_version: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    in_flight: int
+    computations: int
+    collapsed: int
+    snapshot_rows: int
+    snapshot_bytes: int
+
+
+class SliceGroup(BaseModel):
+    key: str
+    projects: int
+    clients: int
+
+
+class SliceResponse(BaseModel):
+    projects: int
+    clients: int
+    groups: List[SliceGroup]
+
+
+class CubeRow(BaseModel):
+    """One group of a cube query; dimensions that were not grouped by are null."""
+
+    month: Optional[date] = None
+    region: Optional[Region] = None
+    category: Optional[Category] = None
+    status: Optional[ProjectStatus] = None
+    salesperson: Optional[str] = None
+    projects: int
+
+
+class CubeResponse(BaseModel):
+    total: int
+    rows: List[CubeRow]
+
+
+class LeaderboardEntry(BaseModel):
+    name: str
+    count: int
+
+
+class FunnelStage(BaseModel):
+    status: ProjectStatus
+    projects: int
+    conversion_rate: float
+    step_conversion_rate: float
+
+
+class StageDuration(BaseModel):
+    region: Region
+    status: ProjectStatus
+    stints: int
+    median_seconds: float
+    p90_seconds: float
@@ -1,3 +1,4 @@
+import enum
 from datetime import date, datetime
 from typing import List, Optional
 
@@ -26,6 +27,36 @@ class ProjectUpdate(BaseModel):
     status: Optional[ProjectStatus] = None
 
 
+class ProjectBulkUpdate(ProjectUpdate):
+    id: int
+
+
+class ProjectBulkRequest(BaseModel):
+    create: List[ProjectCreate] = []
+    update: List[ProjectBulkUpdate] = []
+    delete: List[int] = []
+
+
+class BulkOperation(str, enum.Enum):
+    create = "create"
+    update = "update"
+    delete = "delete"
+
+
+class BulkItemResult(BaseModel):
+    operation: BulkOperation
+    index: int
+    id: Optional[int]
+    error: Optional[str] = None
+
+
+class ProjectBulkResponse(BaseModel):
+    created: int
+    updated: int
+    deleted: int
+    results: List[BulkItemResult]
+
+
 class ProjectResponse(BaseModel):
     id: int
     user_id: int
@@ -38,13 +69,104 @@ class ProjectResponse(BaseModel):
     status: ProjectStatus
     created_at: datetime
     updated_at: Optional[datetime]
+    version: int
 
     class Config:
         from_attributes = True
 
 
+class ProjectField(str, enum.Enum):
+    """A ``ProjectResponse`` field, for sparse fieldsets."""
+
+    id = "id"
+    user_id = "user_id"
+    region = "region"
+    request_date = "request_date"
+    city = "city"
+    salesperson_name = "salesperson_name"
+    brand_name = "brand_name"
+    category = "category"
+    status = "status"
+    created_at = "created_at"
+    updated_at = "updated_at"
+    version = "version"
+
+
 class ProjectListResponse(BaseModel):
     items: List[ProjectResponse]
-    total: int
-    page: int
+    total: Optional[int]
+    total_is_estimate: bool = False
+    page: Optional[int]
     per_page: int
+    next_cursor: Optional[str] = None
+
+
+class SuggestField(str, enum.Enum):
+    brand = "brand"
+    city = "city"
+    salesperson = "salesperson"
+
+
+class Suggestion(BaseModel):
+    value: str
+    count: int
+
+
+class ExportFormat(str, enum.Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+    parquet = "parquet"
+    arrow = "arrow"
+
+
+class ExportCompression(str, enum.Enum):
+    gzip = "gzip"
+    zstd = "zstd"
+
+
+class ExportJobStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    done = "done"
+    failed = "failed"
+    expired = "expired"
+
+
+class ExportJobCreate(BaseModel):
+    format: ExportFormat = ExportFormat.csv
+    compression: Optional[ExportCompression] = None
+    region: Optional[Region] = None
+    status: Optional[ProjectStatus] = None
+    category: Optional[Category] = None
+    salesperson: Optional[str] = None
+    brand: Optional[str] = None
+    q: Optional[str] = None
+    fields: Optional[List[ProjectField]] = None
+
+
+class ExportJobResponse(BaseModel):
+    id: str
+    status: ExportJobStatus
+    filename: str
+    rows_written: int
+    total_rows: Optional[int]
+    bytes_written: int
+    created_at: datetime
+    finished_at: Optional[datetime]
+    error: Optional[str]
+
+    class Config:
+        from_attributes = True
+
+
+class ImportRowError(BaseModel):
+    row: int
+    field: Optional[str]
+    message: str
+
+
+class ImportResponse(BaseModel):
+    rows: int
+    imported: int
+    failed: int
+    errors: List[ImportRowError]
@@ -0,0 +1,141 @@
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, Tuple
+
+from app.config import settings
+from app.services import etags as etag_service
+from app.services.singleflight import SingleFlight
+
+_MISSING = object()
+
+
+def _hashable(value: Any) -> Hashable:
+    # List-valued filters arrive as lists; the cache key needs tuples.
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+class VersionedLRUCache:
+    """In-process LRU cache whose entries are tied to the data version.
+
+    Every entry records the ``data_versions`` value it was computed under,
+    and a lookup passes the version the caller just read. An entry from an
+    older version is never served again, even before its TTL runs out, and
+    that holds for writes from other workers and the CLI as well, since
+    they all bump the same row.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def version(self) -> int:
+        """The newest data version the cache has seen."""
+        return self._version
+
+    def get(self, key: Hashable, version: int) -> Any:
+        with self._lock:
+            self._version = max(self._version, version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+            entry_version, expires_at, value = entry
+            if entry_version != version or expires_at <= time.monotonic():
+                # A reader still behind a write leaves the newer entry alone.
+                if entry_version <= version:
+                    del self._entries[key]
+                    self.expirations += 1
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, version: int) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if version < self._version or (entry is not None and version < entry[0]):
+                # Computed from data that changed in the meantime.
+                return
+            self._version = version
+            self._entries[key] = (version, time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "data_version": self._version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+dashboard_cache = VersionedLRUCache(
+    settings.DASHBOARD_CACHE_MAX_ENTRIES, settings.DASHBOARD_CACHE_TTL_SECONDS
+)
+
+
+dashboard_flight = SingleFlight()
+
+
+def cached(endpoint: str) -> Callable:
+    """Cache a ``(db, ...)`` dashboard function by endpoint and its other arguments.
+
+    Entries are keyed by the ``data_versions`` row, read before the
+    computation so a result is never labelled newer than the data it saw.
+    Misses go through ``dashboard_flight``, so concurrent requests for the
+    same key share one computation instead of each querying the database.
+    The flight is keyed by data version too: a request that arrives after a
+    write never joins a computation that may have read pre-write data.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(db, *args, **kwargs):
+            bound = signature.bind(db, *args, **kwargs)
+            bound.apply_defaults()
+            key = (endpoint, *[_hashable(v) for v in list(bound.arguments.values())[1:]])
+            version = etag_service.current_version(db)
+            value = dashboard_cache.get(key, version)
+            if value is not _MISSING:
+                return value
+
+            def compute():
+                result = func(db, *args, **kwargs)
+                dashboard_cache.set(key, result, version)
+                return result
+
+            return dashboard_flight.do((version, key), compute)
+
+        return wrapper
+
+    return decorator
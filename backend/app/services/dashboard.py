@@ -1,126 +1,891 @@
+import heapq
 import logging
-from datetime import date
-from typing import List, Optional
+import sys
+import threading
+from collections import Counter
+from datetime import date, timedelta
+from itertools import groupby
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session, Query
+from sqlalchemy import (
+    Date,
+    Integer,
+    Select,
+    and_,
+    cast,
+    column,
+    func,
+    literal,
+    or_,
+    select,
+    union_all,
+    values,
+)
+from sqlalchemy.orm import Session
 
-from app.models.project import Project, ProjectStatus
-from app.schemas.dashboard import MetricsResponse, RegionCount
+from app.config import settings
+from app.models.project import Category, Project, ProjectStatus, Region
+from app.models.stats import (
+    ProjectDailyBrand,
+    ProjectDailyStats,
+    ProjectMonthlyBrand,
+    ProjectMonthlyCube,
+)
+from app.schemas.dashboard import (
+    CubeDimension,
+    CubeResponse,
+    CubeRow,
+    Leaderboard,
+    LeaderboardEntry,
+    MetricsBucket,
+    MetricsResponse,
+    RegionCount,
+    SeriesBucket,
+    SliceDimension,
+    SliceGroup,
+    SliceResponse,
+)
+from app.services import etags as etag_service
+from app.services import sketches as sketch_service
+from app.services.cache import cached
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; slices are answered in SQL without it.
+    np = None
 
 logger = logging.getLogger(__name__)
 
+SERIES_BATCH_SIZE = 1000
+SNAPSHOT_BATCH_SIZE = 10000
+
+# Rows are re-read from slightly before the last refresh's newest timestamp,
+# so a transaction that committed shortly after its now() is not missed.
+# Later commits are caught by the checksum in ``ProjectSnapshot.refresh``.
+SNAPSHOT_REFRESH_OVERLAP = timedelta(seconds=5)
+
+VIDEO_GENERATED_STATUSES = [
+    ProjectStatus.video_submitted_for_review,
+    ProjectStatus.video_approved,
+]
+
 
 def _apply_date_filter(
-    query: Query,
+    query: Select,
+    column,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> Query:
+) -> Select:
     if start_date:
-        query = query.filter(Project.request_date >= start_date)
+        query = query.where(column >= start_date)
     if end_date:
-        query = query.filter(Project.request_date <= end_date)
+        query = query.where(column <= end_date)
     return query
 
 
-def get_clients_by_region(
+def _region_label(region) -> str:
+    return region.value if hasattr(region, "value") else str(region)
+
+
+def _status_count(*statuses: ProjectStatus):
+    return func.coalesce(
+        func.sum(ProjectDailyStats.project_count).filter(
+            ProjectDailyStats.status.in_(statuses)
+        ),
+        0,
+    )
+
+
+def _counter_columns() -> list:
+    return [
+        func.sum(ProjectDailyStats.project_count).label("total_projects"),
+        _status_count(ProjectStatus.client_approved).label("briefs_approved"),
+        _status_count(*VIDEO_GENERATED_STATUSES).label("videos_generated"),
+        _status_count(ProjectStatus.video_approved).label("videos_approved"),
+        _status_count(ProjectStatus.campaign_signed_up).label("campaigns_completed"),
+    ]
+
+
+def _bucket_expr(dialect: str, bucket: SeriesBucket, column):
+    """Truncate a date column to the first day of its day, ISO week or month."""
+    if bucket == SeriesBucket.day:
+        return column
+    if dialect == "postgresql":
+        return cast(func.date_trunc(bucket.value, column), Date)
+    if bucket == SeriesBucket.week:
+        return func.date(column, "weekday 0", "-6 days", type_=Date)
+    return func.date(column, "start of month", type_=Date)
+
+
+def _metrics_query(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    bucket: Optional[Callable] = None,
+    include_clients: bool = True,
+) -> Select:
+    """Every dashboard counter per region (and bucket), answered from the daily rollups.
+
+    Status counters are conditional sums (``sum(...) FILTER (WHERE ...)``) over
+    ``project_daily_stats``; distinct brands come from ``project_daily_brands``.
+    Both grouped subqueries are joined on their group keys so one round trip
+    returns everything. Every group with a brand also has a stats row, so the
+    outer join never drops brand counts.
+    """
+    stats_groups = [ProjectDailyStats.region.label("region")]
+    brand_groups = [ProjectDailyBrand.region.label("region")]
+    if bucket is not None:
+        stats_groups.insert(0, bucket(ProjectDailyStats.request_date).label("bucket"))
+        brand_groups.insert(0, bucket(ProjectDailyBrand.request_date).label("bucket"))
+
+    counters = _apply_date_filter(
+        select(*stats_groups, *_counter_columns()),
+        ProjectDailyStats.request_date,
+        start_date,
+        end_date,
+    ).group_by(*stats_groups).subquery("counters")
+
+    keys = ["bucket", "region"] if bucket is not None else ["region"]
+    if not include_clients:
+        return select(counters).order_by(*[counters.c[k] for k in keys])
+
+    clients = _apply_date_filter(
+        select(
+            *brand_groups,
+            func.count(func.distinct(ProjectDailyBrand.brand_name)).label("clients"),
+        ),
+        ProjectDailyBrand.request_date,
+        start_date,
+        end_date,
+    ).group_by(*brand_groups).subquery("clients")
+
+    return (
+        select(
+            counters,
+            func.coalesce(clients.c.clients, 0).label("clients"),
+        )
+        .outerjoin(clients, and_(*[clients.c[k] == counters.c[k] for k in keys]))
+        .order_by(*[counters.c[k] for k in keys])
+    )
+
+
+def _build_metrics(rows: Iterable, clients: Optional[List[Tuple]] = None) -> dict:
+    rows = list(rows)
+    if clients is None:
+        clients = [(r.region, r.clients) for r in rows]
+    return dict(
+        total_projects=sum(r.total_projects for r in rows),
+        clients_by_region=[
+            RegionCount(region=_region_label(region), count=count)
+            for region, count in clients
+        ],
+        briefs_approved=sum(r.briefs_approved for r in rows),
+        videos_generated=sum(r.videos_generated for r in rows),
+        videos_approved=sum(r.videos_approved for r in rows),
+        campaigns_completed=sum(r.campaigns_completed for r in rows),
+        campaigns_by_region=[
+            RegionCount(region=_region_label(r.region), count=r.campaigns_completed)
+            for r in rows
+            if r.campaigns_completed
+        ],
+    )
+
+
+@cached("metrics")
+def get_metrics(
     db: Session,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> List[RegionCount]:
-    query = db.query(
-        Project.region, func.count(func.distinct(Project.brand_name))
+    approximate: bool = False,
+) -> MetricsResponse:
+    """All dashboard counters for a date range.
+
+    With ``approximate`` the distinct brands per region are estimated from
+    the daily HyperLogLog sketches instead of counted exactly; see
+    ``app.services.sketches`` for the error bounds.
+    """
+    if not approximate:
+        rows = db.execute(_metrics_query(start_date, end_date)).all()
+        return MetricsResponse(**_build_metrics(rows))
+
+    rows = db.execute(_metrics_query(start_date, end_date, include_clients=False)).all()
+    clients = sketch_service.estimate_clients_by_region(db, start_date, end_date)
+    return MetricsResponse(**_build_metrics(rows, clients))
+
+
+def _ranges_relation(dialect: str, ranges: List[Tuple[Optional[date], Optional[date]]]):
+    """The requested ranges as a ``(idx, start_date, end_date)`` relation.
+
+    Open bounds become the extreme dates so the join needs no NULL handling.
+    PostgreSQL gets a ``VALUES`` list; SQLite cannot alias ``VALUES`` columns,
+    so it gets the equivalent ``UNION ALL`` of constant rows.
+    """
+    rows = [
+        (i, start_date or date.min, end_date or date.max)
+        for i, (start_date, end_date) in enumerate(ranges)
+    ]
+    if dialect == "postgresql":
+        return values(
+            column("idx", Integer),
+            column("start_date", Date),
+            column("end_date", Date),
+            name="ranges",
+        ).data(rows)
+    return union_all(*[
+        select(
+            literal(i, Integer).label("idx"),
+            literal(start_date, Date).label("start_date"),
+            literal(end_date, Date).label("end_date"),
+        )
+        for i, start_date, end_date in rows
+    ]).subquery("ranges")
+
+
+def get_metrics_batch(
+    db: Session,
+    ranges: List[Tuple[Optional[date], Optional[date]]],
+) -> List[MetricsResponse]:
+    """Metrics for several date ranges in one statement.
+
+    The ranges are joined to the rollups with conditional counts grouped by
+    range and region, so every range is answered by the same round trip.
+    """
+    relation = _ranges_relation(db.get_bind().dialect.name, ranges)
+
+    def in_range(day_column):
+        return and_(day_column >= relation.c.start_date, day_column <= relation.c.end_date)
+
+    counters = (
+        select(
+            relation.c.idx,
+            ProjectDailyStats.region.label("region"),
+            *_counter_columns(),
+        )
+        .select_from(relation)
+        .join(ProjectDailyStats, in_range(ProjectDailyStats.request_date))
+        .group_by(relation.c.idx, ProjectDailyStats.region)
+        .subquery("counters")
+    )
+    clients = (
+        select(
+            relation.c.idx,
+            ProjectDailyBrand.region.label("region"),
+            func.count(func.distinct(ProjectDailyBrand.brand_name)).label("clients"),
+        )
+        .select_from(relation)
+        .join(ProjectDailyBrand, in_range(ProjectDailyBrand.request_date))
+        .group_by(relation.c.idx, ProjectDailyBrand.region)
+        .subquery("clients")
     )
-    query = _apply_date_filter(query, start_date, end_date)
-    region_counts = query.group_by(Project.region).all()
+    query = (
+        select(counters, func.coalesce(clients.c.clients, 0).label("clients"))
+        .outerjoin(
+            clients,
+            and_(clients.c.idx == counters.c.idx, clients.c.region == counters.c.region),
+        )
+        .order_by(counters.c.idx, counters.c.region)
+    )
+
+    by_range = {idx: list(rows) for idx, rows in groupby(db.execute(query), key=lambda r: r.idx)}
     return [
-        RegionCount(region=r.value if hasattr(r, "value") else str(r), count=c)
-        for r, c in region_counts
+        MetricsResponse(**_build_metrics(by_range.get(i, [])))
+        for i in range(len(ranges))
     ]
 
 
-def get_campaigns_by_region(
+def _bucket_floor(day: date, bucket: SeriesBucket) -> date:
+    if bucket == SeriesBucket.week:
+        return day - timedelta(days=day.weekday())
+    if bucket == SeriesBucket.month:
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(day: date, bucket: SeriesBucket) -> date:
+    if bucket == SeriesBucket.week:
+        return day + timedelta(weeks=1)
+    if bucket == SeriesBucket.month:
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return day + timedelta(days=1)
+
+
+def iter_metrics_series(
     db: Session,
+    bucket: SeriesBucket,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> List[RegionCount]:
-    query = db.query(
-        Project.region, func.count(Project.id)
-    ).filter(Project.status == ProjectStatus.campaign_signed_up)
-    query = _apply_date_filter(query, start_date, end_date)
-    region_counts = query.group_by(Project.region).all()
+) -> Iterator[MetricsBucket]:
+    """Yield one ``MetricsBucket`` per day, week or month, oldest first.
+
+    All buckets come from one grouped query whose rows are streamed in
+    batches, ordered by bucket, so memory stays bounded by a single bucket.
+    Buckets without data are zero-filled between ``start_date`` and
+    ``end_date`` (or between the first and last bucket with data).
+    """
+    dialect = db.get_bind().dialect.name
+    query = _metrics_query(
+        start_date, end_date, lambda column: _bucket_expr(dialect, bucket, column)
+    )
+    rows = db.execute(query.execution_options(yield_per=SERIES_BATCH_SIZE))
+
+    cursor = _bucket_floor(start_date, bucket) if start_date else None
+    for bucket_start, group in groupby(rows, key=lambda r: r.bucket):
+        if isinstance(bucket_start, str):
+            bucket_start = date.fromisoformat(bucket_start)
+        while cursor is not None and cursor < bucket_start:
+            yield MetricsBucket(bucket_start=cursor, **_build_metrics([]))
+            cursor = _next_bucket(cursor, bucket)
+        yield MetricsBucket(bucket_start=bucket_start, **_build_metrics(group))
+        cursor = _next_bucket(bucket_start, bucket)
+
+    if cursor is not None and end_date:
+        while cursor <= end_date:
+            yield MetricsBucket(bucket_start=cursor, **_build_metrics([]))
+            cursor = _next_bucket(cursor, bucket)
+
+
+SLICE_COLUMNS = {
+    SliceDimension.region: Project.region,
+    SliceDimension.category: Project.category,
+    SliceDimension.status: Project.status,
+    SliceDimension.salesperson: Project.salesperson_name,
+}
+
+
+def _dimension_filters(
+    query: Select,
+    columns: Dict[SliceDimension, object],
+    filters: Dict[SliceDimension, Optional[Sequence]],
+) -> Select:
+    for dimension, wanted in filters.items():
+        if wanted:
+            query = query.where(columns[dimension].in_(list(wanted)))
+    return query
+
+
+def _slice_filters(
+    query: Select,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    filters: Dict[SliceDimension, Optional[Sequence]],
+) -> Select:
+    query = _apply_date_filter(query, Project.request_date, start_date, end_date)
+    return _dimension_filters(query, SLICE_COLUMNS, filters)
+
+
+def _slice_sql(
+    db: Session,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    filters: Dict[SliceDimension, Optional[Sequence]],
+    group_by: Optional[SliceDimension],
+) -> SliceResponse:
+    counts = (func.count(Project.id), func.count(func.distinct(Project.brand_name)))
+    projects, clients = db.execute(
+        _slice_filters(select(*counts), start_date, end_date, filters)
+    ).one()
+
+    groups = []
+    if group_by is not None:
+        key = SLICE_COLUMNS[group_by]
+        rows = db.execute(
+            _slice_filters(select(key, *counts), start_date, end_date, filters).group_by(key)
+        )
+        groups = [
+            SliceGroup(key=_region_label(value), projects=n, clients=c) for value, n, c in rows
+        ]
+        groups.sort(key=lambda g: g.key)
+    return SliceResponse(projects=projects, clients=clients, groups=groups)
+
+
+class _Dictionary:
+    """Append-only string dictionary; codes stay stable across refreshes."""
+
+    def __init__(self, values: Iterable = ()):
+        self.values: List = []
+        self.codes: Dict = {}
+        for value in values:
+            self.encode(value)
+
+    def encode(self, value) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, values: Sequence) -> List[int]:
+        return [self.codes[v] for v in values if v in self.codes]
+
+    def nbytes(self) -> int:
+        return sum(sys.getsizeof(v) for v in self.values if isinstance(v, str))
+
+
+class ProjectSnapshot:
+    """The ``projects`` table held as NumPy columns for ad-hoc slicing.
+
+    Enums, salespeople and brands are dictionary-encoded into small integer
+    codes and request dates are stored as ``int32`` day ordinals, so a slice
+    is a handful of vectorized comparisons over a few bytes per project
+    instead of a database round trip.
+
+    ``refresh`` is cheap when nothing changed: it compares the database's
+    data version with the one the snapshot was built from. Otherwise it
+    re-reads only the rows created or updated since the last refresh, then
+    checks the row count and the sums of ids and row versions against the
+    table. Deletes lower the count; anything else that does not add up
+    (say, a long import that committed well after its timestamps) makes it
+    reload everything.
+    """
+
+    # Encoded columns and their NumPy types; ids are kept sorted as int64.
+    COLUMNS = {
+        "region": "int8",
+        "category": "int8",
+        "status": "int8",
+        "salesperson_name": "int32",
+        "brand_name": "int32",
+        "request_date": "int32",
+        "version": "int32",
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        self.version: Optional[int] = None
+        self.watermark = None
+        self.ids = None
+        self.columns: Dict[str, "np.ndarray"] = {}
+        self.dictionaries = {
+            "region": _Dictionary(Region),
+            "category": _Dictionary(Category),
+            "status": _Dictionary(ProjectStatus),
+            "salesperson_name": _Dictionary(),
+            "brand_name": _Dictionary(),
+        }
+
+    def _encode(self, rows: List) -> Tuple["np.ndarray", Dict[str, "np.ndarray"]]:
+        ids = np.fromiter((r.id for r in rows), dtype=np.int64, count=len(rows))
+        columns = {}
+        for name, dtype in self.COLUMNS.items():
+            if name == "request_date":
+                encoded = (r.request_date.toordinal() for r in rows)
+            elif name == "version":
+                encoded = (r.version for r in rows)
+            else:
+                encode = self.dictionaries[name].encode
+                encoded = (encode(getattr(r, name)) for r in rows)
+            columns[name] = np.fromiter(encoded, dtype=dtype, count=len(rows))
+        return ids, columns
+
+    def _upsert(self, ids: "np.ndarray", columns: Dict[str, "np.ndarray"]) -> None:
+        if self.ids is None:
+            order = np.argsort(ids, kind="stable")
+            self.ids = ids[order]
+            self.columns = {name: array[order] for name, array in columns.items()}
+            return
+
+        positions = np.searchsorted(self.ids, ids)
+        if len(self.ids):
+            clipped = np.minimum(positions, len(self.ids) - 1)
+            found = (positions < len(self.ids)) & (self.ids[clipped] == ids)
+        else:
+            found = np.zeros(len(ids), dtype=bool)
+        for name, array in columns.items():
+            self.columns[name][positions[found]] = array[found]
+
+        added = ~found
+        if added.any():
+            ids = np.concatenate([self.ids, ids[added]])
+            order = np.argsort(ids, kind="stable")
+            self.ids = ids[order]
+            for name, array in columns.items():
+                self.columns[name] = np.concatenate([self.columns[name], array[added]])[order]
+
+    def _drop_deleted(self, db: Session) -> None:
+        live_ids = np.fromiter(db.scalars(select(Project.id)), dtype=np.int64)
+        keep = np.isin(self.ids, live_ids)
+        self.ids = self.ids[keep]
+        self.columns = {name: array[keep] for name, array in self.columns.items()}
+
+    def _checksum(self) -> Tuple[int, int, int]:
+        return len(self.ids), int(self.ids.sum()), int(self.columns["version"].sum())
+
+    def _load(self, db: Session) -> None:
+        """Read the rows changed since the watermark, or all of them without one."""
+        changed = func.coalesce(Project.updated_at, Project.created_at)
+        query = select(
+            Project.id, changed.label("changed_at"), *[getattr(Project, n) for n in self.COLUMNS]
+        )
+        if self.watermark is not None:
+            since = self.watermark - SNAPSHOT_REFRESH_OVERLAP
+            query = query.where(or_(Project.updated_at >= since, Project.created_at >= since))
+
+        rows = db.execute(query.execution_options(yield_per=SNAPSHOT_BATCH_SIZE)).all()
+        if rows or self.ids is None:
+            self._upsert(*self._encode(rows))
+        stamps = [r.changed_at for r in rows if r.changed_at is not None]
+        if self.watermark is not None:
+            stamps.append(self.watermark)
+        self.watermark = max(stamps, default=None)
+
+    def refresh(self, db: Session) -> None:
+        version = etag_service.current_version(db)
+        if version == self.version:
+            return
+
+        self._load(db)
+        live = db.execute(select(
+            func.count(Project.id),
+            func.coalesce(func.sum(Project.id), 0),
+            func.coalesce(func.sum(Project.version), 0),
+        )).one()
+        if live[0] < len(self.ids):
+            self._drop_deleted(db)
+        if tuple(live) != self._checksum():
+            # A write committed too long after its timestamps for the
+            # incremental read to see it; start over rather than drift.
+            logger.info("Project snapshot out of step with the table; reloading")
+            self.clear()
+            self._load(db)
+        self.version = version
+
+    def _mask(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        filters: Dict[SliceDimension, Optional[Sequence]],
+    ) -> "np.ndarray":
+        mask = np.ones(len(self.ids), dtype=bool)
+        days = self.columns["request_date"]
+        if start_date:
+            mask &= days >= start_date.toordinal()
+        if end_date:
+            mask &= days <= end_date.toordinal()
+        for dimension, wanted in filters.items():
+            if wanted:
+                name = SLICE_COLUMNS[dimension].key
+                codes = self.dictionaries[name].lookup(wanted)
+                mask &= np.isin(self.columns[name], codes)
+        return mask
+
+    def slice(
+        self,
+        db: Session,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        filters: Dict[SliceDimension, Optional[Sequence]],
+        group_by: Optional[SliceDimension],
+    ) -> SliceResponse:
+        with self._lock:
+            self.refresh(db)
+            mask = self._mask(start_date, end_date, filters)
+            brands = self.columns["brand_name"][mask].astype(np.int64)
+            response = SliceResponse(
+                projects=int(mask.sum()), clients=int(np.unique(brands).size), groups=[]
+            )
+            if group_by is None:
+                return response
+
+            name = SLICE_COLUMNS[group_by].key
+            keys = self.columns[name][mask].astype(np.int64)
+            labels = self.dictionaries[name].values
+            projects = np.bincount(keys, minlength=len(labels))
+            # Distinct (group, brand) pairs, then how many pairs each group has.
+            brand_count = len(self.dictionaries["brand_name"].values) or 1
+            pairs = np.unique(keys * brand_count + brands)
+            clients = np.bincount(pairs // brand_count, minlength=len(labels))
+
+        response.groups = sorted(
+            (
+                SliceGroup(
+                    key=_region_label(labels[code]),
+                    projects=int(projects[code]),
+                    clients=int(clients[code]),
+                )
+                for code in np.flatnonzero(projects)
+            ),
+            key=lambda g: g.key,
+        )
+        return response
+
+    def stats(self) -> dict:
+        with self._lock:
+            if self.ids is None:
+                return {"snapshot_rows": 0, "snapshot_bytes": 0}
+            arrays = self.ids.nbytes + sum(v.nbytes for v in self.columns.values())
+            strings = sum(d.nbytes() for d in self.dictionaries.values())
+            return {"snapshot_rows": len(self.ids), "snapshot_bytes": arrays + strings}
+
+
+project_snapshot = ProjectSnapshot() if np is not None else None
+
+
+def get_slice(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    region: Optional[Sequence[Region]] = None,
+    category: Optional[Sequence[Category]] = None,
+    status: Optional[Sequence[ProjectStatus]] = None,
+    salesperson: Optional[Sequence[str]] = None,
+    group_by: Optional[SliceDimension] = None,
+) -> SliceResponse:
+    """Projects and distinct clients for any mix of filters, optionally grouped.
+
+    Served from the in-memory ``project_snapshot`` when NumPy is installed and
+    ``DASHBOARD_SNAPSHOT_ENABLED`` is on, otherwise from SQL over ``projects``;
+    both return identical results.
+    """
+    filters = {
+        SliceDimension.region: region,
+        SliceDimension.category: category,
+        SliceDimension.status: status,
+        SliceDimension.salesperson: salesperson,
+    }
+    if project_snapshot is not None and settings.DASHBOARD_SNAPSHOT_ENABLED:
+        return project_snapshot.slice(db, start_date, end_date, filters, group_by)
+    return _slice_sql(db, start_date, end_date, filters, group_by)
+
+
+def snapshot_stats() -> dict:
+    if project_snapshot is None:
+        return {"snapshot_rows": 0, "snapshot_bytes": 0}
+    return project_snapshot.stats()
+
+
+CUBE_COLUMNS = {
+    SliceDimension.region: ProjectMonthlyCube.region,
+    SliceDimension.category: ProjectMonthlyCube.category,
+    SliceDimension.status: ProjectMonthlyCube.status,
+    SliceDimension.salesperson: ProjectMonthlyCube.salesperson_name,
+}
+
+
+def _cube_months(
+    start_date: Optional[date], end_date: Optional[date]
+) -> Tuple[Optional[date], Optional[date], bool, List[Tuple[date, date]]]:
+    """Split a date range into whole months and the partial months at its edges.
+
+    Returns ``(first, stop, use_cube, edges)``: the cube covers months from
+    ``first`` (inclusive) to ``stop`` (exclusive), either bound open when the
+    range is, and ``edges`` are the day ranges that must be read from
+    ``projects``.
+    """
+    first = stop = None
+    if start_date:
+        first = start_date.replace(day=1)
+        if start_date.day != 1:
+            first = _next_bucket(first, SeriesBucket.month)
+    if end_date:
+        stop = end_date.replace(day=1)
+        if (end_date + timedelta(days=1)).day == 1:
+            stop = _next_bucket(stop, SeriesBucket.month)
+
+    if first and stop and first >= stop:
+        return first, stop, False, [(start_date, end_date)]
+    edges = []
+    if start_date and start_date < first:
+        edges.append((start_date, first - timedelta(days=1)))
+    if end_date and stop <= end_date:
+        edges.append((stop, end_date))
+    return first, stop, True, edges
+
+
+def _cube_label(value) -> str:
+    return value.isoformat() if isinstance(value, date) else _region_label(value)
+
+
+def _cube_counts(
+    db: Session,
+    cube,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    keys: List[Tuple],
+    conditions: List[Tuple],
+    limit: Optional[int] = None,
+) -> Counter:
+    """Project counts per key from a monthly cube, exact at day precision.
+
+    ``keys`` and ``conditions`` are ``(cube, projects)`` pairs of group
+    columns and filter clauses. Whole months are summed from the cube; a
+    range that starts or ends mid-month reads just those edge days from
+    ``projects``, through the ``(request_date, ...)`` index, and folds them
+    into the same keys. With ``limit`` and no edges, the largest counts are
+    picked by the database.
+    """
+    first, stop, use_cube, edges = _cube_months(start_date, end_date)
+    counts: Counter = Counter()
+
+    if use_cube:
+        group = [c for c, _ in keys]
+        total = func.sum(cube.project_count)
+        query = select(*group, total).where(*[c for c, _ in conditions]).group_by(*group)
+        if first:
+            query = query.where(cube.month >= first)
+        if stop:
+            query = query.where(cube.month < stop)
+        if limit is not None and not edges:
+            query = query.order_by(total.desc(), *group).limit(limit)
+        for row in db.execute(query):
+            if row[-1]:
+                counts[tuple(row[:-1])] += row[-1]
+
+    if edges:
+        group = [c for _, c in keys]
+        query = (
+            select(*group, func.count(Project.id))
+            .where(or_(*[Project.request_date.between(lo, hi) for lo, hi in edges]))
+            .where(*[c for _, c in conditions])
+            .group_by(*group)
+        )
+        months = [c.key == "month" for c, _ in keys]
+        for row in db.execute(query):
+            key = tuple(
+                value.replace(day=1) if month else value
+                for month, value in zip(months, row[:-1])
+            )
+            counts[key] += row[-1]
+    return counts
+
+
+def _cube_conditions(columns: Dict, filters: Dict[SliceDimension, Optional[Sequence]]) -> List:
     return [
-        RegionCount(region=r.value if hasattr(r, "value") else str(r), count=c)
-        for r, c in region_counts
+        (columns[d].in_(list(wanted)), SLICE_COLUMNS[d].in_(list(wanted)))
+        for d, wanted in filters.items()
+        if wanted
     ]
 
 
-def get_briefs_approved(
+@cached("cube")
+def query_cube(
     db: Session,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> int:
-    query = db.query(func.count(Project.id)).filter(
-        Project.status == ProjectStatus.client_approved
+    region: Optional[Sequence[Region]] = None,
+    category: Optional[Sequence[Category]] = None,
+    status: Optional[Sequence[ProjectStatus]] = None,
+    salesperson: Optional[Sequence[str]] = None,
+    group_by: Sequence[CubeDimension] = (),
+) -> CubeResponse:
+    """Project counts for any filters, grouped by any dimensions.
+
+    Answered from ``project_monthly_cube``; see ``_cube_counts`` for how
+    partial months at the range edges are handled.
+    """
+    filters = {
+        SliceDimension.region: region,
+        SliceDimension.category: category,
+        SliceDimension.status: status,
+        SliceDimension.salesperson: salesperson,
+    }
+    group_by = list(dict.fromkeys(group_by))
+    keys = [
+        (ProjectMonthlyCube.month, Project.request_date)
+        if d == CubeDimension.month
+        else (CUBE_COLUMNS[SliceDimension(d.value)], SLICE_COLUMNS[SliceDimension(d.value)])
+        for d in group_by
+    ]
+    counts = _cube_counts(
+        db, ProjectMonthlyCube, start_date, end_date, keys, _cube_conditions(CUBE_COLUMNS, filters)
     )
-    query = _apply_date_filter(query, start_date, end_date)
-    return query.scalar() or 0
+
+    rows = [
+        CubeRow(**{d.value: value for d, value in zip(group_by, key)}, projects=count)
+        for key, count in sorted(counts.items(), key=lambda item: [_cube_label(v) for v in item[0]])
+        if count
+    ]
+    return CubeResponse(total=sum(counts.values()), rows=rows)
 
 
-def get_videos_generated(
+# Leaderboard: (cube, cube name column, projects name column, counted status)
+LEADERBOARDS = {
+    Leaderboard.salespeople: (
+        ProjectMonthlyCube,
+        ProjectMonthlyCube.salesperson_name,
+        Project.salesperson_name,
+        ProjectStatus.campaign_signed_up,
+    ),
+    Leaderboard.brands: (
+        ProjectMonthlyBrand,
+        ProjectMonthlyBrand.brand_name,
+        Project.brand_name,
+        ProjectStatus.video_approved,
+    ),
+}
+
+
+@cached("leaderboard")
+def get_leaderboard(
     db: Session,
+    board: Leaderboard,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> int:
-    query = db.query(func.count(Project.id)).filter(
-        Project.status.in_([
-            ProjectStatus.video_submitted_for_review,
-            ProjectStatus.video_approved,
-        ])
+    region: Optional[Sequence[Region]] = None,
+    limit: int = 10,
+) -> List[LeaderboardEntry]:
+    """Top salespeople by campaigns signed up, or top brands by videos approved.
+
+    Both are read from monthly rollups rather than grouping ``projects``:
+    only names with at least one counted project in the range are ranked.
+    Ties are broken by name.
+    """
+    cube, cube_name, raw_name, counted = LEADERBOARDS[board]
+    conditions = [(cube.status == counted, Project.status == counted)]
+    if region:
+        conditions.append((cube.region.in_(list(region)), Project.region.in_(list(region))))
+    counts = _cube_counts(
+        db, cube, start_date, end_date, [(cube_name, raw_name)], conditions, limit
     )
-    query = _apply_date_filter(query, start_date, end_date)
-    return query.scalar() or 0
+    top = heapq.nsmallest(limit, counts.items(), key=lambda item: (-item[1], item[0]))
+    return [LeaderboardEntry(name=name, count=count) for (name,), count in top]
 
 
-def get_videos_approved(
+def get_clients_by_region(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    approximate: bool = False,
+) -> List[RegionCount]:
+    return get_metrics(db, start_date, end_date, approximate).clients_by_region
+
+
+def get_campaigns_by_region(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[RegionCount]:
+    return get_metrics(db, start_date, end_date).campaigns_by_region
+
+
+def get_briefs_approved(
     db: Session,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
 ) -> int:
-    query = db.query(func.count(Project.id)).filter(
-        Project.status == ProjectStatus.video_approved
-    )
-    query = _apply_date_filter(query, start_date, end_date)
-    return query.scalar() or 0
+    return get_metrics(db, start_date, end_date).briefs_approved
 
 
-def get_campaigns_completed(
+def get_videos_generated(
     db: Session,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
 ) -> int:
-    query = db.query(func.count(Project.id)).filter(
-        Project.status == ProjectStatus.campaign_signed_up
-    )
-    query = _apply_date_filter(query, start_date, end_date)
-    return query.scalar() or 0
+    return get_metrics(db, start_date, end_date).videos_generated
 
 
-def get_metrics(
+def get_videos_approved(
     db: Session,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-) -> MetricsResponse:
-    query = db.query(func.count(Project.id))
-    query = _apply_date_filter(query, start_date, end_date)
-    total_projects = query.scalar() or 0
-
-    return MetricsResponse(
-        total_projects=total_projects,
-        clients_by_region=get_clients_by_region(db, start_date, end_date),
-        briefs_approved=get_briefs_approved(db, start_date, end_date),
-        videos_generated=get_videos_generated(db, start_date, end_date),
-        videos_approved=get_videos_approved(db, start_date, end_date),
-        campaigns_completed=get_campaigns_completed(db, start_date, end_date),
-        campaigns_by_region=get_campaigns_by_region(db, start_date, end_date),
-    )
+) -> int:
+    return get_metrics(db, start_date, end_date).videos_approved
+
+
+def get_campaigns_completed(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> int:
+    return get_metrics(db, start_date, end_date).campaigns_completed
@@ -0,0 +1,68 @@
+import hashlib
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.data_version import DataVersion
+from app.services.rollups import dialect_insert
+
+PROJECTS = "projects"
+
+
+def bump(db: Session, name: str = PROJECTS) -> int:
+    """Advance a resource's data version inside the caller's write transaction.
+
+    Returns the new version. Concurrent writers queue on the version row,
+    so versions are handed out in commit order.
+    """
+    stmt = dialect_insert(db)(DataVersion).values(name=name, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"version": DataVersion.version + 1},
+    ).returning(DataVersion.version)
+    return db.execute(stmt).scalar_one()
+
+
+def current_version(db: Session, name: str = PROJECTS) -> int:
+    version = db.execute(
+        select(DataVersion.version).where(DataVersion.name == name)
+    ).scalar()
+    return version or 0
+
+
+def make_etag(path: str, query: str, version: int) -> str:
+    """Strong ETag over the request path, its filters and the data version."""
+    params = "&".join(sorted(query.split("&"))) if query else ""
+    digest = hashlib.sha1(f"{path}?{params}#{version}".encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+def version_etag(version: int) -> str:
+    """ETag of a single project: its row version, which ``If-Match`` sends back."""
+    return f'"{version}"'
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[List[int]]:
+    """Project versions an ``If-Match`` header accepts; ``None`` if any will do.
+
+    Weak tags count as their version too, since compressing proxies weaken
+    the ETags they pass on. Tags that are not project versions match nothing.
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+    versions = []
+    for tag in if_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.append(int(tag[1:-1]))
+    return versions
@@ -0,0 +1,180 @@
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import settings
+from app.database import begin_snapshot
+from app.exceptions import ConflictError, NotFoundError, TooManyRequestsError
+from app.models.user import User
+from app.schemas.project import ExportJobCreate, ExportJobStatus
+from app.services import exports as export_service
+from app.services import projects as project_service
+
+logger = logging.getLogger(__name__)
+
+FINISHED = (ExportJobStatus.done, ExportJobStatus.failed, ExportJobStatus.expired)
+
+
+class ExportJob:
+    def __init__(self, request: ExportJobCreate, user_id: int):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.user_id = user_id
+        self.status = ExportJobStatus.queued
+        self.media_type, self.filename = export_service.file_type(
+            request.format, request.compression
+        )
+        self.rows_written = 0
+        self.total_rows: Optional[int] = None
+        self.bytes_written = 0
+        self.created_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        return os.path.join(settings.EXPORT_DIR, f"{self.id}-{self.filename}")
+
+
+class ExportJobManager:
+    """Runs exports to files in a bounded thread pool and tracks their progress.
+
+    Jobs live in this process only: their files outlive a restart, but
+    their status does not, and ``collect_garbage`` removes the orphans.
+    At most ``EXPORT_WORKERS`` exports run at once and ``EXPORT_MAX_QUEUED``
+    more may wait; further submissions are refused rather than queued
+    without bound.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, ExportJob] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, db: Session, request: ExportJobCreate, user: User) -> ExportJob:
+        export_service.check_available(request.format, request.compression)
+        project_service.export_columns(request.fields)
+        self.collect_garbage()
+        job = ExportJob(request, user.id)
+        with self._lock:
+            pending = sum(1 for j in self._jobs.values() if j.status not in FINISHED)
+            if pending >= settings.EXPORT_WORKERS + settings.EXPORT_MAX_QUEUED:
+                raise TooManyRequestsError("Too many exports in progress; try again later")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    settings.EXPORT_WORKERS, thread_name_prefix="export"
+                )
+            self._jobs[job.id] = job
+            self._executor.submit(self._run, job, db.get_bind())
+        return job
+
+    def get(self, job_id: str, user: User) -> ExportJob:
+        job = self._jobs.get(job_id)
+        if job is None or job.user_id != user.id:
+            raise NotFoundError("Export")
+        return job
+
+    def get_file(self, job_id: str, user: User) -> ExportJob:
+        job = self.get(job_id, user)
+        if job.status != ExportJobStatus.done:
+            raise ConflictError(f"Export is {job.status.value}, not ready for download")
+        return job
+
+    def _run(self, job: ExportJob, bind) -> None:
+        job.status = ExportJobStatus.running
+        filters = job.request.model_dump(exclude={"format", "compression", "fields"})
+        partial = job.path + ".part"
+        db = sessionmaker(bind=bind, autoflush=False)()
+        try:
+            # The count and every batch see the same rows however long the export runs.
+            begin_snapshot(db)
+            # Counted in the export's snapshot, bypassing the list endpoint's cache.
+            job.total_rows = project_service.count_projects.__wrapped__(db, **filters)
+
+            def on_rows(count: int) -> None:
+                job.rows_written += count
+
+            export = export_service.export_projects(
+                db,
+                job.request.format,
+                job.request.compression,
+                **filters,
+                fields=job.request.fields,
+                on_rows=on_rows,
+            )
+            os.makedirs(settings.EXPORT_DIR, exist_ok=True)
+            with open(partial, "wb") as f:
+                for chunk in export.chunks:
+                    f.write(chunk)
+                    job.bytes_written += len(chunk)
+            os.replace(partial, job.path)
+            job.status = ExportJobStatus.done
+        except Exception as exc:
+            logger.exception("Export %s failed", job.id)
+            job.status = ExportJobStatus.failed
+            job.error = str(exc)
+            if os.path.exists(partial):
+                os.remove(partial)
+        finally:
+            db.close()
+            job.finished_at = datetime.now(timezone.utc)
+        self.collect_garbage(keep=job.id)
+
+    def collect_garbage(self, keep: Optional[str] = None) -> None:
+        """Delete export files past ``EXPORT_MAX_AGE_SECONDS``, then the
+        oldest ones until all of them fit in ``EXPORT_DISK_BUDGET_BYTES``.
+
+        Files of jobs still queued or running are never touched, nor is the
+        file of job ``keep`` (the one that just finished, even if it alone
+        is over budget). Jobs whose file is gone are reported as expired,
+        and forgotten once they are past the age limit themselves.
+        """
+        now = datetime.now(timezone.utc)
+        max_age = timedelta(seconds=settings.EXPORT_MAX_AGE_SECONDS)
+        with self._lock:
+            protected = {j.id for j in self._jobs.values() if j.status not in FINISHED}
+            protected.add(keep)
+            try:
+                names = os.listdir(settings.EXPORT_DIR)
+            except FileNotFoundError:
+                names = []
+            files = []
+            for name in names:
+                path = os.path.join(settings.EXPORT_DIR, name)
+                stat = os.stat(path)
+                files.append((stat.st_mtime, stat.st_size, path, name.split("-", 1)[0]))
+            files.sort()
+
+            total = sum(size for _, size, _, _ in files)
+            for mtime, size, path, job_id in files:
+                if job_id in protected:
+                    continue
+                modified = datetime.fromtimestamp(mtime, timezone.utc)
+                if now - modified <= max_age and total <= settings.EXPORT_DISK_BUDGET_BYTES:
+                    break
+                os.remove(path)
+                total -= size
+
+            for job_id, job in list(self._jobs.items()):
+                if job.status == ExportJobStatus.done and not os.path.exists(job.path):
+                    job.status = ExportJobStatus.expired
+                if job.status in FINISHED and now - job.finished_at > max_age:
+                    del self._jobs[job_id]
+
+    def clear(self) -> None:
+        """Wait for running exports, drop queued ones and forget every job."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            self._jobs.clear()
+
+
+export_jobs = ExportJobManager()
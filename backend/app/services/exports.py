@@ -0,0 +1,277 @@
+import csv
+import enum
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Date, DateTime, Enum, Integer, Row
+from sqlalchemy.orm import Session
+
+from app.exceptions import BadRequestError
+from app.models.project import Category, ProjectStatus, Region
+from app.schemas.project import ExportCompression, ExportFormat, ProjectField
+from app.services import projects as project_service
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # PyArrow is optional; only the columnar formats need it.
+    pa = pq = None
+
+try:
+    import zstandard
+except ImportError:  # Only zstd compression needs it.
+    zstandard = None
+
+# Rows per chunk for the row formats.
+ROW_BATCH_SIZE = 1000
+# Rows per Arrow record batch; Parquet row groups collect several of them.
+RECORD_BATCH_SIZE = 10_000
+PARQUET_ROW_GROUP_SIZE = 100_000
+
+
+class Export(NamedTuple):
+    chunks: Iterator[bytes]
+    media_type: str
+    filename: str
+
+
+class _Sink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain.
+
+    ``tell`` keeps counting across drains, which the Parquet writer relies
+    on for the offsets in its footer.
+    """
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _text_value(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _csv_chunks(batches: Iterator[List[Row]], columns: list) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> bytes:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk.encode()
+
+    writer.writerow([header for header, _ in columns])
+    yield drain()
+    for rows in batches:
+        writer.writerows(
+            ["" if value is None else _text_value(value) for value in row] for row in rows
+        )
+        yield drain()
+
+
+def _ndjson_chunks(batches: Iterator[List[Row]], columns: list) -> Iterator[bytes]:
+    names = [column.key for _, column in columns]
+    for rows in batches:
+        yield "".join(
+            json.dumps(dict(zip(names, map(_text_value, row))), separators=(",", ":")) + "\n"
+            for row in rows
+        ).encode()
+
+
+# Code of each enum member. Every record batch uses the same full dictionary,
+# so batches can be concatenated and streamed without dictionary deltas.
+_ENUM_CODES = {
+    enum_class: {member: code for code, member in enumerate(enum_class)}
+    for enum_class in (Region, Category, ProjectStatus)
+}
+
+
+def _arrow_schema(columns: list) -> "pa.Schema":
+    fields = []
+    for _, column in columns:
+        if isinstance(column.type, Enum):
+            arrow_type = pa.dictionary(pa.int8(), pa.string())
+        elif isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, DateTime):
+            arrow_type = pa.timestamp("us", tz="UTC")
+        elif isinstance(column.type, Date):
+            arrow_type = pa.date32()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.key, arrow_type, nullable=column.nullable))
+    return pa.schema(fields)
+
+
+def _record_batch(schema: "pa.Schema", columns: list, rows: List[Row]) -> "pa.RecordBatch":
+    arrays = []
+    for (_, column), field, values in zip(columns, schema, zip(*rows)):
+        if isinstance(column.type, Enum):
+            codes = _ENUM_CODES[column.type.enum_class]
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array([codes[value] for value in values], pa.int8()),
+                pa.array([member.value for member in codes], pa.string()),
+            ))
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _arrow_chunks(batches: Iterator[List[Row]], columns: list) -> Iterator[bytes]:
+    """The Arrow IPC streaming format, one message per record batch."""
+    schema = _arrow_schema(columns)
+    sink = _Sink()
+    with pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema) as writer:
+        yield sink.drain()
+        for rows in batches:
+            writer.write_batch(_record_batch(schema, columns, rows))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def _parquet_chunks(
+    batches: Iterator[List[Row]], columns: list, compression: Optional[ExportCompression]
+) -> Iterator[bytes]:
+    schema = _arrow_schema(columns)
+    sink = _Sink()
+    pending: List["pa.RecordBatch"] = []
+    with pq.ParquetWriter(
+        pa.PythonFile(sink, mode="w"),
+        schema,
+        compression=compression.value if compression else "snappy",
+    ) as writer:
+        for rows in batches:
+            pending.append(_record_batch(schema, columns, rows))
+            if sum(batch.num_rows for batch in pending) >= PARQUET_ROW_GROUP_SIZE:
+                writer.write_table(pa.Table.from_batches(pending, schema))
+                pending.clear()
+                yield sink.drain()
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending, schema))
+    yield sink.drain()
+
+
+def _compressed(chunks: Iterator[bytes], compressor) -> Iterator[bytes]:
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+_FORMATS = {
+    ExportFormat.csv: ("text/csv", "csv"),
+    ExportFormat.ndjson: ("application/x-ndjson", "ndjson"),
+    ExportFormat.parquet: ("application/vnd.apache.parquet", "parquet"),
+    ExportFormat.arrow: ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+_COMPRESSIONS = {
+    ExportCompression.gzip: ("application/gzip", "gz"),
+    ExportCompression.zstd: ("application/zstd", "zst"),
+}
+
+
+def _wraps(format: ExportFormat, compression: Optional[ExportCompression]) -> bool:
+    return compression is not None and format != ExportFormat.parquet
+
+
+def check_available(format: ExportFormat, compression: Optional[ExportCompression]) -> None:
+    """Reject formats whose optional package is not installed."""
+    if format in (ExportFormat.parquet, ExportFormat.arrow) and pa is None:
+        raise BadRequestError(f"{format.value} export needs pyarrow installed on the server")
+    if compression == ExportCompression.zstd and _wraps(format, compression) and zstandard is None:
+        raise BadRequestError("zstd compression needs zstandard installed on the server")
+
+
+def file_type(format: ExportFormat, compression: Optional[ExportCompression]) -> Tuple[str, str]:
+    """Media type and download filename of an export."""
+    media_type, extension = _FORMATS[format]
+    if _wraps(format, compression):
+        media_type, suffix = _COMPRESSIONS[compression]
+        extension = f"{extension}.{suffix}"
+    return media_type, f"projects.{extension}"
+
+
+def _counted(batches: Iterator[List[Row]], on_rows: Callable[[int], None]):
+    for rows in batches:
+        yield rows
+        on_rows(len(rows))
+
+
+def export_projects(
+    db: Session,
+    format: ExportFormat = ExportFormat.csv,
+    compression: Optional[ExportCompression] = None,
+    region: Optional[Region] = None,
+    status: Optional[ProjectStatus] = None,
+    category: Optional[Category] = None,
+    salesperson: Optional[str] = None,
+    brand: Optional[str] = None,
+    q: Optional[str] = None,
+    fields: Optional[List[ProjectField]] = None,
+    on_rows: Optional[Callable[[int], None]] = None,
+) -> Export:
+    """Stream the filtered projects in ``format``, optionally compressed.
+
+    Rows are read from the database in batches and encoded as they arrive,
+    so memory stays flat however many projects match. The columnar formats
+    turn each batch into an Arrow record batch with the enums
+    dictionary-encoded. Parquet compresses its own column chunks, so for
+    Parquet ``compression`` picks the column codec instead of wrapping the
+    file. ``fields`` narrows the export to those columns. Unavailable formats
+    and fields are rejected before anything is streamed. ``on_rows`` is
+    called with the size of each batch once it is encoded.
+    """
+    check_available(format, compression)
+    columns = project_service.export_columns(fields)
+    columnar = format in (ExportFormat.parquet, ExportFormat.arrow)
+    batches = project_service.iter_export_batches(
+        db,
+        RECORD_BATCH_SIZE if columnar else ROW_BATCH_SIZE,
+        region, status, category, salesperson, brand, q,
+        columns=columns,
+    )
+    if on_rows is not None:
+        batches = _counted(batches, on_rows)
+
+    if format == ExportFormat.csv:
+        chunks = _csv_chunks(batches, columns)
+    elif format == ExportFormat.ndjson:
+        chunks = _ndjson_chunks(batches, columns)
+    elif format == ExportFormat.arrow:
+        chunks = _arrow_chunks(batches, columns)
+    else:
+        chunks = _parquet_chunks(batches, columns, compression)
+
+    if _wraps(format, compression):
+        if compression == ExportCompression.gzip:
+            compressor = zlib.compressobj(wbits=31)
+        else:
+            compressor = zstandard.ZstdCompressor().compressobj()
+        chunks = _compressed(chunks, compressor)
+    return Export(chunks, *file_type(format, compression))
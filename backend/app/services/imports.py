@@ -0,0 +1,150 @@
+import csv
+import io
+import zipfile
+from itertools import islice
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.orm import Session
+
+from app.exceptions import BadRequestError, ForbiddenError
+from app.models.user import User, UserRole
+from app.schemas.project import ProjectCreate
+from app.services import projects as project_service
+
+try:
+    import openpyxl
+except ImportError:  # openpyxl is optional; only XLSX imports need it.
+    openpyxl = None
+
+# Rows validated together and loaded in one transaction.
+BATCH_SIZE = 5000
+
+# Headers accepted besides the ``ProjectCreate`` field names, so that a CSV
+# export can be imported back as it is.
+HEADER_ALIASES = {"salesperson": "salesperson_name", "brand": "brand_name"}
+FIELDS = set(ProjectCreate.model_fields)
+REQUIRED = [name for name, field in ProjectCreate.model_fields.items() if field.is_required()]
+
+_batch_adapter = TypeAdapter(List[ProjectCreate])
+
+Row = Tuple[int, dict]
+
+
+def _fields(header) -> List[str]:
+    fields = []
+    for cell in header:
+        name = str(cell or "").strip().lower().replace(" ", "_")
+        fields.append(HEADER_ALIASES.get(name, name))
+    missing = [field for field in REQUIRED if field not in fields]
+    if missing:
+        raise BadRequestError(f"Missing columns: {', '.join(missing)}")
+    return fields
+
+
+def _csv_rows(file: BinaryIO) -> Iterator[Row]:
+    reader = csv.reader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    fields = _fields(next(reader, []))
+    for values in reader:
+        yield reader.line_num, dict(zip(fields, values))
+
+
+def _xlsx_rows(file: BinaryIO) -> Iterator[Row]:
+    try:
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    except zipfile.BadZipFile:
+        raise BadRequestError("File is not a valid XLSX workbook")
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        fields = _fields(next(rows, ()))
+        for number, values in enumerate(rows, start=2):
+            yield number, dict(zip(fields, values))
+    finally:
+        workbook.close()
+
+
+def _clean(rows: Iterator[Row]) -> Iterator[Row]:
+    """Keep the known fields, treat empty cells as missing and skip blank rows."""
+    for number, values in rows:
+        values = {
+            field: value.strip() if isinstance(value, str) else value
+            for field, value in values.items()
+            if field in FIELDS
+        }
+        values = {field: value for field, value in values.items() if value not in ("", None)}
+        if values:
+            yield number, values
+
+
+def _validate(batch: List[Row], errors: List[dict]) -> List[dict]:
+    """Validate a batch in one pass; on errors, report them and keep the valid rows."""
+    try:
+        return [p.model_dump() for p in _batch_adapter.validate_python([v for _, v in batch])]
+    except ValidationError as exc:
+        invalid = set()
+        for error in exc.errors():
+            index, *loc = error["loc"]
+            invalid.add(index)
+            errors.append({
+                "row": batch[index][0],
+                "field": ".".join(str(part) for part in loc) or None,
+                "message": error["msg"],
+            })
+    valid = [values for index, (_, values) in enumerate(batch) if index not in invalid]
+    return [p.model_dump() for p in _batch_adapter.validate_python(valid)]
+
+
+def iter_rows(file: BinaryIO, filename: str) -> Iterator[Row]:
+    """(row number, values) for each non-blank data row of a CSV or XLSX file."""
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        return _clean(_csv_rows(file))
+    if extension == "xlsx":
+        if openpyxl is None:
+            raise BadRequestError("XLSX import needs openpyxl installed on the server")
+        return _clean(_xlsx_rows(file))
+    raise BadRequestError("Only .csv and .xlsx files can be imported")
+
+
+def import_projects(
+    db: Session,
+    file: BinaryIO,
+    filename: str,
+    user: User,
+    batch_size: Optional[int] = None,
+) -> dict:
+    """Create projects from a CSV or XLSX file, streaming it in batches.
+
+    The header row names the columns, by ``ProjectCreate`` field or by the
+    CSV export's headers; other columns are ignored. Each batch is
+    validated as a whole and its valid rows are loaded and committed
+    together (``COPY`` on PostgreSQL), so memory is bounded by one batch
+    and a bad row never blocks the rest. Rows that fail are listed in
+    ``errors`` with their row number in the file.
+    """
+    if user.role != UserRole.marcom:
+        raise ForbiddenError("Only Marcom users can import projects")
+    rows = iter_rows(file, filename)
+    batch_size = batch_size or BATCH_SIZE
+
+    total = imported = 0
+    errors: List[dict] = []
+    try:
+        for batch in iter(lambda: list(islice(rows, batch_size)), []):
+            total += len(batch)
+            valid = _validate(batch, errors)
+            if valid:
+                loaded = project_service.load_projects(
+                    db, [{"user_id": user.id, **values} for values in valid]
+                )
+                imported += len(loaded)
+    except UnicodeDecodeError:
+        raise BadRequestError(
+            f"File is not UTF-8 text; {imported} rows before the bad bytes were imported"
+        )
+    return {
+        "rows": total,
+        "imported": imported,
+        "failed": len({error["row"] for error in errors}),
+        "errors": errors,
+    }
@@ -0,0 +1,313 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import Counter
+from datetime import date
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import begin_snapshot
+from app.models.project import ProjectStatus
+from app.models.stats import ProjectDailyBrand
+from app.services import dashboard as dashboard_service
+from app.services import etags as etag_service
+from app.services.rollups import ProjectChange
+
+logger = logging.getLogger(__name__)
+
+RangeKey = Tuple[Optional[date], Optional[date]]
+
+# Queued in place of a dropped backlog to wake the consumer for a resync.
+_RESYNC = {"seq": -1, "resync": True}
+
+# Counter fields of ``MetricsResponse`` and the statuses each one counts.
+STATUS_COUNTERS = {
+    "briefs_approved": {ProjectStatus.client_approved},
+    "videos_generated": set(dashboard_service.VIDEO_GENERATED_STATUSES),
+    "videos_approved": {ProjectStatus.video_approved},
+    "campaigns_completed": {ProjectStatus.campaign_signed_up},
+}
+
+
+class Subscription:
+    """One open stream: a bounded queue of deltas owned by an event loop."""
+
+    def __init__(self, key: RangeKey, loop: asyncio.AbstractEventLoop):
+        self.key = key
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=settings.LIVE_STREAM_QUEUE_SIZE)
+        self.needs_snapshot = False
+
+    def offer(self, message: dict) -> None:
+        """Queue a delta; a slow consumer gets a fresh snapshot instead of a backlog."""
+        if self.needs_snapshot:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.needs_snapshot = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_RESYNC)
+
+
+class _RangeState:
+    """Running metrics for one date range, shared by all of its subscribers.
+
+    ``version`` is the data version the state was loaded at. Writes up to
+    it are already counted, so their deltas must not be applied again.
+    """
+
+    def __init__(self, metrics: dict, brands: Counter, version: int):
+        self.metrics = metrics
+        self.brands = brands
+        self.version = version
+        self.seq = 0
+        self.subscribers: Set[Subscription] = set()
+
+    def snapshot(self) -> dict:
+        metrics = dict(self.metrics)
+        for field in ("clients_by_region", "campaigns_by_region"):
+            metrics[field] = [
+                {"region": region, "count": count}
+                for region, count in sorted(metrics[field].items())
+                if count
+            ]
+        return {"seq": self.seq, **metrics}
+
+    def apply(self, changes: List[ProjectChange], key: RangeKey) -> Optional[dict]:
+        """Fold the changed rows into the running metrics and return the delta."""
+        start_date, end_date = key
+        delta: Counter = Counter()
+        clients: Counter = Counter()
+        campaigns: Counter = Counter()
+
+        for values, sign in _signed_rows(changes):
+            day = values["request_date"]
+            if (start_date and day < start_date) or (end_date and day > end_date):
+                continue
+            region = values["region"].value
+            status = values["status"]
+            delta["total_projects"] += sign
+            for field, statuses in STATUS_COUNTERS.items():
+                if status in statuses:
+                    delta[field] += sign
+            if status == ProjectStatus.campaign_signed_up:
+                campaigns[region] += sign
+
+            brand = (region, values["brand_name"])
+            before = self.brands[brand]
+            self.brands[brand] += sign
+            if before == 0 and self.brands[brand] > 0:
+                clients[region] += 1
+            elif before > 0 and self.brands[brand] == 0:
+                clients[region] -= 1
+                del self.brands[brand]
+
+        message = {k: v for k, v in delta.items() if v}
+        for field, counts in (("clients_by_region", clients), ("campaigns_by_region", campaigns)):
+            counts = {region: count for region, count in counts.items() if count}
+            if counts:
+                message[field] = counts
+        if not message:
+            return None
+
+        for field, value in message.items():
+            if isinstance(value, dict):
+                totals = self.metrics[field]
+                for region, count in value.items():
+                    totals[region] = totals.get(region, 0) + count
+            else:
+                self.metrics[field] += value
+        self.seq += 1
+        return {"seq": self.seq, **message}
+
+
+def _signed_rows(changes: List[ProjectChange]):
+    for before, after in changes:
+        if before is not None:
+            yield before, -1
+        if after is not None:
+            yield after, 1
+
+
+class MetricsHub:
+    """Fans out metric deltas from committed project writes to open streams.
+
+    Subscribers watching the same date range share one running state, so a
+    write costs one delta computation per distinct range plus one queue put
+    per stream. Deltas are derived from the changed rows themselves; the
+    per-range brand reference counts make distinct-client changes exact
+    without re-querying. Each write is published with the data version it
+    committed as, so a range loaded between a write's commit and its
+    ``publish`` does not count that write twice.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ranges: Dict[RangeKey, _RangeState] = {}
+        # Writes published while a range loads, one backlog per load.
+        self._backlogs: List[List[Tuple[List[ProjectChange], int]]] = []
+
+    def subscribe(
+        self,
+        db: Session,
+        loop: asyncio.AbstractEventLoop,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[Subscription, dict]:
+        """Join a range's state, loading it first if nobody watches the range.
+
+        The load runs without the lock, so writers publishing meanwhile do
+        not wait on it; their writes are kept in a backlog and replayed into
+        the new state, skipping those its snapshot already counts.
+        """
+        key = (start_date, end_date)
+        subscription = Subscription(key, loop)
+        with self._lock:
+            state = self._ranges.get(key)
+            if state is not None:
+                state.subscribers.add(subscription)
+                return subscription, state.snapshot()
+            backlog: List[Tuple[List[ProjectChange], int]] = []
+            self._backlogs.append(backlog)
+
+        try:
+            loaded = _load_state(db, start_date, end_date)
+        except BaseException:
+            with self._lock:
+                self._drop_backlog(backlog)
+            raise
+        with self._lock:
+            self._drop_backlog(backlog)
+            state = self._ranges.get(key)
+            if state is None:
+                state = self._ranges[key] = loaded
+                for changes, version in backlog:
+                    if version > state.version:
+                        state.apply(changes, key)
+            # Otherwise another subscriber installed the range meanwhile; its
+            # state is current and its streams already follow its seq numbers.
+            state.subscribers.add(subscription)
+            return subscription, state.snapshot()
+
+    def _drop_backlog(self, backlog: list) -> None:
+        self._backlogs = [b for b in self._backlogs if b is not backlog]
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            state = self._ranges.get(subscription.key)
+            if state is None:
+                return
+            state.subscribers.discard(subscription)
+            if not state.subscribers:
+                del self._ranges[subscription.key]
+
+    def snapshot(self, subscription: Subscription) -> dict:
+        with self._lock:
+            subscription.needs_snapshot = False
+            return self._ranges[subscription.key].snapshot()
+
+    def publish(self, changes: List[ProjectChange], version: int) -> None:
+        """Called after a write commits as data ``version``; safe from any thread."""
+        with self._lock:
+            for backlog in self._backlogs:
+                backlog.append((changes, version))
+            for key, state in self._ranges.items():
+                if version <= state.version:
+                    continue
+                message = state.apply(changes, key)
+                if message is None:
+                    continue
+                for subscription in state.subscribers:
+                    try:
+                        subscription.loop.call_soon_threadsafe(subscription.offer, message)
+                    except RuntimeError:
+                        # The stream's event loop has shut down.
+                        logger.debug("Dropping delta for closed stream")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "ranges": len(self._ranges),
+                "streams": sum(len(s.subscribers) for s in self._ranges.values()),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ranges.clear()
+
+
+def _load_state(db: Session, start_date: Optional[date], end_date: Optional[date]) -> _RangeState:
+    """Read a range's metrics and brand counts, and the data version they reflect.
+
+    All three come from one snapshot in a session of their own, and the
+    metrics bypass the dashboard cache, which may still hold a result from
+    before a write that has committed but not yet been published.
+    """
+    with Session(bind=db.get_bind()) as snapshot_db:
+        begin_snapshot(snapshot_db)
+        version = etag_service.current_version(snapshot_db)
+        metrics, brands = _read_state(snapshot_db, start_date, end_date)
+    return _RangeState(metrics, brands, version)
+
+
+def _read_state(
+    db: Session, start_date: Optional[date], end_date: Optional[date]
+) -> Tuple[dict, Counter]:
+    metrics = dashboard_service.get_metrics.__wrapped__(db, start_date, end_date).model_dump()
+    for field in ("clients_by_region", "campaigns_by_region"):
+        metrics[field] = {r["region"]: r["count"] for r in metrics[field]}
+
+    query = select(
+        ProjectDailyBrand.region,
+        ProjectDailyBrand.brand_name,
+        func.sum(ProjectDailyBrand.project_count),
+    ).group_by(ProjectDailyBrand.region, ProjectDailyBrand.brand_name)
+    if start_date:
+        query = query.where(ProjectDailyBrand.request_date >= start_date)
+    if end_date:
+        query = query.where(ProjectDailyBrand.request_date <= end_date)
+    brands = Counter({(region.value, brand): count for region, brand, count in db.execute(query)})
+    return metrics, brands
+
+
+metrics_hub = MetricsHub()
+
+
+def _event(name: str, data: dict) -> str:
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+async def iter_events(subscription: Subscription, snapshot: dict) -> AsyncIterator[str]:
+    """Server-sent events: a ``snapshot`` first, then ``delta`` events.
+
+    Every event carries the range's sequence number. After a resync the
+    stream skips deltas already folded into the new snapshot.
+    """
+    seq = snapshot["seq"]
+    try:
+        yield _event("snapshot", snapshot)
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    subscription.queue.get(), settings.LIVE_STREAM_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if message is _RESYNC:
+                snapshot = metrics_hub.snapshot(subscription)
+                seq = snapshot["seq"]
+                yield _event("snapshot", snapshot)
+                continue
+            if message["seq"] <= seq:
+                continue
+            seq = message["seq"]
+            yield _event("delta", message)
+    finally:
+        metrics_hub.unsubscribe(subscription)
@@ -1,30 +1,127 @@
+import base64
 import csv
+import enum
 import io
+import json
 import logging
-from typing import Optional
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Row,
+    String,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    type_coerce,
+    update,
+)
+from sqlalchemy.orm import Query, Session
 
-from app.exceptions import ForbiddenError, NotFoundError
+from app.config import settings
+from app.exceptions import (
+    AppException,
+    BadRequestError,
+    ForbiddenError,
+    NotFoundError,
+    PreconditionFailedError,
+)
 from app.models.project import Category, Project, ProjectStatus, Region
 from app.models.user import User, UserRole
-from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.project import (
+    BulkOperation,
+    ProjectBulkRequest,
+    ProjectCreate,
+    ProjectField,
+    ProjectUpdate,
+)
+from app.services import etags as etag_service
+from app.services import live as live_service
+from app.services import rollups as rollup_service
+from app.services import sketches as sketch_service
+from app.services import status_events as status_event_service
+from app.services import suggestions as suggestion_service
+from app.services.cache import cached
+from app.services.rollups import ProjectChange
 
 logger = logging.getLogger(__name__)
 
+# Below this many rows an exact count is cheap, so estimates are not used.
+ESTIMATED_COUNT_THRESHOLD = 10_000
 
-def get_projects(
-    db: Session,
-    page: int = 1,
-    per_page: int = 20,
+
+def _record_changes(db: Session, changes: List[ProjectChange]) -> int:
+    """Maintain derived tables for changed projects before the write commits.
+
+    Returns the data version the write will commit as.
+    """
+    rollup_service.apply_changes(db, changes)
+    sketch_service.apply_changes(db, changes)
+    status_event_service.record_transitions(db, changes)
+    return etag_service.bump(db)
+
+
+def _after_commit(changes: List[ProjectChange], data_version: int) -> None:
+    """Update in-process state once a project write has committed."""
+    live_service.metrics_hub.publish(changes, data_version)
+    suggestion_service.suggestion_index.publish(changes, data_version)
+
+
+# Columns searched by ``q``; each has a pg_trgm GIN index on PostgreSQL.
+SEARCH_FIELDS = (Project.brand_name, Project.salesperson_name, Project.city)
+
+
+def _is_postgres(query: Query) -> bool:
+    return query.session.get_bind().dialect.name == "postgresql"
+
+
+def _search_clause(query: Query, q: str):
+    """Projects with ``q`` in any search field, or similar to it on PostgreSQL.
+
+    Both ``ILIKE '%q%'`` and pg_trgm's ``%`` similarity operator are served by
+    the trigram indexes. SQLite has neither index nor operator, so it gets
+    the substring match alone.
+    """
+    clauses = [column.icontains(q, autoescape=True) for column in SEARCH_FIELDS]
+    if _is_postgres(query):
+        clauses += [column.op("%")(q) for column in SEARCH_FIELDS]
+    return or_(*clauses)
+
+
+def _search_rank(query: Query, q: str):
+    """Relevance of a row to ``q``, summed over the search fields."""
+    if _is_postgres(query):
+        return sum(func.similarity(column, q) for column in SEARCH_FIELDS)
+    needle = q.lower()
+    return sum(
+        case(
+            (func.lower(column) == needle, 3),
+            (func.lower(column).startswith(needle, autoescape=True), 2),
+            (func.lower(column).contains(needle, autoescape=True), 1),
+            else_=0,
+        )
+        for column in SEARCH_FIELDS
+    )
+
+
+def _apply_filters(
+    query: Query,
     region: Optional[Region] = None,
     status: Optional[ProjectStatus] = None,
     category: Optional[Category] = None,
     salesperson: Optional[str] = None,
     brand: Optional[str] = None,
-) -> dict:
-    query = db.query(Project)
-
+    q: Optional[str] = None,
+) -> Query:
     if region:
         query = query.filter(Project.region == region)
     if status:
@@ -35,12 +132,184 @@ def get_projects(
         query = query.filter(Project.salesperson_name.ilike(f"%{salesperson}%"))
     if brand:
         query = query.filter(Project.brand_name.ilike(f"%{brand}%"))
+    if q:
+        query = query.filter(_search_clause(query, q))
+    return query
+
+
+# ``created_at`` exactly as the database stores it, without the DateTime type's
+# result processing, so a cursor compares equal to the row it came from.
+_RAW_CREATED_AT = type_coerce(Project.created_at, String).label("raw_created_at")
+
+
+def encode_cursor(created_at, project_id: int) -> str:
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    payload = json.dumps([created_at, project_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, project_id = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(created_at, str) or not isinstance(project_id, int):
+            raise ValueError(cursor)
+    except (TypeError, ValueError):
+        raise BadRequestError("Invalid cursor") from None
+    return created_at, project_id
+
+
+@cached("project_count")
+def count_projects(
+    db: Session,
+    region: Optional[Region] = None,
+    status: Optional[ProjectStatus] = None,
+    category: Optional[Category] = None,
+    salesperson: Optional[str] = None,
+    brand: Optional[str] = None,
+    q: Optional[str] = None,
+) -> int:
+    """Exact number of projects matching the list filters, cached until the next write."""
+    return _apply_filters(
+        db.query(Project), region, status, category, salesperson, brand, q
+    ).count()
+
+
+def _estimate_count(db: Session, query: Query, filtered: bool) -> Optional[int]:
+    """Row estimate from PostgreSQL statistics, or ``None`` where there is none.
+
+    Unfiltered lists read ``pg_class.reltuples``, as maintained by ANALYZE and
+    autovacuum; filtered lists take the planner's row estimate for the query.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    if not filtered:
+        estimate = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'projects'::regclass")
+        ).scalar()
+        # -1 until the table is first analyzed.
+        return estimate if estimate is not None and estimate >= 0 else None
+
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    params = {
+        name: value.value if isinstance(value, enum.Enum) else value
+        for name, value in compiled.params.items()
+    }
+    plan = db.connection().exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + str(compiled), params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _total(
+    db: Session,
+    query: Query,
+    estimate: bool,
+    filters: Tuple,
+) -> Tuple[int, bool]:
+    if estimate:
+        estimated = _estimate_count(db, query, any(filters))
+        if estimated is not None and estimated >= ESTIMATED_COUNT_THRESHOLD:
+            return estimated, True
+    return count_projects(db, *filters), False
+
+
+def get_projects(
+    db: Session,
+    page: int = 1,
+    per_page: int = 20,
+    region: Optional[Region] = None,
+    status: Optional[ProjectStatus] = None,
+    category: Optional[Category] = None,
+    salesperson: Optional[str] = None,
+    brand: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    estimate_total: bool = False,
+    q: Optional[str] = None,
+    fields: Optional[List[ProjectField]] = None,
+) -> dict:
+    """One page of projects, newest first.
+
+    Pages are addressed either by ``page`` number (``OFFSET``) or by the
+    ``next_cursor`` of the previous page. The cursor encodes the last row's
+    ``(created_at, id)``, so the next page starts with an index seek on
+    ``ix_projects_created_at_id`` instead of skipping every earlier row.
+
+    ``q`` searches brand, salesperson and city at once and orders the
+    results by relevance; those pages are addressed by ``page`` only.
+
+    The total is optional. Exact totals are cached per filter combination
+    until the next write; with ``estimate_total`` large totals come from
+    PostgreSQL's statistics instead and are flagged as estimates.
 
-    total = query.count()
-    offset = (page - 1) * per_page
-    items = query.order_by(Project.created_at.desc()).offset(offset).limit(per_page).all()
+    With ``fields`` only those columns, plus ``id``, are selected and the
+    items are plain dicts rather than ``Project`` instances.
+    """
+    if q and cursor:
+        raise BadRequestError("Cursor pagination cannot be combined with q")
 
-    return {"items": items, "total": total, "page": page, "per_page": per_page}
+    filters = (region, status, category, salesperson, brand, q)
+    if fields:
+        names = ["id"] + [f.value for f in dict.fromkeys(fields) if f != ProjectField.id]
+        query = db.query(*(Project.__table__.c[name] for name in names))
+    else:
+        query = db.query(Project)
+    query = _apply_filters(query, *filters)
+    total, total_is_estimate = None, False
+    if include_total:
+        total, total_is_estimate = _total(db, query, estimate_total, filters)
+
+    order = [Project.created_at.desc(), Project.id.desc()]
+    if q:
+        order.insert(0, _search_rank(query, q).desc())
+    page_query = query.add_columns(_RAW_CREATED_AT).order_by(*order)
+    if cursor:
+        created_at, project_id = decode_cursor(cursor)
+        page_query = page_query.filter(
+            tuple_(Project.created_at, Project.id)
+            < tuple_(bindparam("cursor_created_at", created_at, type_=String), project_id)
+        )
+        page = None
+    else:
+        page_query = page_query.offset((page - 1) * per_page)
+
+    if fields:
+        # Plain rows straight from a Core select: no Project is built or
+        # tracked, and the columns nobody asked for are never read.
+        rows = db.execute(page_query.limit(per_page + 1).statement).all()
+        items = [dict(zip(names, row)) for row in rows[:per_page]]
+    else:
+        rows = page_query.limit(per_page + 1).all()
+        items = [project for project, _ in rows[:per_page]]
+    next_cursor = None
+    if len(rows) > per_page and not q:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            rows[per_page - 1].raw_created_at, last["id"] if fields else last.id
+        )
+
+    return {
+        "items": items,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "page": page,
+        "per_page": per_page,
+        "next_cursor": next_cursor,
+    }
+
+
+def get_project_version(db: Session, project_id: int) -> int:
+    """The project's version alone, enough to answer a conditional GET."""
+    version = db.execute(
+        select(Project.version).where(Project.id == project_id)
+    ).scalar_one_or_none()
+    if version is None:
+        raise NotFoundError("Project")
+    return version
 
 
 def get_project(db: Session, project_id: int) -> Project:
@@ -65,51 +334,352 @@ def create_project(db: Session, data: ProjectCreate, user: User) -> Project:
         status=data.status,
     )
     db.add(project)
+    db.flush()
+    changes = [(None, rollup_service.snapshot(project))]
+    data_version = _record_changes(db, changes)
     db.commit()
+    _after_commit(changes, data_version)
     db.refresh(project)
     logger.info("Project created: %d by user %d", project.id, user.id)
     return project
 
 
+def _missing_or_stale(db: Session, project_id: int) -> AppException:
+    """Why a guarded write matched no row: no such project, or a stale version."""
+    if db.execute(select(Project.id).where(Project.id == project_id)).first() is None:
+        return NotFoundError("Project")
+    return PreconditionFailedError("Project was changed by someone else; reload it and retry")
+
+
 def update_project(
-    db: Session, project_id: int, data: ProjectUpdate, user: User
-) -> Project:
+    db: Session,
+    project_id: int,
+    data: ProjectUpdate,
+    user: User,
+    if_match: Optional[List[int]] = None,
+) -> dict:
+    """Apply ``data`` with one ``UPDATE ... RETURNING`` and return the new row.
+
+    ``if_match`` lists the versions the client's copy may have; the update
+    only applies if the stored version is one of them, so concurrent
+    editors need neither locks nor a read before the write. On PostgreSQL
+    the pre-update values the write hooks need come back from the same
+    statement through a joined, row-locked read of the old row. SQLite's
+    ``RETURNING`` cannot see joined tables, so it reads them first.
+    """
     if user.role != UserRole.marcom:
         raise ForbiddenError("Only Marcom users can update projects")
 
-    project = get_project(db, project_id)
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(project, field, value)
+    table = Project.__table__
+    snapshot = [table.c[field] for field in rollup_service.SNAPSHOT_FIELDS]
+    stmt = update(table).values(
+        **data.model_dump(exclude_unset=True), version=table.c.version + 1
+    )
+    if if_match is not None:
+        stmt = stmt.where(table.c.version.in_(if_match))
 
+    if db.get_bind().dialect.name == "postgresql":
+        old = select(*snapshot).where(table.c.id == project_id).with_for_update().subquery("old")
+        stmt = stmt.where(table.c.id == old.c.id).returning(
+            *table.c, *[column.label(f"old_{column.key}") for column in old.c]
+        )
+        row = db.execute(stmt).mappings().first()
+        before = row and {field: row[f"old_{field}"] for field in rollup_service.SNAPSHOT_FIELDS}
+    else:
+        before = db.execute(select(*snapshot).where(table.c.id == project_id)).mappings().first()
+        stmt = stmt.where(table.c.id == project_id).returning(*table.c)
+        row = db.execute(stmt).mappings().first() if before else None
+    if row is None:
+        db.rollback()
+        raise _missing_or_stale(db, project_id)
+
+    project = {column.key: row[column.key] for column in table.c}
+    changes = [(dict(before), {field: project[field] for field in rollup_service.SNAPSHOT_FIELDS})]
+    data_version = _record_changes(db, changes)
     db.commit()
-    db.refresh(project)
-    logger.info("Project updated: %d by user %d", project.id, user.id)
+    _after_commit(changes, data_version)
+    logger.info("Project updated: %d by user %d", project_id, user.id)
     return project
 
 
-def delete_project(db: Session, project_id: int, user: User) -> None:
+def delete_project(
+    db: Session, project_id: int, user: User, if_match: Optional[List[int]] = None
+) -> None:
+    """Delete with one ``DELETE ... RETURNING``, honouring ``if_match`` like updates."""
     if user.role != UserRole.marcom:
         raise ForbiddenError("Only Marcom users can delete projects")
 
-    project = get_project(db, project_id)
-    db.delete(project)
+    table = Project.__table__
+    stmt = delete(table).where(table.c.id == project_id).returning(
+        *[table.c[field] for field in rollup_service.SNAPSHOT_FIELDS]
+    )
+    if if_match is not None:
+        stmt = stmt.where(table.c.version.in_(if_match))
+    row = db.execute(stmt).mappings().first()
+    if row is None:
+        db.rollback()
+        raise _missing_or_stale(db, project_id)
+
+    changes = [(dict(row), None)]
+    data_version = _record_changes(db, changes)
     db.commit()
+    _after_commit(changes, data_version)
     logger.info("Project deleted: %d by user %d", project_id, user.id)
 
 
-def export_projects_csv(db: Session) -> str:
-    projects = db.query(Project).order_by(Project.created_at.desc()).all()
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "ID", "Region", "Request Date", "City", "Salesperson", "Brand",
-        "Category", "Status", "Created At",
-    ])
-    for p in projects:
-        writer.writerow([
-            p.id, p.region.value, p.request_date.isoformat() if p.request_date else "",
-            p.city, p.salesperson_name, p.brand_name, p.category.value,
-            p.status.value, p.created_at.isoformat() if p.created_at else "",
-        ])
-    return output.getvalue()
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _insert_rows(db: Session, rows: List[dict], chunk_size: int) -> List[ProjectChange]:
+    """``INSERT ... RETURNING id`` for ``chunk_size`` rows at a time, in order."""
+    stmt = insert(Project).returning(Project.id, sort_by_parameter_order=True)
+    ids = []
+    for chunk in _chunks(rows, chunk_size):
+        ids.extend(db.execute(stmt, chunk).scalars())
+    return [
+        (None, {
+            field: project_id if field == "id" else row[field]
+            for field in rollup_service.SNAPSHOT_FIELDS
+        })
+        for project_id, row in zip(ids, rows)
+    ]
+
+
+# Columns a project import provides; the rest come from their defaults.
+LOAD_COLUMNS = (
+    "user_id", "region", "request_date", "city", "salesperson_name", "brand_name",
+    "category", "status",
+)
+
+
+def _copy_rows(db: Session, rows: List[dict]) -> List[ProjectChange]:
+    """Load rows with PostgreSQL ``COPY`` and return the created projects.
+
+    ``COPY`` cannot return generated ids, so the rows are copied into a
+    temporary staging table and moved into ``projects`` with one
+    ``INSERT ... SELECT ... RETURNING``, which the write hooks need.
+    """
+    db.execute(text(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS project_import (
+            user_id integer, region region, request_date date, city text,
+            salesperson_name text, brand_name text, category category, status projectstatus
+        ) ON COMMIT DELETE ROWS
+        """
+    ))
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [
+            value.value if isinstance(value, enum.Enum) else value
+            for value in (row[column] for column in LOAD_COLUMNS)
+        ]
+        for row in rows
+    )
+    buffer.seek(0)
+    columns = ", ".join(LOAD_COLUMNS)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY project_import ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+    snapshot = [Project.__table__.c[field] for field in rollup_service.SNAPSHOT_FIELDS]
+    created = db.execute(
+        text(
+            f"INSERT INTO projects ({columns}) SELECT {columns} FROM project_import "
+            f"RETURNING {', '.join(rollup_service.SNAPSHOT_FIELDS)}"
+        ).columns(*snapshot)
+    )
+    return [(None, row._asdict()) for row in created]
+
+
+def load_projects(db: Session, rows: List[dict]) -> List[int]:
+    """Create projects from validated rows in one transaction and return their ids.
+
+    PostgreSQL loads them with ``COPY``; other databases with batched
+    ``INSERT ... RETURNING``. Derived tables are maintained once for all
+    of the rows.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        changes = _copy_rows(db, rows)
+    else:
+        changes = _insert_rows(db, rows, settings.BULK_CHUNK_SIZE)
+    data_version = _record_changes(db, changes)
+    db.commit()
+    _after_commit(changes, data_version)
+    return [after["id"] for _, after in changes]
+
+
+def _typed(value, column, postgres: bool):
+    """A bound value for ``column``; PostgreSQL needs the cast to type a ``CASE``."""
+    bound = literal(value, column.type)
+    return cast(bound, column.type) if postgres else bound
+
+
+def bulk_write(
+    db: Session, data: ProjectBulkRequest, user: User, chunk_size: Optional[int] = None
+) -> dict:
+    """Create, update and delete many projects in one transaction.
+
+    The whole batch is checked before anything is written: updates and
+    deletes must name existing projects, each at most once, and updates
+    may not set a required field to null. Failing items
+    are reported in ``results`` and skipped; the rest are written
+    ``chunk_size`` rows per statement and the derived tables are maintained
+    once for the whole batch, from the rows the statements return.
+    """
+    if user.role != UserRole.marcom:
+        raise ForbiddenError("Only Marcom users can change projects")
+    if len(data.create) + len(data.update) + len(data.delete) > settings.BULK_MAX_ITEMS:
+        raise BadRequestError(f"A bulk request is limited to {settings.BULK_MAX_ITEMS} items")
+    chunk_size = chunk_size or settings.BULK_CHUNK_SIZE
+
+    targets = [(BulkOperation.update, i, item.id) for i, item in enumerate(data.update)]
+    targets += [(BulkOperation.delete, i, project_id) for i, project_id in enumerate(data.delete)]
+    uses = Counter(project_id for _, _, project_id in targets)
+    existing = {}
+    table = Project.__table__
+    snapshot = [table.c[field] for field in rollup_service.SNAPSHOT_FIELDS]
+    # Rows are locked in id order until commit (PostgreSQL; SQLite has one
+    # writer anyway), so the before-state cannot change under the batch and
+    # concurrent batches cannot deadlock each other.
+    for ids in _chunks(sorted(uses), chunk_size):
+        locked = select(*snapshot).where(table.c.id.in_(ids)).order_by(table.c.id)
+        for row in db.execute(locked.with_for_update()).mappings():
+            existing[row["id"]] = dict(row)
+
+    required = {column.key for column in Project.__table__.c if not column.nullable}
+    checked: List[dict] = []
+    valid = {BulkOperation.update: [], BulkOperation.delete: []}
+    for operation, index, project_id in targets:
+        error = None
+        nulls = []
+        if operation == BulkOperation.update:
+            values = data.update[index].model_dump(exclude_unset=True)
+            nulls = sorted(f for f, value in values.items() if value is None and f in required)
+        if uses[project_id] > 1:
+            error = "Project appears more than once in the batch"
+        elif project_id not in existing:
+            error = "Project not found"
+        elif nulls:
+            error = f"Cannot be null: {', '.join(nulls)}"
+        else:
+            valid[operation].append(index)
+        checked.append({"operation": operation, "index": index, "id": project_id, "error": error})
+
+    rows = [{"user_id": user.id, **item.model_dump()} for item in data.create]
+    changes = _insert_rows(db, rows, chunk_size)
+    ids = [after["id"] for _, after in changes]
+    results = [
+        {"operation": BulkOperation.create, "index": index, "id": project_id}
+        for index, project_id in enumerate(ids)
+    ]
+    results += checked
+
+    # Updates setting the same columns share one statement per chunk, each
+    # column set through ``CASE id``, and ``RETURNING`` gives the rows as
+    # written. ``updated_at`` comes from the column's ``onupdate``, which the
+    # dashboard snapshot relies on to find changed rows.
+    groups = defaultdict(list)
+    for index in valid[BulkOperation.update]:
+        item = data.update[index]
+        values = item.model_dump(exclude_unset=True, exclude={"id"})
+        if values:
+            groups[tuple(sorted(values))].append((item.id, values))
+        else:
+            changes.append((existing[item.id], existing[item.id]))
+    postgres = db.get_bind().dialect.name == "postgresql"
+    for fields, items in groups.items():
+        for chunk in _chunks(items, chunk_size):
+            stmt = (
+                update(table)
+                .where(table.c.id.in_([project_id for project_id, _ in chunk]))
+                .values({
+                    field: case(
+                        {
+                            project_id: _typed(values[field], table.c[field], postgres)
+                            for project_id, values in chunk
+                        },
+                        value=table.c.id,
+                    )
+                    for field in fields
+                })
+                .values(version=table.c.version + 1)
+                .returning(*snapshot)
+            )
+            changes.extend(
+                (existing[row["id"]], dict(row)) for row in db.execute(stmt).mappings()
+            )
+
+    deleted = []
+    to_delete = [data.delete[index] for index in valid[BulkOperation.delete]]
+    for chunk in _chunks(to_delete, chunk_size):
+        rows = db.execute(delete(table).where(table.c.id.in_(chunk)).returning(*snapshot))
+        for row in rows.mappings():
+            deleted.append(row["id"])
+            changes.append((dict(row), None))
+    data_version = _record_changes(db, changes)
+
+    db.commit()
+    _after_commit(changes, data_version)
+    logger.info(
+        "Bulk write by user %d: %d created, %d updated, %d deleted",
+        user.id, len(ids), len(valid[BulkOperation.update]), len(deleted),
+    )
+    return {
+        "created": len(ids),
+        "updated": len(valid[BulkOperation.update]),
+        "deleted": len(deleted),
+        "results": results,
+    }
+
+
+EXPORT_COLUMNS = [
+    ("ID", Project.id),
+    ("Region", Project.region),
+    ("Request Date", Project.request_date),
+    ("City", Project.city),
+    ("Salesperson", Project.salesperson_name),
+    ("Brand", Project.brand_name),
+    ("Category", Project.category),
+    ("Status", Project.status),
+    ("Created At", Project.created_at),
+]
+
+
+def export_columns(fields: Optional[List[ProjectField]] = None) -> list:
+    """The ``EXPORT_COLUMNS`` named in ``fields``, in their usual order; all by default."""
+    if not fields:
+        return EXPORT_COLUMNS
+    wanted = {field.value for field in fields}
+    unknown = wanted - {column.key for _, column in EXPORT_COLUMNS}
+    if unknown:
+        raise BadRequestError(f"Fields not available for export: {', '.join(sorted(unknown))}")
+    return [(header, column) for header, column in EXPORT_COLUMNS if column.key in wanted]
+
+
+def iter_export_batches(
+    db: Session,
+    batch_size: int,
+    region: Optional[Region] = None,
+    status: Optional[ProjectStatus] = None,
+    category: Optional[Category] = None,
+    salesperson: Optional[str] = None,
+    brand: Optional[str] = None,
+    q: Optional[str] = None,
+    columns: Optional[list] = None,
+) -> Iterator[List[Row]]:
+    """Yield the filtered projects as lists of ``columns`` rows, newest first.
+
+    ``columns`` are ``(header, column)`` pairs, ``EXPORT_COLUMNS`` by default.
+    Plain column rows are streamed ``batch_size`` at a time (a server-side
+    cursor on PostgreSQL), so memory is bounded by one batch however many
+    projects match.
+    """
+    query = db.query(*(column for _, column in columns or EXPORT_COLUMNS))
+    query = _apply_filters(query, region, status, category, salesperson, brand, q)
+    query = query.order_by(Project.created_at.desc(), Project.id.desc())
+    result = db.execute(query.statement.execution_options(yield_per=batch_size))
+    yield from result.partitions()
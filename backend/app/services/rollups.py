@@ -0,0 +1,177 @@
+import logging
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, delete, func, select
+from sqlalchemy.orm import Session
+
+from app.models.project import Project
+from app.models.stats import (
+    ProjectDailyBrand,
+    ProjectDailyStats,
+    ProjectMonthlyBrand,
+    ProjectMonthlyCube,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FIELDS = (
+    "id",
+    "region",
+    "request_date",
+    "city",
+    "salesperson_name",
+    "brand_name",
+    "category",
+    "status",
+)
+
+# (before, after) column values of one changed project; ``None`` on the
+# before side means created, ``None`` on the after side means deleted.
+ProjectChange = Tuple[Optional[dict], Optional[dict]]
+
+STATS_KEY = ("request_date", "region", "category", "status")
+BRAND_KEY = ("request_date", "region", "brand_name")
+CUBE_KEY = ("month", "region", "category", "status", "salesperson_name")
+MONTHLY_BRAND_KEY = ("month", "region", "status", "brand_name")
+
+ROLLUPS = (
+    (ProjectDailyStats, STATS_KEY),
+    (ProjectDailyBrand, BRAND_KEY),
+    (ProjectMonthlyCube, CUBE_KEY),
+    (ProjectMonthlyBrand, MONTHLY_BRAND_KEY),
+)
+
+
+def snapshot(project: Project) -> dict:
+    return {field: getattr(project, field) for field in SNAPSHOT_FIELDS}
+
+
+def dialect_insert(db: Session):
+    """``INSERT`` construct with ``ON CONFLICT`` support for the session's dialect."""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def _key_value(values: dict, field: str):
+    # ``month`` is derived: the first day of the request date's month.
+    if field == "month":
+        return values["request_date"].replace(day=1)
+    return values[field]
+
+
+def _deltas(changes: Iterable[ProjectChange], key: Tuple[str, ...]) -> Counter:
+    deltas: Counter = Counter()
+    for before, after in changes:
+        if before is not None:
+            deltas[tuple(_key_value(before, f) for f in key)] -= 1
+        if after is not None:
+            deltas[tuple(_key_value(after, f) for f in key)] += 1
+    return deltas
+
+
+def _upsert_counts(db: Session, table, key: Tuple[str, ...], deltas: Counter) -> None:
+    # Rows are written in key order so that writers touching the same
+    # rollup rows lock them in the same order and cannot deadlock.
+    rows = [
+        {**dict(zip(key, values)), "project_count": delta}
+        for values, delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return
+
+    stmt = dialect_insert(db)(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={"project_count": table.project_count + stmt.excluded.project_count},
+    )
+    db.execute(stmt, rows)
+
+    emptied = [
+        {f"k_{f}": row[f] for f in key} for row in rows if row["project_count"] < 0
+    ]
+    if emptied:
+        core = table.__table__
+        db.execute(
+            delete(core).where(
+                and_(*[core.c[f] == bindparam(f"k_{f}") for f in key]),
+                core.c.project_count <= 0,
+            ),
+            emptied,
+        )
+
+
+def apply_changes(db: Session, changes: List[ProjectChange]) -> None:
+    """Fold project writes into the rollup tables.
+
+    Runs inside the caller's transaction, so the rollups commit or roll back
+    together with the project rows they describe.
+    """
+    for table, key in ROLLUPS:
+        _upsert_counts(db, table, key, _deltas(changes, key))
+
+
+def _raw_counts(db: Session, key: Tuple[str, ...]) -> Counter:
+    # Months are folded from request dates here, which keeps this dialect-neutral.
+    fields = ["request_date" if f == "month" else f for f in key]
+    columns = [getattr(Project, f) for f in fields]
+    rows = db.execute(select(*columns, func.count(Project.id)).group_by(*columns))
+    counts: Counter = Counter()
+    for row in rows:
+        values = dict(zip(fields, row[:-1]))
+        counts[tuple(_key_value(values, f) for f in key)] += row[-1]
+    return counts
+
+
+def _rollup_counts(db: Session, table, key: Tuple[str, ...]) -> Counter:
+    columns = [getattr(table, f) for f in key]
+    rows = db.execute(select(*columns, table.project_count))
+    return Counter({tuple(row[:-1]): row[-1] for row in rows})
+
+
+def find_discrepancies(db: Session) -> List[dict]:
+    """Compare the rollup tables with aggregates over the raw ``projects`` rows.
+
+    Returns one entry per mismatching key; an empty list means the rollups
+    are consistent.
+    """
+    discrepancies = []
+    for table, key in ROLLUPS:
+        expected = _raw_counts(db, key)
+        actual = _rollup_counts(db, table, key)
+        for values in sorted(set(expected) | set(actual), key=str):
+            if expected[values] != actual[values]:
+                discrepancies.append({
+                    "table": table.__tablename__,
+                    "key": dict(zip(key, values)),
+                    "expected": expected[values],
+                    "actual": actual[values],
+                })
+    if discrepancies:
+        logger.warning("Rollup discrepancies found: %d", len(discrepancies))
+    return discrepancies
+
+
+def rebuild(db: Session) -> None:
+    """Recompute the rollup tables from scratch in the caller's transaction."""
+    for table, key in ROLLUPS:
+        db.execute(delete(table))
+        if "month" in key:
+            rows = [
+                {**dict(zip(key, values)), "project_count": count}
+                for values, count in _raw_counts(db, key).items()
+            ]
+            if rows:
+                db.execute(table.__table__.insert(), rows)
+            continue
+        columns = [getattr(Project, f) for f in key]
+        db.execute(
+            table.__table__.insert().from_select(
+                [*key, "project_count"],
+                select(*columns, func.count(Project.id)).group_by(*columns),
+            )
+        )
@@ -0,0 +1,157 @@
+import hashlib
+import math
+import struct
+import zlib
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.project import Region
+from app.models.sketch import BrandSketch
+from app.models.stats import ProjectDailyBrand
+from app.services.rollups import ProjectChange, dialect_insert
+
+# 2**12 registers give a relative standard error of 1.04 / sqrt(4096) ~= 1.6%,
+# so about 95% of estimates fall within +/-3.3% of the exact distinct count.
+PRECISION = 12
+REGISTERS = 1 << PRECISION
+STANDARD_ERROR = 1.04 / math.sqrt(REGISTERS)
+
+_SPARSE = b"\x01"
+_DENSE = b"\x00"
+_SPARSE_ENTRY = struct.Struct(">HB")
+_ALPHA = 0.7213 / (1 + 1.079 / REGISTERS)
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter with one byte per register."""
+
+    def __init__(self, registers: Optional[bytearray] = None):
+        self.registers = registers if registers is not None else bytearray(REGISTERS)
+
+    def add(self, value: str) -> None:
+        x = int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+        index = x >> (64 - PRECISION)
+        remaining = x & ((1 << (64 - PRECISION)) - 1)
+        rank = (64 - PRECISION) - remaining.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        registers = self.registers
+        for index, rank in enumerate(other.registers):
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def merge_bytes(self, data: bytes) -> None:
+        """Merge a serialized sketch without materialising it first."""
+        if data[:1] == _SPARSE:
+            registers = self.registers
+            for index, rank in _SPARSE_ENTRY.iter_unpack(data[1:]):
+                if rank > registers[index]:
+                    registers[index] = rank
+        else:
+            self.merge(HyperLogLog.from_bytes(data))
+
+    def cardinality(self) -> float:
+        registers = self.registers
+        estimate = _ALPHA * REGISTERS * REGISTERS / sum(2.0 ** -r for r in registers)
+        zeros = registers.count(0)
+        if estimate <= 2.5 * REGISTERS and zeros:
+            # Linear counting is more accurate for small cardinalities.
+            return REGISTERS * math.log(REGISTERS / zeros)
+        return estimate
+
+    def to_bytes(self) -> bytes:
+        """Sparse (index, rank) pairs for small sketches, zlib-packed registers otherwise."""
+        entries = [(i, r) for i, r in enumerate(self.registers) if r]
+        if len(entries) * _SPARSE_ENTRY.size < REGISTERS // 4:
+            return _SPARSE + b"".join(_SPARSE_ENTRY.pack(i, r) for i, r in entries)
+        return _DENSE + zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        if data[:1] == _SPARSE:
+            sketch = cls()
+            sketch.merge_bytes(data)
+            return sketch
+        return cls(bytearray(zlib.decompress(data[1:])))
+
+
+def apply_changes(db: Session, changes: List[ProjectChange]) -> None:
+    """Rebuild the sketches of every (day, region) touched by the changes.
+
+    HyperLogLog cannot forget a value, so instead of adding to the stored
+    sketch the touched cells are recomputed from ``project_daily_brands``,
+    which the rollups have already updated in this transaction. Each cell
+    only holds the brands of one region on one day, so this stays cheap and
+    keeps deletes and renames exact.
+    """
+    cells: Set[Tuple[date, Region]] = set()
+    for before, after in changes:
+        for values in (before, after):
+            if values is not None:
+                cells.add((values["request_date"], values["region"]))
+    if cells:
+        rebuild(db, cells)
+
+
+def rebuild(db: Session, cells: Optional[Iterable[Tuple[date, Region]]] = None) -> None:
+    """Recompute sketches for the given (day, region) cells, or for all of them."""
+    query = select(
+        ProjectDailyBrand.request_date, ProjectDailyBrand.region, ProjectDailyBrand.brand_name
+    )
+    if cells is not None:
+        cells = list(cells)
+        query = query.where(
+            tuple_(ProjectDailyBrand.request_date, ProjectDailyBrand.region).in_(cells)
+        )
+
+    sketches: Dict[Tuple[date, Region], HyperLogLog] = defaultdict(HyperLogLog)
+    for day, region, brand in db.execute(query):
+        sketches[(day, region)].add(brand)
+
+    emptied = set(cells or ()) - set(sketches)
+    if cells is None:
+        db.execute(BrandSketch.__table__.delete())
+    elif emptied:
+        db.execute(
+            BrandSketch.__table__.delete().where(
+                tuple_(BrandSketch.request_date, BrandSketch.region).in_(list(emptied))
+            )
+        )
+
+    if sketches:
+        stmt = dialect_insert(db)(BrandSketch)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["request_date", "region"],
+            set_={"sketch": stmt.excluded.sketch},
+        )
+        db.execute(stmt, [
+            {"request_date": day, "region": region, "sketch": sketch.to_bytes()}
+            for (day, region), sketch in sketches.items()
+        ])
+
+
+def estimate_clients_by_region(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[Tuple[Region, int]]:
+    """Approximate distinct brands per region by merging the daily sketches."""
+    query = select(BrandSketch.region, BrandSketch.sketch)
+    if start_date:
+        query = query.where(BrandSketch.request_date >= start_date)
+    if end_date:
+        query = query.where(BrandSketch.request_date <= end_date)
+
+    merged: Dict[Region, HyperLogLog] = defaultdict(HyperLogLog)
+    for region, data in db.execute(query.execution_options(yield_per=1000)):
+        merged[region].merge_bytes(data)
+    return sorted(
+        ((region, round(sketch.cardinality())) for region, sketch in merged.items()),
+        key=lambda item: item[0].value,
+    )
@@ -0,0 +1,188 @@
+import logging
+from datetime import date, timedelta
+from itertools import groupby
+from typing import List, Optional
+
+from sqlalchemy import bindparam, case, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.project import ProjectStatus, Region
+from app.models.status_event import ProjectStatusEvent
+from app.schemas.dashboard import FunnelStage, StageDuration
+from app.services.cache import cached
+from app.services.rollups import ProjectChange
+
+logger = logging.getLogger(__name__)
+
+# Rejection is a dead end rather than a step, so it is left out of the funnel.
+FUNNEL_STAGES = [s for s in ProjectStatus if s != ProjectStatus.client_rejected]
+
+
+def record_transitions(db: Session, changes: List[ProjectChange]) -> None:
+    """Append an event for every created project and every status change.
+
+    A project that moves region takes its past events with it, so the
+    per-region reports group them exactly as a join to ``projects`` would.
+    """
+    moved = [
+        {"project": after["id"], "new_region": after["region"]}
+        for before, after in changes
+        if before is not None and after is not None and before["region"] != after["region"]
+    ]
+    if moved:
+        table = ProjectStatusEvent.__table__
+        db.execute(
+            update(table)
+            .where(table.c.project_id == bindparam("project"))
+            .values(region=bindparam("new_region")),
+            moved,
+        )
+
+    rows = [
+        {
+            "project_id": after["id"],
+            "from_status": before["status"] if before else None,
+            "status": after["status"],
+            "region": after["region"],
+        }
+        for before, after in changes
+        if after is not None and (before is None or before["status"] != after["status"])
+    ]
+    if rows:
+        db.execute(insert(ProjectStatusEvent), rows)
+
+
+def _apply_range(query, start_date: Optional[date], end_date: Optional[date]):
+    if start_date:
+        query = query.where(ProjectStatusEvent.at >= start_date)
+    if end_date:
+        query = query.where(ProjectStatusEvent.at < end_date + timedelta(days=1))
+    return query
+
+
+@cached("funnel")
+def get_funnel(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    region: Optional[Region] = None,
+) -> List[FunnelStage]:
+    """Projects that reached each funnel stage (or a later one) in the range.
+
+    Projects can skip stages, so each project is counted at the furthest stage
+    it reached and the counts are accumulated from the last stage backwards.
+    """
+    rank = case(
+        {status: i for i, status in enumerate(FUNNEL_STAGES)},
+        value=ProjectStatusEvent.status,
+    )
+    furthest = _apply_range(
+        select(func.max(rank).label("stage")).where(
+            ProjectStatusEvent.status != ProjectStatus.client_rejected
+        ),
+        start_date,
+        end_date,
+    )
+    if region:
+        furthest = furthest.where(ProjectStatusEvent.region == region)
+    furthest = furthest.group_by(ProjectStatusEvent.project_id).subquery()
+
+    rows = db.execute(
+        select(furthest.c.stage, func.count()).group_by(furthest.c.stage)
+    ).all()
+    reached_at = dict(rows)
+
+    counts = []
+    running = 0
+    for i in reversed(range(len(FUNNEL_STAGES))):
+        running += reached_at.get(i, 0)
+        counts.append(running)
+    counts.reverse()
+
+    stages = []
+    for i, status in enumerate(FUNNEL_STAGES):
+        previous = counts[i - 1] if i else counts[0]
+        stages.append(FunnelStage(
+            status=status,
+            projects=counts[i],
+            conversion_rate=counts[i] / counts[0] if counts[0] else 0.0,
+            step_conversion_rate=counts[i] / previous if previous else 0.0,
+        ))
+    return stages
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Linear-interpolated percentile of sorted values, like ``percentile_cont``."""
+    position = (len(values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+@cached("time_in_stage")
+def get_time_in_stage(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> List[StageDuration]:
+    """Median and p90 seconds spent in each status, per region.
+
+    A stint starts at a status event and ends at the project's next event;
+    stints that are still open are not counted. ``LEAD`` only looks forward,
+    so the start bound can be pushed into the window input; the window's
+    partition order matches the ``(project_id, at)`` index. Events carry
+    their project's region, so ``projects`` is not read at all.
+    """
+    dialect = db.get_bind().dialect.name
+    events = select(
+        ProjectStatusEvent.project_id,
+        ProjectStatusEvent.region,
+        ProjectStatusEvent.status,
+        ProjectStatusEvent.at,
+        func.lead(ProjectStatusEvent.at)
+        .over(
+            partition_by=ProjectStatusEvent.project_id,
+            order_by=(ProjectStatusEvent.at, ProjectStatusEvent.id),
+        )
+        .label("left_at"),
+    )
+    if start_date:
+        events = events.where(ProjectStatusEvent.at >= start_date)
+    stints = events.subquery("stints")
+
+    if dialect == "postgresql":
+        seconds = func.extract("epoch", stints.c.left_at - stints.c.at)
+    else:
+        seconds = (func.julianday(stints.c.left_at) - func.julianday(stints.c.at)) * 86400
+    groups = (stints.c.region, stints.c.status)
+    base = select(*groups).where(stints.c.left_at.is_not(None))
+    if end_date:
+        base = base.where(stints.c.at < end_date + timedelta(days=1))
+
+    if dialect == "postgresql":
+        rows = db.execute(
+            base.add_columns(
+                func.count().label("stints"),
+                func.percentile_cont(0.5).within_group(seconds).label("median"),
+                func.percentile_cont(0.9).within_group(seconds).label("p90"),
+            ).group_by(*groups).order_by(*groups)
+        )
+        return [
+            StageDuration(
+                region=r.region, status=r.status, stints=r.stints,
+                median_seconds=r.median, p90_seconds=r.p90,
+            )
+            for r in rows
+        ]
+
+    rows = db.execute(
+        base.add_columns(seconds.label("seconds")).order_by(*groups, seconds)
+    )
+    result = []
+    for (region, status), group in groupby(rows, key=lambda r: (r.region, r.status)):
+        values = [r.seconds for r in group]
+        result.append(StageDuration(
+            region=region, status=status, stints=len(values),
+            median_seconds=_percentile(values, 0.5), p90_seconds=_percentile(values, 0.9),
+        ))
+    return result
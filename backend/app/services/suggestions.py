@@ -0,0 +1,143 @@
+import bisect
+import heapq
+import threading
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.database import begin_snapshot
+from app.models.project import Project
+from app.schemas.project import SuggestField
+from app.services import etags as etag_service
+from app.services.rollups import ProjectChange
+
+# Project attribute behind each suggest field.
+COLUMNS = {
+    SuggestField.brand: "brand_name",
+    SuggestField.city: "city",
+    SuggestField.salesperson: "salesperson_name",
+}
+
+# Sorts after every character, so (prefix + _LAST,) bounds the keys starting with prefix.
+_LAST = "\U0010ffff"
+
+
+class _ValueIndex:
+    """Distinct values of one column with the number of projects using each.
+
+    ``keys`` holds ``(casefolded value, value)`` pairs in sorted order, so
+    the values starting with a prefix form one contiguous run found by
+    bisection. ``ranked`` holds the same pairs ordered by descending count.
+    A narrow run is ranked directly; for a wide one (a short prefix) it is
+    cheaper to walk ``ranked`` until enough values match. ``version`` is the
+    data version the counts reflect.
+    """
+
+    def __init__(self, counts: Dict[str, int], version: int):
+        self.counts = counts
+        self.version = version
+        self.keys: List[Tuple[str, str]] = sorted((v.casefold(), v) for v in counts)
+        self.ranked: List[Tuple[int, str, str]] = sorted(
+            (-counts[value], folded, value) for folded, value in self.keys
+        )
+
+    def add(self, value: str, sign: int) -> None:
+        before = self.counts.get(value, 0)
+        after = before + sign
+        folded = value.casefold()
+        if before > 0:
+            del self.ranked[bisect.bisect_left(self.ranked, (-before, folded, value))]
+        if after > 0:
+            self.counts[value] = after
+            bisect.insort(self.ranked, (-after, folded, value))
+            if before <= 0:
+                bisect.insort(self.keys, (folded, value))
+        elif before > 0:
+            del self.counts[value]
+            del self.keys[bisect.bisect_left(self.keys, (folded, value))]
+
+    def suggest(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        folded = prefix.casefold()
+        keys, counts = self.keys, self.counts
+        lo = bisect.bisect_left(keys, (folded,))
+        hi = bisect.bisect_left(keys, (folded + _LAST,), lo)
+        matches = hi - lo
+        # Walking ``ranked`` visits about limit * len(keys) / matches values.
+        if matches * matches > limit * len(keys):
+            result = []
+            for count, key, value in self.ranked:
+                if key.startswith(folded):
+                    result.append((value, -count))
+                    if len(result) == limit:
+                        break
+            return result
+        top = heapq.nsmallest(
+            limit, (keys[i] for i in range(lo, hi)), key=lambda k: (-counts[k[1]], k)
+        )
+        return [(value, counts[value]) for _, value in top]
+
+
+class SuggestionIndex:
+    """In-process typeahead over brands, cities and salespeople.
+
+    Each field is loaded with one ``GROUP BY`` the first time it is asked
+    for, together with the data version it reflects, then kept current from
+    this process's committed writes. A lookup reads only the data version:
+    when it is ahead of the field's, some write was not seen here (another
+    worker, the CLI, or a publish still on its way) and the field is
+    reloaded. A publish at or below the field's version is already counted
+    and is ignored; one that skips a version leaves the field stale, so it
+    is reloaded too.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fields: Dict[SuggestField, _ValueIndex] = {}
+
+    def suggest(
+        self, db: Session, field: SuggestField, prefix: str = "", limit: int = 10
+    ) -> List[dict]:
+        version = etag_service.current_version(db)
+        with self._lock:
+            index = self._fields.get(field)
+        if index is None or index.version < version:
+            # Loaded without the lock, so writers publishing meanwhile do not wait.
+            loaded = _load(db, field)
+            with self._lock:
+                index = self._fields.get(field)
+                if index is None or index.version < loaded.version:
+                    index = self._fields[field] = loaded
+        with self._lock:
+            return [{"value": v, "count": c} for v, c in index.suggest(prefix, limit)]
+
+    def publish(self, changes: List[ProjectChange], version: int) -> None:
+        """Called after a write commits as data ``version``; safe from any thread."""
+        with self._lock:
+            for field, index in self._fields.items():
+                if version != index.version + 1:
+                    continue
+                column = COLUMNS[field]
+                for before, after in changes:
+                    if before is not None:
+                        index.add(before[column], -1)
+                    if after is not None:
+                        index.add(after[column], 1)
+                index.version = version
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fields.clear()
+
+
+def _load(db: Session, field: SuggestField) -> _ValueIndex:
+    """Read a field's value counts and the data version, from one snapshot."""
+    column = getattr(Project, COLUMNS[field])
+    with Session(bind=db.get_bind()) as snapshot_db:
+        begin_snapshot(snapshot_db)
+        version = etag_service.current_version(snapshot_db)
+        rows = snapshot_db.execute(select(column, func.count()).group_by(column))
+        return _ValueIndex({value: count for value, count in rows}, version)
+
+
+suggestion_index = SuggestionIndex()
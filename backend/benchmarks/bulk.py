@@ -0,0 +1,73 @@
+"""Compare creating projects one request at a time with ``bulk_write``.
+
+Run from ``backend/``::
+
+    BENCH_DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.bulk
+
+Both paths go through the service layer with the write hooks (rollups,
+sketches, status events), so the difference is commits and round trips.
+Without ``BENCH_DATABASE_URL`` an in-memory SQLite database is used, which
+has no fsync to save. The schema is created and dropped by the script, so
+point it at a scratch database.
+"""
+import argparse
+import time
+
+from sqlalchemy.orm import Session
+
+from app.models.project import Category, Region
+from app.models.user import User, UserRole
+from app.schemas.project import ProjectBulkRequest, ProjectCreate
+from app.services import projects as project_service
+from benchmarks.common import create_schema, drop_schema, make_engine
+
+
+def _projects(count: int):
+    return [
+        ProjectCreate(
+            region=list(Region)[i % len(Region)],
+            request_date=f"2026-02-{1 + i % 28:02d}",
+            city=f"City {i % 50}",
+            salesperson_name=f"Salesperson {i % 30}",
+            brand_name=f"Brand {i}",
+            category=list(Category)[i % len(Category)],
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    create_schema(engine)
+    try:
+        with Session(bind=engine) as db:
+            user = User(email="bench@test.com", hashed_password="x", role=UserRole.marcom)
+            db.add(user)
+            db.commit()
+            projects = _projects(args.items)
+
+            start = time.perf_counter()
+            for data in projects:
+                project_service.create_project(db, data, user)
+            single = time.perf_counter() - start
+
+            start = time.perf_counter()
+            project_service.bulk_write(
+                db, ProjectBulkRequest(create=projects), user, args.chunk_size
+            )
+            batched = time.perf_counter() - start
+    finally:
+        drop_schema(engine)
+
+    print(f"{args.items} projects on {engine.dialect.name}")
+    print(f"one by one  {single * 1000:>10.1f} ms")
+    print(f"bulk        {batched * 1000:>10.1f} ms  (chunks of {args.chunk_size})")
+
+
+if __name__ == "__main__":
+    main()
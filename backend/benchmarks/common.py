@@ -0,0 +1,77 @@
+"""Shared setup for the benchmark scripts: a scratch database seeded with projects."""
+import os
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models.project import Category, Project, ProjectStatus, Region
+from app.models.user import User, UserRole
+
+BATCH = 10_000
+
+
+def make_engine():
+    """``BENCH_DATABASE_URL`` if set, otherwise an in-memory SQLite database."""
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if url:
+        return create_engine(url)
+    return create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+
+
+def create_schema(engine) -> None:
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def drop_schema(engine) -> None:
+    Base.metadata.drop_all(bind=engine)
+
+
+def seed(db: Session, rows: int) -> None:
+    """Insert ``rows`` projects straight into ``projects``, skipping the write hooks."""
+    user = User(email="bench@test.com", hashed_password="x", role=UserRole.marcom)
+    db.add(user)
+    db.flush()
+
+    regions, statuses, categories = list(Region), list(ProjectStatus), list(Category)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for offset in range(0, rows, BATCH):
+        db.execute(insert(Project), [
+            {
+                "user_id": user.id,
+                "region": regions[i % len(regions)],
+                "request_date": date(2024, 1, 1) + timedelta(days=i % 730),
+                "city": f"City {i % 500}",
+                "salesperson_name": f"Salesperson {i % 3000}",
+                "brand_name": f"Brand {i % 50000}",
+                "category": categories[i % len(categories)],
+                "status": statuses[i % len(statuses)],
+                # Pairs of rows share a timestamp, so ties on created_at are exercised.
+                "created_at": start + timedelta(seconds=i // 2),
+            }
+            for i in range(offset, min(offset + BATCH, rows))
+        ])
+    db.commit()
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("ANALYZE projects"))
+        db.commit()
+
+
+def timed(fn, repeat: int) -> float:
+    """Median wall time of ``fn`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
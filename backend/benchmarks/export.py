@@ -0,0 +1,59 @@
+"""Measure a streaming export: time to first byte, total time, size and peak memory.
+
+Run from ``backend/``::
+
+    BENCH_DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.export
+    python -m benchmarks.export --rows 200000 --format parquet --compression zstd
+
+Peak memory is what ``tracemalloc`` sees allocated by Python while the
+export runs; it should stay flat as ``--rows`` grows. Without
+``BENCH_DATABASE_URL`` an in-memory SQLite database is used. The schema is
+created and dropped by the script, so point it at a scratch database.
+"""
+import argparse
+import time
+import tracemalloc
+
+from sqlalchemy.orm import Session
+
+from app.schemas.project import ExportCompression, ExportFormat
+from app.services import exports as export_service
+from benchmarks.common import create_schema, drop_schema, make_engine, seed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", type=ExportFormat, default=ExportFormat.csv)
+    parser.add_argument("--compression", type=ExportCompression)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    create_schema(engine)
+    try:
+        with Session(bind=engine) as db:
+            seed(db, args.rows)
+            tracemalloc.start()
+            start = time.perf_counter()
+            first_byte = None
+            size = 0
+            export = export_service.export_projects(db, args.format, args.compression)
+            for chunk in export.chunks:
+                if first_byte is None:
+                    first_byte = time.perf_counter() - start
+                size += len(chunk)
+            total = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        drop_schema(engine)
+
+    print(f"{args.rows} projects on {engine.dialect.name} as {export.filename}")
+    print(f"first byte  {first_byte * 1000:>10.2f} ms")
+    print(f"total       {total:>10.2f} s")
+    print(f"file size   {size / 2**20:>10.1f} MiB")
+    print(f"peak memory {peak / 2**20:>10.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare full and sparse-fieldset (``fields=``) pages of ``GET /projects``.
+
+Run from ``backend/``::
+
+    python -m benchmarks.fieldsets
+    BENCH_DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.fieldsets --rows 500000
+
+Each timing covers the query and the JSON encoding the endpoint does:
+``ProjectListResponse`` for full items, ``pydantic_core.to_json`` of the
+plain dicts for sparse ones. Without ``BENCH_DATABASE_URL`` an in-memory
+SQLite database is used. The schema is created and dropped by the script,
+so point it at a scratch database.
+"""
+import argparse
+
+from pydantic_core import to_json
+from sqlalchemy.orm import Session
+
+from app.schemas.project import ProjectField, ProjectListResponse
+from app.services import projects as project_service
+from benchmarks.common import create_schema, drop_schema, make_engine, seed, timed
+
+PAGE_SIZES = [20, 200, 2_000]
+FIELDS = [ProjectField.brand_name, ProjectField.status, ProjectField.request_date]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    create_schema(engine)
+    try:
+        with Session(bind=engine) as db:
+            seed(db, args.rows)
+
+            def full(per_page: int) -> bytes:
+                # A fresh identity map each time, as in a request.
+                db.expunge_all()
+                result = project_service.get_projects(db, per_page=per_page, include_total=False)
+                return ProjectListResponse.model_validate(result).model_dump_json().encode()
+
+            def sparse(per_page: int) -> bytes:
+                return to_json(project_service.get_projects(
+                    db, per_page=per_page, include_total=False, fields=FIELDS
+                ))
+
+            fields = ", ".join(field.value for field in FIELDS)
+            print(f"{args.rows} projects, fields={fields}, median of {args.repeat} runs\n")
+            print(
+                f"{'per page':>8}  {'full ms':>8}  {'sparse ms':>9}"
+                f"  {'full KB':>8}  {'sparse KB':>9}"
+            )
+            for per_page in PAGE_SIZES:
+                full_ms = timed(lambda: full(per_page), args.repeat)
+                sparse_ms = timed(lambda: sparse(per_page), args.repeat)
+                full_kb = len(full(per_page)) / 1024
+                sparse_kb = len(sparse(per_page)) / 1024
+                print(
+                    f"{per_page:>8}  {full_ms:>8.2f}  {sparse_ms:>9.2f}"
+                    f"  {full_kb:>8.1f}  {sparse_kb:>9.1f}"
+                )
+    finally:
+        drop_schema(engine)
+
+
+if __name__ == "__main__":
+    main()
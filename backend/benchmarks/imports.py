@@ -0,0 +1,73 @@
+"""Measure project import throughput in rows per second.
+
+Run from ``backend/``::
+
+    BENCH_DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.imports
+
+Generates a CSV file with one invalid row in a hundred and imports it
+through the service, write hooks included. PostgreSQL loads with ``COPY``;
+without ``BENCH_DATABASE_URL`` an in-memory SQLite database and batched
+inserts are used. The schema is created and dropped by the script, so
+point it at a scratch database.
+"""
+import argparse
+import csv
+import io
+import time
+
+from sqlalchemy.orm import Session
+
+from app.models.project import Category, ProjectStatus, Region
+from app.models.user import User, UserRole
+from app.services import imports as import_service
+from benchmarks.common import create_schema, drop_schema, make_engine
+
+
+def _csv(rows: int) -> bytes:
+    regions, statuses, categories = list(Region), list(ProjectStatus), list(Category)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["region", "request_date", "city", "salesperson_name", "brand_name",
+                     "category", "status"])
+    for i in range(rows):
+        writer.writerow([
+            "Nowhere" if i % 100 == 99 else regions[i % len(regions)].value,
+            f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            f"City {i % 500}",
+            f"Salesperson {i % 3000}",
+            f"Brand {i % 50000}",
+            categories[i % len(categories)].value,
+            statuses[i % len(statuses)].value,
+        ])
+    return buffer.getvalue().encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=import_service.BATCH_SIZE)
+    args = parser.parse_args()
+
+    content = _csv(args.rows)
+    engine = make_engine()
+    create_schema(engine)
+    try:
+        with Session(bind=engine) as db:
+            user = User(email="bench@test.com", hashed_password="x", role=UserRole.marcom)
+            db.add(user)
+            db.commit()
+            start = time.perf_counter()
+            result = import_service.import_projects(
+                db, io.BytesIO(content), "bench.csv", user, args.batch_size
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        drop_schema(engine)
+
+    print(f"{args.rows} rows on {engine.dialect.name}, batches of {args.batch_size}")
+    print(f"imported {result['imported']}, failed {result['failed']}")
+    print(f"{elapsed:.2f} s, {args.rows / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
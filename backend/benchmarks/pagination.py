@@ -0,0 +1,74 @@
+"""Compare OFFSET and cursor pagination latency on deep pages of ``GET /projects``.
+
+Run from ``backend/``::
+
+    python -m benchmarks.pagination
+    BENCH_DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.pagination --rows 500000
+
+Without ``BENCH_DATABASE_URL`` an in-memory SQLite database is used. The
+schema is created and dropped by the script, so point it at a scratch
+database.
+"""
+import argparse
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.project import Project
+from app.services import projects as project_service
+from benchmarks.common import create_schema, drop_schema, make_engine, seed, timed
+
+PER_PAGE = 20
+PAGES = [1, 10, 100, 1_000, 10_000]
+
+
+def cursor_before_page(db: Session, page: int) -> str:
+    """The cursor a client would hold after walking to ``page - 1``."""
+    last = db.execute(
+        select(project_service._RAW_CREATED_AT, Project.id)
+        .order_by(Project.created_at.desc(), Project.id.desc())
+        .offset((page - 1) * PER_PAGE - 1)
+        .limit(1)
+    ).one()
+    return project_service.encode_cursor(last.raw_created_at, last.id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=max(PAGES) * PER_PAGE)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    create_schema(engine)
+    try:
+        with Session(bind=engine) as db:
+            seed(db, args.rows)
+            print(f"{args.rows} projects, {PER_PAGE} per page, median of {args.repeat} runs\n")
+            print(f"{'page':>8}  {'offset ms':>10}  {'cursor ms':>10}")
+            for page in PAGES:
+                if (page - 1) * PER_PAGE >= args.rows:
+                    break
+                by_offset = timed(
+                    lambda: project_service.get_projects(db, page=page, per_page=PER_PAGE),
+                    args.repeat,
+                )
+                if page == 1:
+                    by_cursor = timed(
+                        lambda: project_service.get_projects(db, per_page=PER_PAGE), args.repeat
+                    )
+                else:
+                    cursor = cursor_before_page(db, page)
+                    by_cursor = timed(
+                        lambda: project_service.get_projects(
+                            db, per_page=PER_PAGE, cursor=cursor
+                        ),
+                        args.repeat,
+                    )
+                print(f"{page:>8}  {by_offset:>10.2f}  {by_cursor:>10.2f}")
+    finally:
+        drop_schema(engine)
+
+
+if __name__ == "__main__":
+    main()
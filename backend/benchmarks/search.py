@@ -0,0 +1,55 @@
+"""Time project search (``q=``) and the brand/salesperson filters on many rows.
+
+Run from ``backend/``::
+
+    BENCH_DATABASE_URL=postgresql+psycopg2://... python -m benchmarks.search
+
+The default is one million rows. On PostgreSQL the searches are served by
+the pg_trgm GIN indexes; on the in-memory SQLite fallback (no
+``BENCH_DATABASE_URL``) every search is a full scan, which is the baseline
+the indexes are measured against. The schema is created and dropped by the
+script, so point it at a scratch database.
+"""
+import argparse
+
+from sqlalchemy.orm import Session
+
+from app.services import projects as project_service
+from benchmarks.common import create_schema, drop_schema, make_engine, seed, timed
+
+# (label, get_projects keyword arguments)
+CASES = [
+    ("q, rare brand", {"q": "Brand 41873"}),
+    ("q, common city", {"q": "City 17"}),
+    ("q, typo", {"q": "Salesperon 2204"}),
+    ("brand filter", {"brand": "Brand 41873"}),
+    ("salesperson filter", {"salesperson": "Salesperson 2204"}),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    create_schema(engine)
+    try:
+        with Session(bind=engine) as db:
+            seed(db, args.rows)
+            print(f"{args.rows} projects on {engine.dialect.name}, median of {args.repeat} runs\n")
+            print(f"{'search':<22}  {'ms':>8}  {'matches':>8}")
+            for label, kwargs in CASES:
+                result = project_service.get_projects(db, include_total=False, **kwargs)
+                ms = timed(
+                    lambda: project_service.get_projects(db, include_total=False, **kwargs),
+                    args.repeat,
+                )
+                print(f"{label:<22}  {ms:>8.2f}  {len(result['items']):>8}")
+    finally:
+        drop_schema(engine)
+
+
+if __name__ == "__main__":
+    main()
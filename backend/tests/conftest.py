@@ -1,12 +1,17 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.database import Base, get_db
 from app.main import app
 from app.models.user import UserRole
+from app.services.cache import dashboard_cache, dashboard_flight
+from app.services.dashboard import project_snapshot
+from app.services.export_jobs import export_jobs
+from app.services.live import metrics_hub
+from app.services.suggestions import suggestion_index
 
 SQLALCHEMY_TEST_URL = "sqlite://"
 
@@ -21,7 +26,14 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 @pytest.fixture(autouse=True)
 def setup_db():
     Base.metadata.create_all(bind=engine)
+    dashboard_cache.clear()
+    dashboard_flight.clear()
+    metrics_hub.clear()
+    suggestion_index.clear()
+    if project_snapshot is not None:
+        project_snapshot.clear()
     yield
+    export_jobs.clear()
     Base.metadata.drop_all(bind=engine)
 
 
@@ -34,6 +46,18 @@ def db():
         session.close()
 
 
+@pytest.fixture()
+def query_counter():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture()
 def client(db):
     def override_get_db():
@@ -106,3 +130,18 @@ def management_token(client, management_user):
 
 def auth_header(token: str) -> dict:
     return {"Authorization": f"Bearer {token}"}
+
+
+SAMPLE_PROJECT = {
+    "region": "TN",
+    "request_date": "2026-02-15",
+    "city": "Chennai",
+    "salesperson_name": "John Doe",
+    "brand_name": "Acme Corp",
+    "category": "FMCG",
+}
+
+
+def create_project(client, token, **overrides):
+    data = {**SAMPLE_PROJECT, **overrides}
+    return client.post("/api/v1/projects/", json=data, headers=auth_header(token))
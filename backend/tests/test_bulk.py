@@ -0,0 +1,119 @@
+import pytest
+
+from app.models.project import Project
+from app.schemas.dashboard import SliceDimension
+from app.services import dashboard as dashboard_service
+from app.services import projects as project_service
+from app.services import rollups as rollup_service
+from tests.conftest import SAMPLE_PROJECT, auth_header, create_project
+
+
+def bulk(client, token, body, **params):
+    return client.post(
+        "/api/v1/projects/bulk", json=body, params=params, headers=auth_header(token)
+    )
+
+
+class TestBulkWrite:
+    def test_create_update_delete(self, client, db, marcom_token):
+        keep = create_project(client, marcom_token, brand_name="Keep").json()["id"]
+        gone = create_project(client, marcom_token, brand_name="Gone").json()["id"]
+        resp = bulk(client, marcom_token, {
+            "create": [
+                {**SAMPLE_PROJECT, "brand_name": f"New {i}", "status": "Deck Shared"}
+                for i in range(5)
+            ],
+            "update": [{"id": keep, "status": "Client approved", "city": "Madurai"}],
+            "delete": [gone],
+        }, chunk_size=2)
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert (data["created"], data["updated"], data["deleted"]) == (5, 1, 1)
+        created = [r["id"] for r in data["results"] if r["operation"] == "create"]
+        assert len(set(created)) == 5
+        assert all(r["error"] is None for r in data["results"])
+
+        projects = {p.id: p for p in db.query(Project)}
+        assert gone not in projects
+        assert [projects[i].brand_name for i in created] == [f"New {i}" for i in range(5)]
+        assert projects[keep].city == "Madurai"
+        assert projects[keep].updated_at is not None
+        assert projects[keep].version == 2
+        assert rollup_service.find_discrepancies(db) == []
+
+    def test_invalid_items_are_reported_and_skipped(self, client, marcom_token):
+        existing = create_project(client, marcom_token).json()["id"]
+        twice = create_project(client, marcom_token).json()["id"]
+        resp = bulk(client, marcom_token, {
+            "create": [SAMPLE_PROJECT],
+            "update": [{"id": 9999, "city": "Nowhere"}, {"id": twice, "city": "Ooty"}],
+            "delete": [twice, existing],
+        })
+        data = resp.json()
+        assert (data["created"], data["updated"], data["deleted"]) == (1, 0, 1)
+        errors = {(r["operation"], r["index"]): r["error"] for r in data["results"] if r["error"]}
+        assert errors == {
+            ("update", 0): "Project not found",
+            ("update", 1): "Project appears more than once in the batch",
+            ("delete", 0): "Project appears more than once in the batch",
+        }
+        resp = client.get(f"/api/v1/projects/{twice}", headers=auth_header(marcom_token))
+        assert resp.json()["city"] == "Chennai"
+
+    def test_null_for_required_field_is_reported(self, client, marcom_token):
+        project_id = create_project(client, marcom_token).json()["id"]
+        other = create_project(client, marcom_token).json()["id"]
+        resp = bulk(client, marcom_token, {
+            "update": [
+                {"id": project_id, "city": None, "status": None},
+                {"id": other, "city": "Ooty"},
+            ],
+        })
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["updated"] == 1
+        assert data["results"][0]["error"] == "Cannot be null: city, status"
+        resp = client.get(f"/api/v1/projects/{project_id}", headers=auth_header(marcom_token))
+        assert resp.json()["city"] == "Chennai"
+
+    def test_status_changes_recorded(self, client, marcom_token, management_token):
+        project_id = create_project(client, marcom_token).json()["id"]
+        bulk(client, marcom_token, {"update": [{"id": project_id, "status": "Deck Shared"}]})
+        resp = client.get("/api/v1/dashboard/funnel", headers=auth_header(management_token))
+        stages = {s["status"]: s["projects"] for s in resp.json()}
+        assert stages["Deck Shared"] == 1
+
+    def test_dashboard_snapshot_sees_bulk_writes(self, client, db, marcom_token):
+        pytest.importorskip("numpy")
+        ids = [
+            create_project(client, marcom_token, brand_name=f"B{i}").json()["id"] for i in range(4)
+        ]
+        snapshot = dashboard_service.ProjectSnapshot()
+        filters = {dimension: None for dimension in SliceDimension}
+        snapshot.slice(db, None, None, filters, None)
+
+        bulk(client, marcom_token, {
+            "create": [{**SAMPLE_PROJECT, "region": "Delhi"}],
+            "update": [{"id": ids[0], "status": "Video approved", "region": "Kerala"}],
+            "delete": [ids[1]],
+        })
+        for group_by in SliceDimension:
+            expected = dashboard_service._slice_sql(db, None, None, filters, group_by)
+            assert snapshot.slice(db, None, None, filters, group_by) == expected
+
+    def test_invalid_payload_rejected_before_writing(self, client, db, marcom_token):
+        resp = bulk(client, marcom_token, {
+            "create": [SAMPLE_PROJECT, {**SAMPLE_PROJECT, "region": "Atlantis"}],
+        })
+        assert resp.status_code == 422
+        assert resp.json()["detail"][0]["loc"][:3] == ["body", "create", 1]
+        assert db.query(Project).count() == 0
+
+    def test_item_limit(self, client, marcom_token, monkeypatch):
+        monkeypatch.setattr(project_service.settings, "BULK_MAX_ITEMS", 2)
+        resp = bulk(client, marcom_token, {"create": [SAMPLE_PROJECT] * 3})
+        assert resp.status_code == 400
+
+    def test_requires_marcom(self, client, sales_token):
+        resp = bulk(client, sales_token, {"create": [SAMPLE_PROJECT]})
+        assert resp.status_code == 403
@@ -0,0 +1,185 @@
+import threading
+import time
+
+from app.schemas.project import ProjectCreate
+from app.services import etags as etag_service
+from app.services import projects as project_service
+from app.services.cache import VersionedLRUCache, cached, dashboard_cache, dashboard_flight
+from app.services.singleflight import SingleFlight
+from tests.conftest import SAMPLE_PROJECT, TestingSessionLocal, auth_header
+
+
+class TestVersionedLRUCache:
+    def test_hit_and_miss(self):
+        cache = VersionedLRUCache(max_entries=4, ttl_seconds=60)
+        cache.get("a", 1)
+        cache.set("a", 1, 1)
+        assert cache.get("a", 1) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self):
+        cache = VersionedLRUCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1, 1)
+        cache.set("b", 2, 1)
+        cache.get("a", 1)
+        cache.set("c", 3, 1)
+
+        assert cache.get("a", 1) == 1
+        assert cache.get("c", 1) == 3
+        assert cache.get("b", 1) != 2
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        cache = VersionedLRUCache(max_entries=2, ttl_seconds=0.01)
+        cache.set("a", 1, 1)
+        time.sleep(0.02)
+        assert cache.get("a", 1) != 1
+        assert cache.stats()["expirations"] == 1
+
+    def test_newer_version_invalidates(self):
+        cache = VersionedLRUCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1, 1)
+        assert cache.get("a", 2) != 1
+        assert cache.stats()["entries"] == 0
+
+    def test_set_ignores_stale_version(self):
+        cache = VersionedLRUCache(max_entries=2, ttl_seconds=60)
+        cache.get("a", 2)
+        cache.set("a", 1, 1)
+        assert cache.stats()["entries"] == 0
+
+    def test_reader_behind_a_write_keeps_the_newer_entry(self):
+        cache = VersionedLRUCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 2, 2)
+        assert cache.get("a", 1) != 2
+        assert cache.get("a", 2) == 2
+
+
+class TestDashboardCache:
+    def test_repeat_request_hits_cache(self, client, management_token, query_counter):
+        headers = auth_header(management_token)
+        client.get("/api/v1/dashboard/metrics?start_date=2026-01-01", headers=headers)
+        query_counter.clear()
+        client.get("/api/v1/dashboard/videos-approved?start_date=2026-01-01", headers=headers)
+
+        # Only the user lookup and the data version (ETag, then cache) reach the database.
+        assert len(query_counter) == 3
+        assert dashboard_cache.stats()["hits"] == 1
+
+    def test_write_invalidates(self, client, marcom_token, management_token):
+        headers = auth_header(management_token)
+        assert client.get("/api/v1/dashboard/metrics", headers=headers).json()["total_projects"] == 0
+
+        client.post("/api/v1/projects/", json=SAMPLE_PROJECT, headers=auth_header(marcom_token))
+        assert client.get("/api/v1/dashboard/metrics", headers=headers).json()["total_projects"] == 1
+
+    def test_write_from_another_process_invalidates(
+        self, client, marcom_user, management_token, monkeypatch
+    ):
+        headers = auth_header(management_token)
+        assert client.get("/api/v1/dashboard/metrics", headers=headers).json()["total_projects"] == 0
+
+        # Another worker or the CLI: nothing in this process hears about the write.
+        monkeypatch.setattr(project_service, "_after_commit", lambda *args: None)
+        with TestingSessionLocal() as other:
+            row = ProjectCreate(**SAMPLE_PROJECT).model_dump()
+            project_service.load_projects(other, [{**row, "user_id": marcom_user["id"]}])
+        assert client.get("/api/v1/dashboard/metrics", headers=headers).json()["total_projects"] == 1
+
+    def test_cache_stats_endpoint(self, client, management_token, sales_token):
+        resp = client.get("/api/v1/dashboard/cache-stats", headers=auth_header(management_token))
+        assert resp.status_code == 200
+        assert set(resp.json()) >= {"hits", "misses", "evictions", "data_version", "collapsed"}
+
+        resp = client.get("/api/v1/dashboard/cache-stats", headers=auth_header(sales_token))
+        assert resp.status_code == 403
+
+
+class TestSingleFlight:
+    def _run_concurrently(self, flight, func, callers):
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(flight.do("key", func))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for t in threads:
+            t.start()
+        return threads, results, errors
+
+    def test_concurrent_calls_share_one_computation(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return 42
+
+        threads, results, errors = self._run_concurrently(flight, compute, 5)
+        while flight.stats()["collapsed"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert calls == [1]
+        assert results == [42] * 5
+        assert flight.stats() == {"in_flight": 0, "computations": 1, "collapsed": 4}
+
+    def test_errors_reach_every_waiter(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def compute():
+            release.wait(5)
+            raise ValueError("boom")
+
+        threads, results, errors = self._run_concurrently(flight, compute, 3)
+        while flight.stats()["collapsed"] < 2:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert results == []
+        assert len(errors) == 3
+        assert all(isinstance(e, ValueError) for e in errors)
+
+    def test_sequential_calls_recompute(self):
+        flight = SingleFlight()
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+        assert flight.stats()["collapsed"] == 0
+
+    def test_write_starts_a_new_flight(self, db):
+        release = threading.Event()
+        calls = []
+
+        @cached("flight_test")
+        def compute(db):
+            calls.append(1)
+            call = len(calls)
+            if call == 1:
+                release.wait(5)
+            return call
+
+        before_write = []
+        thread = threading.Thread(target=lambda: before_write.append(compute(db)))
+        thread.start()
+        while dashboard_flight.stats()["in_flight"] == 0:
+            time.sleep(0.001)
+        etag_service.bump(db)
+        db.commit()
+
+        # Does not wait on, or share, the computation that began before the write.
+        assert compute(db) == 2
+        release.set()
+        thread.join()
+        assert before_write == [1]
+        assert compute(db) == 2
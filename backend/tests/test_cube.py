@@ -0,0 +1,155 @@
+from collections import Counter
+from datetime import date, timedelta
+
+from app.models.stats import ProjectMonthlyCube
+from app.schemas.dashboard import CubeDimension
+from app.services import dashboard as dashboard_service
+from app.services import rollups as rollup_service
+from tests.conftest import auth_header, create_project
+
+
+def seed(client, token):
+    """Projects every fifth day from mid-December to the end of April."""
+    projects = []
+    day = date(2025, 12, 14)
+    for i in range(28):
+        data = {
+            "region": ["TN", "Kerala", "Delhi"][i % 3],
+            "category": "FMCG" if i % 2 else "Industrial Goods",
+            "status": ["Client approved", "Video approved", "Campaign signed up"][i % 3],
+            "salesperson_name": f"Rep {i % 4}",
+            "request_date": day.isoformat(),
+        }
+        resp = create_project(client, token, **data)
+        projects.append({**data, "id": resp.json()["id"]})
+        day += timedelta(days=5)
+    return projects
+
+
+def expected_counts(projects, start_date, end_date, group_by, **filters):
+    counts = Counter()
+    for p in projects:
+        day = date.fromisoformat(p["request_date"])
+        if (start_date and day < start_date) or (end_date and day > end_date):
+            continue
+        if any(values and p[field] not in values for field, values in filters.items()):
+            continue
+        key = tuple(
+            day.replace(day=1).isoformat() if d == "month" else
+            p["salesperson_name"] if d == "salesperson" else p[d]
+            for d in group_by
+        )
+        counts[key] += 1
+    return counts
+
+
+def actual_counts(response, group_by):
+    counts = Counter()
+    for row in response["rows"]:
+        counts[tuple(row[d] for d in group_by)] += row["projects"]
+    return counts
+
+
+class TestCubeMonths:
+    def test_whole_months_need_no_edges(self):
+        first, stop, use_cube, edges = dashboard_service._cube_months(
+            date(2026, 1, 1), date(2026, 3, 31)
+        )
+        assert (first, stop, use_cube, edges) == (date(2026, 1, 1), date(2026, 4, 1), True, [])
+
+    def test_partial_months_become_edges(self):
+        first, stop, use_cube, edges = dashboard_service._cube_months(
+            date(2026, 1, 10), date(2026, 3, 5)
+        )
+        assert (first, stop, use_cube) == (date(2026, 2, 1), date(2026, 3, 1), True)
+        assert edges == [
+            (date(2026, 1, 10), date(2026, 1, 31)),
+            (date(2026, 3, 1), date(2026, 3, 5)),
+        ]
+
+    def test_range_within_one_month_reads_raw_rows_only(self):
+        _, _, use_cube, edges = dashboard_service._cube_months(date(2026, 2, 3), date(2026, 2, 20))
+        assert not use_cube
+        assert edges == [(date(2026, 2, 3), date(2026, 2, 20))]
+
+    def test_open_bounds(self):
+        assert dashboard_service._cube_months(None, None) == (None, None, True, [])
+        first, stop, _, edges = dashboard_service._cube_months(None, date(2026, 2, 10))
+        assert (first, stop) == (None, date(2026, 2, 1))
+        assert edges == [(date(2026, 2, 1), date(2026, 2, 10))]
+
+
+class TestCubeQuery:
+    CASES = [
+        (None, None, ["month"], {}),
+        (date(2026, 1, 10), date(2026, 3, 5), ["month", "region"], {}),
+        (date(2026, 1, 1), date(2026, 2, 28), ["status"], {"region": ["TN", "Delhi"]}),
+        (date(2026, 2, 3), date(2026, 2, 20), ["salesperson", "category"], {}),
+        (None, date(2026, 3, 17), [], {"category": ["FMCG"], "salesperson_name": ["Rep 1"]}),
+    ]
+
+    def _query(self, client, token, start_date, end_date, group_by, filters):
+        params = [("group_by", d) for d in group_by]
+        if start_date:
+            params.append(("start_date", start_date.isoformat()))
+        if end_date:
+            params.append(("end_date", end_date.isoformat()))
+        for field, values in filters.items():
+            name = "salesperson" if field == "salesperson_name" else field
+            params.extend((name, v) for v in values)
+        resp = client.get("/api/v1/dashboard/query", params=params, headers=auth_header(token))
+        assert resp.status_code == 200
+        return resp.json()
+
+    def test_matches_raw_rows(self, client, marcom_token, management_token):
+        projects = seed(client, marcom_token)
+        for start_date, end_date, group_by, filters in self.CASES:
+            data = self._query(client, management_token, start_date, end_date, group_by, filters)
+            expected = expected_counts(projects, start_date, end_date, group_by, **filters)
+            assert actual_counts(data, group_by) == expected, (start_date, end_date, group_by)
+            assert data["total"] == sum(expected.values())
+
+    def test_maintained_on_writes(self, client, db, marcom_token, management_token):
+        projects = seed(client, marcom_token)
+        headers = auth_header(marcom_token)
+        client.put(
+            f"/api/v1/projects/{projects[0]['id']}",
+            json={"request_date": "2026-03-02", "salesperson_name": "Rep 9"},
+            headers=headers,
+        )
+        projects[0].update(request_date="2026-03-02", salesperson_name="Rep 9")
+        client.delete(f"/api/v1/projects/{projects[1]['id']}", headers=headers)
+        del projects[1]
+
+        assert rollup_service.find_discrepancies(db) == []
+        data = self._query(client, management_token, None, None, ["month", "salesperson"], {})
+        assert actual_counts(data, ["month", "salesperson"]) == expected_counts(
+            projects, None, None, ["month", "salesperson"]
+        )
+
+    def test_whole_months_read_only_the_cube(self, client, db, marcom_token, query_counter):
+        seed(client, marcom_token)
+        query_counter.clear()
+        dashboard_service.query_cube.__wrapped__(
+            db, date(2026, 1, 1), date(2026, 3, 31), group_by=[CubeDimension.region]
+        )
+        assert len(query_counter) == 1
+        assert "project_monthly_cube" in query_counter[0]
+        assert " projects" not in query_counter[0]
+
+    def test_rebuild_matches_maintained_cube(self, client, db, marcom_token):
+        seed(client, marcom_token)
+        maintained = {
+            (r.month, r.region, r.category, r.status, r.salesperson_name): r.project_count
+            for r in db.query(ProjectMonthlyCube)
+        }
+        rollup_service.rebuild(db)
+        rebuilt = {
+            (r.month, r.region, r.category, r.status, r.salesperson_name): r.project_count
+            for r in db.query(ProjectMonthlyCube)
+        }
+        assert rebuilt == maintained
+
+    def test_requires_management(self, client, sales_token):
+        resp = client.get("/api/v1/dashboard/query", headers=auth_header(sales_token))
+        assert resp.status_code == 403
@@ -1,19 +1,7 @@
-from tests.conftest import auth_header
+from datetime import date
 
-
-SAMPLE_PROJECT = {
-    "region": "TN",
-    "request_date": "2026-02-15",
-    "city": "Chennai",
-    "salesperson_name": "John Doe",
-    "brand_name": "Acme Corp",
-    "category": "FMCG",
-}
-
-
-def create_project(client, token, **overrides):
-    data = {**SAMPLE_PROJECT, **overrides}
-    return client.post("/api/v1/projects/", json=data, headers=auth_header(token))
+from app.services import dashboard as dashboard_service
+from tests.conftest import auth_header, create_project
 
 
 class TestDashboardMetrics:
@@ -54,6 +42,34 @@ class TestDashboardMetrics:
         assert regions["TN"] == 2
         assert regions["Kerala"] == 1
 
+    def test_metrics_date_filter(self, client, marcom_token, management_token):
+        create_project(client, marcom_token, brand_name="A", request_date="2026-01-10")
+        create_project(client, marcom_token, brand_name="B", request_date="2026-02-10",
+                       status="Campaign signed up")
+
+        resp = client.get(
+            "/api/v1/dashboard/metrics?start_date=2026-02-01&end_date=2026-02-28",
+            headers=auth_header(management_token),
+        )
+        data = resp.json()
+        assert data["total_projects"] == 1
+        assert data["campaigns_completed"] == 1
+        assert data["campaigns_by_region"] == [{"region": "TN", "count": 1}]
+
+    def test_metrics_single_query(self, client, db, marcom_token, query_counter):
+        create_project(client, marcom_token, brand_name="A", region="TN", status="Client approved")
+        create_project(client, marcom_token, brand_name="B", region="Kerala", status="Campaign signed up")
+        query_counter.clear()
+
+        # Unwrapped: the cache's data version lookup is not part of the aggregate.
+        metrics = dashboard_service.get_metrics.__wrapped__(
+            db, date(2026, 1, 1), date(2026, 12, 31)
+        )
+        assert len(query_counter) == 1
+        assert metrics.total_projects == 2
+        assert metrics.briefs_approved == 1
+        assert [(r.region, r.count) for r in metrics.campaigns_by_region] == [("Kerala", 1)]
+
     def test_metrics_forbidden_marcom(self, client, marcom_token):
         resp = client.get("/api/v1/dashboard/metrics", headers=auth_header(marcom_token))
         assert resp.status_code == 403
@@ -111,3 +127,121 @@ class TestDashboardIndividualEndpoints:
         for ep in endpoints:
             resp = client.get(ep, headers=auth_header(sales_token))
             assert resp.status_code == 403, f"Expected 403 for {ep}"
+
+
+class TestDashboardSeries:
+    def test_series_by_day_zero_fills(self, client, marcom_token, management_token):
+        create_project(client, marcom_token, brand_name="A", request_date="2026-02-01")
+        create_project(client, marcom_token, brand_name="B", request_date="2026-02-03",
+                       status="Video approved")
+
+        resp = client.get(
+            "/api/v1/dashboard/series?bucket=day&start_date=2026-01-31&end_date=2026-02-04",
+            headers=auth_header(management_token),
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [b["bucket_start"] for b in data] == [
+            "2026-01-31", "2026-02-01", "2026-02-02", "2026-02-03", "2026-02-04",
+        ]
+        assert [b["total_projects"] for b in data] == [0, 1, 0, 1, 0]
+        assert data[3]["videos_approved"] == 1
+        assert data[3]["videos_generated"] == 1
+
+    def test_series_by_week(self, client, marcom_token, management_token):
+        # 2026-02-02 is a Monday
+        create_project(client, marcom_token, brand_name="A", request_date="2026-02-02")
+        create_project(client, marcom_token, brand_name="A", request_date="2026-02-08")
+        create_project(client, marcom_token, brand_name="B", request_date="2026-02-09")
+
+        resp = client.get(
+            "/api/v1/dashboard/series?bucket=week", headers=auth_header(management_token)
+        )
+        data = resp.json()
+        assert [(b["bucket_start"], b["total_projects"]) for b in data] == [
+            ("2026-02-02", 2), ("2026-02-09", 1),
+        ]
+        assert data[0]["clients_by_region"] == [{"region": "TN", "count": 1}]
+
+    def test_series_by_month(self, client, marcom_token, management_token):
+        create_project(client, marcom_token, brand_name="A", request_date="2026-01-20")
+        create_project(client, marcom_token, brand_name="B", request_date="2026-03-05",
+                       region="Kerala", status="Campaign signed up")
+
+        resp = client.get(
+            "/api/v1/dashboard/series?bucket=month", headers=auth_header(management_token)
+        )
+        data = resp.json()
+        assert [(b["bucket_start"], b["total_projects"]) for b in data] == [
+            ("2026-01-01", 1), ("2026-02-01", 0), ("2026-03-01", 1),
+        ]
+        assert data[2]["campaigns_by_region"] == [{"region": "Kerala", "count": 1}]
+
+    def test_series_invalid_bucket(self, client, management_token):
+        resp = client.get(
+            "/api/v1/dashboard/series?bucket=year", headers=auth_header(management_token)
+        )
+        assert resp.status_code == 422
+
+    def test_series_forbidden_sales(self, client, sales_token):
+        resp = client.get("/api/v1/dashboard/series", headers=auth_header(sales_token))
+        assert resp.status_code == 403
+
+
+class TestDashboardBatch:
+    def test_batch_matches_single_range_metrics(
+        self, client, db, marcom_token, management_token, query_counter
+    ):
+        create_project(client, marcom_token, brand_name="A", request_date="2026-01-10")
+        create_project(client, marcom_token, brand_name="B", request_date="2026-02-10",
+                       status="Campaign signed up")
+        create_project(client, marcom_token, brand_name="B", request_date="2025-02-10",
+                       region="Kerala", status="Video approved")
+        ranges = [
+            ("2026-02-01", "2026-02-28"),
+            ("2026-01-01", "2026-01-31"),
+            ("2025-02-01", "2025-02-28"),
+            ("2024-01-01", "2024-12-31"),
+            (None, None),
+        ]
+        query_counter.clear()
+
+        metrics = dashboard_service.get_metrics_batch(
+            db, [(date.fromisoformat(s) if s else None, date.fromisoformat(e) if e else None)
+                 for s, e in ranges]
+        )
+        assert len(query_counter) == 1
+
+        headers = auth_header(management_token)
+        for (start, end), batched in zip(ranges, metrics):
+            params = {k: v for k, v in (("start_date", start), ("end_date", end)) if v}
+            single = client.get("/api/v1/dashboard/metrics", params=params, headers=headers)
+            assert batched.model_dump() == single.json()
+        assert metrics[3].total_projects == 0
+        assert metrics[4].total_projects == 3
+
+    def test_batch_endpoint(self, client, marcom_token, management_token):
+        create_project(client, marcom_token, brand_name="A", request_date="2026-01-10")
+        resp = client.post(
+            "/api/v1/dashboard/metrics/batch",
+            json={"ranges": [{"start_date": "2026-01-01"}, {"end_date": "2025-12-31"}]},
+            headers=auth_header(management_token),
+        )
+        assert resp.status_code == 200
+        assert [m["total_projects"] for m in resp.json()] == [1, 0]
+
+    def test_batch_validation(self, client, management_token):
+        resp = client.post(
+            "/api/v1/dashboard/metrics/batch",
+            json={"ranges": []},
+            headers=auth_header(management_token),
+        )
+        assert resp.status_code == 422
+
+    def test_batch_forbidden_sales(self, client, sales_token):
+        resp = client.post(
+            "/api/v1/dashboard/metrics/batch",
+            json={"ranges": [{}]},
+            headers=auth_header(sales_token),
+        )
+        assert resp.status_code == 403
@@ -0,0 +1,89 @@
+from tests.conftest import auth_header, create_project
+
+
+class TestDashboardETags:
+    def test_matching_etag_returns_304_without_aggregation(
+        self, client, management_token, query_counter
+    ):
+        headers = auth_header(management_token)
+        resp = client.get("/api/v1/dashboard/metrics", headers=headers)
+        etag = resp.headers["etag"]
+        assert etag.startswith('"')
+
+        query_counter.clear()
+        resp = client.get(
+            "/api/v1/dashboard/metrics", headers={**headers, "If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+        # User lookup and data version only.
+        assert len(query_counter) == 2
+
+    def test_etag_changes_on_write(self, client, marcom_token, management_token):
+        headers = auth_header(management_token)
+        etag = client.get("/api/v1/dashboard/metrics", headers=headers).headers["etag"]
+
+        create_project(client, marcom_token)
+        resp = client.get(
+            "/api/v1/dashboard/metrics", headers={**headers, "If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        assert resp.json()["total_projects"] == 1
+
+    def test_etag_depends_on_filters(self, client, management_token):
+        headers = auth_header(management_token)
+        a = client.get("/api/v1/dashboard/metrics?start_date=2026-01-01", headers=headers)
+        b = client.get("/api/v1/dashboard/metrics?start_date=2026-02-01", headers=headers)
+        c = client.get("/api/v1/dashboard/videos-approved?start_date=2026-01-01", headers=headers)
+        assert len({a.headers["etag"], b.headers["etag"], c.headers["etag"]}) == 3
+
+    def test_series_has_etag(self, client, management_token):
+        headers = auth_header(management_token)
+        etag = client.get("/api/v1/dashboard/series", headers=headers).headers["etag"]
+        resp = client.get("/api/v1/dashboard/series", headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 304
+
+    def test_auth_checked_before_etag(self, client, sales_token, management_token):
+        etag = client.get(
+            "/api/v1/dashboard/metrics", headers=auth_header(management_token)
+        ).headers["etag"]
+        resp = client.get(
+            "/api/v1/dashboard/metrics",
+            headers={**auth_header(sales_token), "If-None-Match": etag},
+        )
+        assert resp.status_code == 403
+
+
+class TestProjectETags:
+    def test_list_and_detail_304(self, client, marcom_token):
+        headers = auth_header(marcom_token)
+        pid = create_project(client, marcom_token).json()["id"]
+
+        for url in ("/api/v1/projects/?region=TN", f"/api/v1/projects/{pid}"):
+            etag = client.get(url, headers=headers).headers["etag"]
+            resp = client.get(url, headers={**headers, "If-None-Match": etag})
+            assert resp.status_code == 304, url
+
+    def test_detail_304_reads_only_the_version(self, client, marcom_token, query_counter):
+        headers = auth_header(marcom_token)
+        pid = create_project(client, marcom_token).json()["id"]
+        etag = client.get(f"/api/v1/projects/{pid}", headers=headers).headers["etag"]
+
+        query_counter.clear()
+        resp = client.get(f"/api/v1/projects/{pid}", headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 304
+        reads = [s for s in query_counter if "FROM projects" in s]
+        assert len(reads) == 1
+        assert "projects.city" not in reads[0]
+
+    def test_update_invalidates_detail(self, client, marcom_token):
+        headers = auth_header(marcom_token)
+        pid = create_project(client, marcom_token).json()["id"]
+        etag = client.get(f"/api/v1/projects/{pid}", headers=headers).headers["etag"]
+
+        client.put(f"/api/v1/projects/{pid}", json={"city": "Madurai"}, headers=headers)
+        resp = client.get(f"/api/v1/projects/{pid}", headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["city"] == "Madurai"
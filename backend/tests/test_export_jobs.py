@@ -0,0 +1,165 @@
+import os
+import threading
+import time
+
+import pytest
+
+from app.services import export_jobs as export_job_service
+from app.services import exports as export_service
+from tests.conftest import auth_header, create_project
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_job_service.settings, "EXPORT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def start(client, token, **data):
+    resp = client.post("/api/v1/projects/exports", json=data, headers=auth_header(token))
+    assert resp.status_code == 202, resp.text
+    return resp.json()["id"]
+
+
+def wait(job_id):
+    job = export_job_service.export_jobs._jobs[job_id]
+    deadline = time.monotonic() + 10
+    while job.status not in export_job_service.FINISHED:
+        assert time.monotonic() < deadline, "export did not finish"
+        time.sleep(0.01)
+    return job
+
+
+class TestExportJobs:
+    def test_writes_file_and_reports_progress(self, client, marcom_token):
+        for brand in ("Acme Corp", "Zenith", "Acme Foods"):
+            create_project(client, marcom_token, brand_name=brand)
+        job_id = start(client, marcom_token, brand="acme", compression="gzip")
+        wait(job_id)
+
+        headers = auth_header(marcom_token)
+        status = client.get(f"/api/v1/projects/exports/{job_id}", headers=headers).json()
+        assert status["status"] == "done"
+        assert status["rows_written"] == status["total_rows"] == 2
+        assert status["filename"] == "projects.csv.gz"
+
+        resp = client.get(f"/api/v1/projects/exports/{job_id}/download", headers=headers)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/gzip"
+        assert "projects.csv.gz" in resp.headers["content-disposition"]
+        assert len(resp.content) == status["bytes_written"]
+
+    def test_range_download_resumes(self, client, marcom_token):
+        for i in range(20):
+            create_project(client, marcom_token, brand_name=f"Brand {i}")
+        job_id = start(client, marcom_token)
+        wait(job_id)
+
+        url = f"/api/v1/projects/exports/{job_id}/download"
+        headers = auth_header(marcom_token)
+        full = client.get(url, headers=headers).content
+        assert client.get(url, headers=headers).headers["accept-ranges"] == "bytes"
+        resp = client.get(url, headers={**headers, "Range": "bytes=100-"})
+        assert resp.status_code == 206
+        assert resp.headers["content-range"] == f"bytes 100-{len(full) - 1}/{len(full)}"
+        assert full[:100] + resp.content == full
+
+    def test_fields(self, client, marcom_token):
+        create_project(client, marcom_token)
+        job = wait(start(client, marcom_token, fields=["brand_name", "city"]))
+        with open(job.path) as f:
+            assert f.read().splitlines() == ["City,Brand", "Chennai,Acme Corp"]
+
+        resp = client.post(
+            "/api/v1/projects/exports",
+            json={"fields": ["version"]},
+            headers=auth_header(marcom_token),
+        )
+        assert resp.status_code == 400
+
+    def test_failed_job(self, client, marcom_token, monkeypatch):
+        def broken(*args, **kwargs):
+            raise RuntimeError("disk on fire")
+
+        monkeypatch.setattr(export_service, "export_projects", broken)
+        job_id = start(client, marcom_token)
+        job = wait(job_id)
+        assert job.status == "failed"
+        assert job.error == "disk on fire"
+
+        resp = client.get(
+            f"/api/v1/projects/exports/{job_id}/download", headers=auth_header(marcom_token)
+        )
+        assert resp.status_code == 409
+
+    def test_only_owner_sees_job(self, client, marcom_token, sales_token):
+        job_id = start(client, marcom_token)
+        wait(job_id)
+        resp = client.get(f"/api/v1/projects/exports/{job_id}", headers=auth_header(sales_token))
+        assert resp.status_code == 404
+
+    def test_pool_is_bounded(self, client, marcom_token, monkeypatch):
+        monkeypatch.setattr(export_job_service.settings, "EXPORT_WORKERS", 1)
+        monkeypatch.setattr(export_job_service.settings, "EXPORT_MAX_QUEUED", 1)
+        release = threading.Event()
+        real_export = export_service.export_projects
+
+        def blocked(*args, **kwargs):
+            release.wait(5)
+            return real_export(*args, **kwargs)
+
+        monkeypatch.setattr(export_service, "export_projects", blocked)
+        first = start(client, marcom_token)
+        second = start(client, marcom_token)
+        resp = client.post(
+            "/api/v1/projects/exports", json={}, headers=auth_header(marcom_token)
+        )
+        assert resp.status_code == 429
+        release.set()
+        assert wait(first).status == wait(second).status == "done"
+
+    def test_missing_package_rejected_up_front(self, client, marcom_token, monkeypatch):
+        monkeypatch.setattr(export_service, "pa", None)
+        resp = client.post(
+            "/api/v1/projects/exports",
+            json={"format": "arrow"},
+            headers=auth_header(marcom_token),
+        )
+        assert resp.status_code == 400
+
+
+class TestGarbageCollection:
+    def _file(self, directory, name, size, age):
+        path = directory / name
+        path.write_bytes(b"x" * size)
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_age_then_budget(self, export_dir, monkeypatch):
+        monkeypatch.setattr(export_job_service.settings, "EXPORT_MAX_AGE_SECONDS", 3600)
+        monkeypatch.setattr(export_job_service.settings, "EXPORT_DISK_BUDGET_BYTES", 250)
+        expired = self._file(export_dir, "a-projects.csv", 10, 7200)
+        oldest = self._file(export_dir, "b-projects.csv", 100, 300)
+        older = self._file(export_dir, "c-projects.csv", 100, 200)
+        newest = self._file(export_dir, "d-projects.csv", 100, 100)
+
+        export_job_service.export_jobs.collect_garbage()
+        assert not expired.exists()
+        assert not oldest.exists()
+        assert older.exists() and newest.exists()
+
+    def test_keeps_active_and_just_finished_files(self, export_dir, monkeypatch):
+        monkeypatch.setattr(export_job_service.settings, "EXPORT_DISK_BUDGET_BYTES", 0)
+        kept = self._file(export_dir, "a-projects.csv", 10, 10)
+        other = self._file(export_dir, "b-projects.csv", 10, 5)
+        export_job_service.export_jobs.collect_garbage(keep="a")
+        assert kept.exists() and not other.exists()
+
+    def test_done_job_without_file_expires(self, client, marcom_token, export_dir):
+        job_id = start(client, marcom_token)
+        job = wait(job_id)
+        os.remove(job.path)
+        export_job_service.export_jobs.collect_garbage()
+        resp = client.get(f"/api/v1/projects/exports/{job_id}", headers=auth_header(marcom_token))
+        assert resp.json()["status"] == "expired"
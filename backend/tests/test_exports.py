@@ -0,0 +1,119 @@
+import gzip
+import io
+import json
+from datetime import date
+
+import pytest
+
+from app.schemas.project import ExportCompression, ExportFormat
+from app.services import exports as export_service
+from tests.conftest import auth_header, create_project
+
+
+def seed(client, token):
+    create_project(client, token, brand_name="Acme Corp", status="Deck Shared")
+    create_project(client, token, brand_name="Zenith", region="Kerala", category="Industrial Goods")
+    create_project(client, token, brand_name="Acme Foods", region="Kerala")
+
+
+def export(client, token, **params):
+    resp = client.get("/api/v1/projects/export", params=params, headers=auth_header(token))
+    assert resp.status_code == 200, resp.text
+    return resp
+
+
+class TestExportFormats:
+    def test_ndjson(self, client, marcom_token):
+        seed(client, marcom_token)
+        resp = export(client, marcom_token, format="ndjson", region="Kerala")
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in resp.text.splitlines()]
+        assert [row["brand_name"] for row in rows] == ["Acme Foods", "Zenith"]
+        assert rows[1]["category"] == "Industrial Goods"
+        assert rows[1]["request_date"] == "2026-02-15"
+
+    def test_gzip(self, client, marcom_token):
+        seed(client, marcom_token)
+        resp = export(client, marcom_token, compression="gzip")
+        assert resp.headers["content-type"] == "application/gzip"
+        assert "projects.csv.gz" in resp.headers["content-disposition"]
+        content = gzip.decompress(resp.content).decode()
+        assert content.splitlines()[1].split(",")[5] == "Acme Foods"
+
+    def test_zstd(self, client, marcom_token):
+        zstandard = pytest.importorskip("zstandard")
+        seed(client, marcom_token)
+        resp = export(client, marcom_token, format="ndjson", compression="zstd")
+        assert "projects.ndjson.zst" in resp.headers["content-disposition"]
+        with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(resp.content)) as reader:
+            lines = reader.read().decode().splitlines()
+        assert len(lines) == 3
+
+    def test_arrow(self, client, marcom_token):
+        pa = pytest.importorskip("pyarrow")
+        seed(client, marcom_token)
+        resp = export(client, marcom_token, format="arrow")
+        table = pa.ipc.open_stream(resp.content).read_all()
+        assert table.num_rows == 3
+        assert pa.types.is_dictionary(table.schema.field("status").type)
+        assert table.column("brand_name").to_pylist() == ["Acme Foods", "Zenith", "Acme Corp"]
+        assert table.column("status").to_pylist()[2] == "Deck Shared"
+        assert table.column("request_date").to_pylist()[0] == date(2026, 2, 15)
+
+    def test_parquet_in_row_groups(self, client, db, marcom_token, monkeypatch):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        for i in range(5):
+            create_project(client, marcom_token, brand_name=f"Brand {i}", region="Delhi")
+        monkeypatch.setattr(export_service, "RECORD_BATCH_SIZE", 2)
+        monkeypatch.setattr(export_service, "PARQUET_ROW_GROUP_SIZE", 4)
+
+        result = export_service.export_projects(db, ExportFormat.parquet, ExportCompression.gzip)
+        assert result.filename == "projects.parquet"
+        parquet = pq.ParquetFile(pa.BufferReader(b"".join(result.chunks)))
+        assert parquet.metadata.num_row_groups == 2
+        assert parquet.metadata.row_group(0).column(0).compression == "GZIP"
+        table = parquet.read()
+        assert table.column("brand_name").to_pylist() == [f"Brand {i}" for i in reversed(range(5))]
+        assert set(table.column("region").to_pylist()) == {"Delhi"}
+
+    def test_fields(self, client, marcom_token):
+        seed(client, marcom_token)
+        resp = export(client, marcom_token, format="ndjson", fields=["status", "brand_name"])
+        rows = [json.loads(line) for line in resp.text.splitlines()]
+        assert rows[2] == {"brand_name": "Acme Corp", "status": "Deck Shared"}
+
+    def test_fields_columnar(self, client, marcom_token):
+        pa = pytest.importorskip("pyarrow")
+        seed(client, marcom_token)
+        resp = export(client, marcom_token, format="arrow", fields=["region", "id"])
+        table = pa.ipc.open_stream(resp.content).read_all()
+        assert table.column_names == ["id", "region"]
+        assert table.column("region").to_pylist() == ["Kerala", "Kerala", "TN"]
+
+    def test_unexported_field(self, client, marcom_token):
+        resp = client.get(
+            "/api/v1/projects/export",
+            params={"fields": "user_id"},
+            headers=auth_header(marcom_token),
+        )
+        assert resp.status_code == 400
+        assert "user_id" in resp.json()["detail"]
+
+    def test_columnar_needs_pyarrow(self, client, marcom_token, monkeypatch):
+        monkeypatch.setattr(export_service, "pa", None)
+        resp = client.get(
+            "/api/v1/projects/export",
+            params={"format": "parquet"},
+            headers=auth_header(marcom_token),
+        )
+        assert resp.status_code == 400
+        assert "pyarrow" in resp.json()["detail"]
+
+    def test_unknown_format(self, client, marcom_token):
+        resp = client.get(
+            "/api/v1/projects/export",
+            params={"format": "xml"},
+            headers=auth_header(marcom_token),
+        )
+        assert resp.status_code == 422
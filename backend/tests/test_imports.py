@@ -0,0 +1,125 @@
+import csv
+import io
+from datetime import date
+
+import pytest
+
+from app import cli
+from app.models.project import Project
+from app.services import imports as import_service
+from app.services import rollups as rollup_service
+from tests.conftest import TestingSessionLocal, auth_header
+
+
+HEADER = "region,request_date,city,salesperson_name,brand_name,category,status\n"
+
+
+def upload(client, token, content: bytes, filename="projects.csv"):
+    return client.post(
+        "/api/v1/projects/import",
+        files={"file": (filename, content)},
+        headers=auth_header(token),
+    )
+
+
+class TestImportEndpoint:
+    def test_valid_rows(self, client, db, marcom_token):
+        content = HEADER + (
+            "TN,2026-02-15,Chennai,John Doe,Acme Corp,FMCG,Deck Shared\n"
+            "Kerala,2026-03-01,Kochi,Jane Roe,Zenith,Industrial Goods,\n"
+        )
+        resp = upload(client, marcom_token, content.encode())
+        assert resp.status_code == 200
+        assert resp.json() == {"rows": 2, "imported": 2, "failed": 0, "errors": []}
+
+        projects = {p.brand_name: p for p in db.query(Project)}
+        assert projects["Acme Corp"].status.value == "Deck Shared"
+        assert projects["Zenith"].status.value == "Brand description generated"
+        assert projects["Zenith"].request_date == date(2026, 3, 1)
+        assert rollup_service.find_discrepancies(db) == []
+
+    def test_row_level_errors(self, client, db, marcom_token):
+        content = HEADER + (
+            "TN,2026-02-15,Chennai,John Doe,Good,FMCG,\n"
+            "Atlantis,2026-02-15,Chennai,John Doe,Bad region,FMCG,\n"
+            "\n"
+            "TN,not a date,Chennai,,Bad date,FMCG,\n"
+            "TN,2026-02-16,Chennai,John Doe,Also good,FMCG,\n"
+        )
+        data = upload(client, marcom_token, content.encode()).json()
+        assert (data["rows"], data["imported"], data["failed"]) == (4, 2, 2)
+        assert [(e["row"], e["field"]) for e in data["errors"]] == [
+            (3, "region"),
+            (5, "request_date"),
+            (5, "salesperson_name"),
+        ]
+        assert {p.brand_name for p in db.query(Project)} == {"Good", "Also good"}
+
+    def test_export_round_trips(self, client, db, marcom_token):
+        upload(client, marcom_token, (HEADER + "TN,2026-02-15,Chennai,A,B,FMCG,\n").encode())
+        exported = client.get("/api/v1/projects/export", headers=auth_header(marcom_token))
+        data = upload(client, marcom_token, exported.content).json()
+        assert data["imported"] == 1
+        assert db.query(Project).filter(Project.brand_name == "B").count() == 2
+
+    def test_batches_are_loaded_separately(self, client, db, marcom_token, monkeypatch):
+        monkeypatch.setattr(import_service, "BATCH_SIZE", 2)
+        rows = "".join(
+            f"{'TN' if i % 2 else 'Delhi'},2026-02-{1 + i:02d},City,Rep {i},Brand {i},FMCG,\n"
+            for i in range(5)
+        )
+        data = upload(client, marcom_token, (HEADER + rows + "XX,,,,,,\n").encode()).json()
+        assert (data["imported"], data["failed"]) == (5, 1)
+        assert data["errors"][0]["row"] == 7
+        assert rollup_service.find_discrepancies(db) == []
+
+    def test_xlsx(self, client, db, marcom_token):
+        openpyxl = pytest.importorskip("openpyxl")
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["Region", "Request Date", "City", "Salesperson", "Brand", "Category"])
+        sheet.append(["Mumbai", date(2026, 1, 5), "Pune", "Sam", "Xlsx Co", "FMCG"])
+        sheet.append(["Mumbai", "soon", "Pune", "Sam", "Late Co", "FMCG"])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+
+        data = upload(client, marcom_token, buffer.getvalue(), "legacy.xlsx").json()
+        assert (data["imported"], data["failed"]) == (1, 1)
+        assert data["errors"][0]["row"] == 3
+        project = db.query(Project).one()
+        assert (project.brand_name, project.request_date) == ("Xlsx Co", date(2026, 1, 5))
+
+    def test_missing_columns(self, client, marcom_token):
+        resp = upload(client, marcom_token, b"region,city\nTN,Chennai\n")
+        assert resp.status_code == 400
+        assert "request_date" in resp.json()["detail"]
+
+    def test_unsupported_file(self, client, marcom_token):
+        resp = upload(client, marcom_token, b"{}", "projects.json")
+        assert resp.status_code == 400
+
+    def test_requires_marcom(self, client, sales_token):
+        resp = upload(client, sales_token, HEADER.encode())
+        assert resp.status_code == 403
+
+
+class TestImportCommand:
+    def test_writes_error_report(self, client, db, marcom_user, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "SessionLocal", TestingSessionLocal)
+        path = tmp_path / "legacy.csv"
+        path.write_text(HEADER + "TN,2026-02-15,Chennai,A,B,FMCG,\nTN,,Chennai,A,C,FMCG,\n")
+        report = tmp_path / "errors.csv"
+
+        status = cli.main([
+            "import-projects", str(path), "--user", "marcom@test.com", "--errors", str(report)
+        ])
+        assert status == 2
+        assert db.query(Project).count() == 1
+        rows = list(csv.DictReader(report.open()))
+        assert [(r["row"], r["field"]) for r in rows] == [("3", "request_date")]
+
+    def test_unknown_user(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "SessionLocal", TestingSessionLocal)
+        path = tmp_path / "legacy.csv"
+        path.write_text(HEADER)
+        assert cli.main(["import-projects", str(path), "--user", "nobody@test.com"]) == 1
@@ -0,0 +1,102 @@
+from collections import Counter
+from datetime import date, timedelta
+
+from app.schemas.dashboard import Leaderboard
+from app.services import dashboard as dashboard_service
+from tests.conftest import auth_header, create_project
+
+
+def seed(client, token):
+    projects = []
+    day = date(2026, 1, 3)
+    for i in range(40):
+        data = {
+            "region": ["TN", "Kerala"][i % 2],
+            "status": ["Campaign signed up", "Video approved", "Deck Shared"][i % 3],
+            "salesperson_name": f"Rep {i % 7}",
+            "brand_name": f"Brand {i % 6}",
+            "request_date": day.isoformat(),
+        }
+        create_project(client, token, **data)
+        projects.append(data)
+        day += timedelta(days=3)
+    return projects
+
+
+def expected_top(projects, field, status, limit, start_date=None, end_date=None, region=None):
+    counts = Counter(
+        p[field]
+        for p in projects
+        if p["status"] == status
+        and (not start_date or date.fromisoformat(p["request_date"]) >= start_date)
+        and (not end_date or date.fromisoformat(p["request_date"]) <= end_date)
+        and (not region or p["region"] in region)
+    )
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [{"name": name, "count": count} for name, count in ranked]
+
+
+class TestLeaderboards:
+    def _get(self, client, token, board, **params):
+        resp = client.get(
+            f"/api/v1/dashboard/leaderboards/{board}", params=params, headers=auth_header(token)
+        )
+        assert resp.status_code == 200
+        return resp.json()
+
+    def test_top_salespeople_by_campaigns(self, client, marcom_token, management_token):
+        projects = seed(client, marcom_token)
+        data = self._get(client, management_token, "salespeople", limit=3)
+        assert data == expected_top(projects, "salesperson_name", "Campaign signed up", 3)
+
+    def test_top_brands_by_videos_approved(self, client, marcom_token, management_token):
+        projects = seed(client, marcom_token)
+        data = self._get(client, management_token, "brands")
+        assert data == expected_top(projects, "brand_name", "Video approved", 10)
+
+    def test_date_range_and_region(self, client, marcom_token, management_token):
+        projects = seed(client, marcom_token)
+        start_date, end_date = date(2026, 1, 20), date(2026, 3, 10)
+        for board, field, status in (
+            ("salespeople", "salesperson_name", "Campaign signed up"),
+            ("brands", "brand_name", "Video approved"),
+        ):
+            data = self._get(
+                client, management_token, board,
+                start_date=start_date.isoformat(), end_date=end_date.isoformat(), region="Kerala",
+            )
+            assert data == expected_top(
+                projects, field, status, 10, start_date, end_date, region=["Kerala"]
+            )
+
+    def test_follows_writes(self, client, marcom_token, management_token):
+        resp = create_project(client, marcom_token, brand_name="Newcomer", status="Deck Shared")
+        client.put(
+            f"/api/v1/projects/{resp.json()['id']}",
+            json={"status": "Video approved"},
+            headers=auth_header(marcom_token),
+        )
+        data = self._get(client, management_token, "brands")
+        assert data == [{"name": "Newcomer", "count": 1}]
+
+    def test_whole_months_rank_in_the_database(self, client, db, marcom_token, query_counter):
+        seed(client, marcom_token)
+        query_counter.clear()
+        top = dashboard_service.get_leaderboard.__wrapped__(
+            db, Leaderboard.salespeople, date(2026, 1, 1), date(2026, 2, 28), limit=2
+        )
+        assert len(top) == 2
+        assert len(query_counter) == 1
+        assert "LIMIT" in query_counter[0]
+
+    def test_requires_management(self, client, sales_token):
+        resp = client.get(
+            "/api/v1/dashboard/leaderboards/brands", headers=auth_header(sales_token)
+        )
+        assert resp.status_code == 403
+
+    def test_unknown_board(self, client, management_token):
+        resp = client.get(
+            "/api/v1/dashboard/leaderboards/cities", headers=auth_header(management_token)
+        )
+        assert resp.status_code == 422
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import threading
+from datetime import date
+
+from app.config import settings
+from app.services import live as live_service
+from app.services.live import metrics_hub
+from tests.conftest import auth_header, create_project
+
+
+def drain(subscription):
+    messages = []
+    while not subscription.queue.empty():
+        messages.append(subscription.queue.get_nowait())
+    return messages
+
+
+class TestMetricsHub:
+    def test_snapshot_then_deltas_from_writes(self, client, db, marcom_token):
+        create_project(client, marcom_token, brand_name="A")
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            subscription, snapshot = metrics_hub.subscribe(db, loop)
+            assert snapshot["total_projects"] == 1
+            assert snapshot["clients_by_region"] == [{"region": "TN", "count": 1}]
+
+            create_project(client, marcom_token, brand_name="A", status="Campaign signed up")
+            pid = create_project(client, marcom_token, brand_name="B", region="Kerala").json()["id"]
+            client.delete(f"/api/v1/projects/{pid}", headers=auth_header(marcom_token))
+            await asyncio.sleep(0)
+            return subscription, drain(subscription)
+
+        subscription, messages = asyncio.run(scenario())
+        assert messages == [
+            {
+                "seq": 1, "total_projects": 1, "campaigns_completed": 1,
+                "campaigns_by_region": {"TN": 1},
+            },
+            {"seq": 2, "total_projects": 1, "clients_by_region": {"Kerala": 1}},
+            {"seq": 3, "total_projects": -1, "clients_by_region": {"Kerala": -1}},
+        ]
+        assert metrics_hub.snapshot(subscription)["total_projects"] == 2
+        metrics_hub.unsubscribe(subscription)
+        assert metrics_hub.stats() == {"ranges": 0, "streams": 0}
+
+    def test_write_published_after_subscribe_is_not_counted_twice(
+        self, client, db, marcom_token, monkeypatch
+    ):
+        published = []
+        monkeypatch.setattr(metrics_hub, "publish", lambda *args: published.append(args))
+        create_project(client, marcom_token)
+        monkeypatch.undo()
+
+        async def scenario():
+            # Subscribed after the write committed but before it was published.
+            subscription, snapshot = metrics_hub.subscribe(db, asyncio.get_running_loop())
+            assert snapshot["total_projects"] == 1
+            metrics_hub.publish(*published[0])
+            create_project(client, marcom_token, brand_name="B")
+            await asyncio.sleep(0)
+            return subscription, drain(subscription)
+
+        subscription, messages = asyncio.run(scenario())
+        assert [m["total_projects"] for m in messages] == [1]
+        assert metrics_hub.snapshot(subscription)["total_projects"] == 2
+
+    def test_writes_during_a_load_do_not_wait_and_count_once(
+        self, client, db, marcom_token, monkeypatch
+    ):
+        loaded, release = threading.Event(), threading.Event()
+        load_state = live_service._load_state
+
+        def slow_load(*args):
+            state = load_state(*args)
+            loaded.set()
+            release.wait(5)
+            return state
+
+        monkeypatch.setattr(live_service, "_load_state", slow_load)
+        loop = asyncio.new_event_loop()
+        result = []
+        thread = threading.Thread(target=lambda: result.append(metrics_hub.subscribe(db, loop)))
+        thread.start()
+        loaded.wait(5)
+
+        # Committed after the range's snapshot; publishing must not wait on the load.
+        create_project(client, marcom_token)
+        assert not release.is_set()
+        release.set()
+        thread.join()
+        loop.close()
+
+        subscription, snapshot = result[0]
+        assert snapshot["total_projects"] == 1
+        metrics_hub.unsubscribe(subscription)
+
+    def test_out_of_range_writes_are_ignored(self, client, db, marcom_token):
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            subscription, _ = metrics_hub.subscribe(db, loop, end_date=date(2026, 1, 31))
+            create_project(client, marcom_token)
+            await asyncio.sleep(0)
+            return drain(subscription)
+
+        assert asyncio.run(scenario()) == []
+
+    def test_slow_consumer_is_resynced(self, client, db, marcom_token, monkeypatch):
+        monkeypatch.setattr(settings, "LIVE_STREAM_QUEUE_SIZE", 2)
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            subscription, snapshot = metrics_hub.subscribe(db, loop)
+            for i in range(4):
+                create_project(client, marcom_token, brand_name=f"B{i}")
+            await asyncio.sleep(0)
+
+            events = live_service.iter_events(subscription, snapshot)
+            received = [await events.__anext__() for _ in range(2)]
+            await events.aclose()
+            return received
+
+        first, resync = asyncio.run(scenario())
+        assert first.startswith("event: snapshot")
+        assert resync.startswith("event: snapshot")
+        assert '"total_projects": 4' in resync
+        assert metrics_hub.stats()["streams"] == 0
+
+
+class TestStreamEndpoint:
+    def test_stream_forbidden_sales(self, client, sales_token):
+        resp = client.get("/api/v1/dashboard/stream", headers=auth_header(sales_token))
+        assert resp.status_code == 403
+
+    def test_stream_sends_snapshot(
+        self, client, db, marcom_token, management_token, monkeypatch
+    ):
+        create_project(client, marcom_token)
+        real_iter_events = live_service.iter_events
+        holds_transaction = []
+
+        async def first_event(subscription, snapshot):
+            holds_transaction.append(db.in_transaction())
+            events = real_iter_events(subscription, snapshot)
+            yield await events.__anext__()
+            await events.aclose()
+
+        monkeypatch.setattr(live_service, "iter_events", first_event)
+        resp = client.get("/api/v1/dashboard/stream", headers=auth_header(management_token))
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        event, data = resp.text.splitlines()[:2]
+        assert event == "event: snapshot"
+        assert json.loads(data.removeprefix("data: "))["total_projects"] == 1
+        # The request's session gave its connection back before streaming began.
+        assert holds_transaction == [False]
+        assert metrics_hub.stats()["streams"] == 0
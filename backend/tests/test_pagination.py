@@ -0,0 +1,219 @@
+from app.services import projects as project_service
+from tests.conftest import auth_header, create_project
+
+
+def walk(client, token, params):
+    ids, cursor = [], None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        resp = client.get("/api/v1/projects/", params=query, headers=auth_header(token))
+        assert resp.status_code == 200
+        data = resp.json()
+        ids.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+class TestCursorPagination:
+    def test_walks_every_project_once(self, client, marcom_token):
+        # Rows created within the same second share created_at; ids break the tie.
+        created = [create_project(client, marcom_token).json()["id"] for _ in range(7)]
+        ids = walk(client, marcom_token, {"per_page": 3})
+        assert ids == sorted(created, reverse=True)
+
+    def test_matches_offset_pages(self, client, marcom_token):
+        for _ in range(5):
+            create_project(client, marcom_token)
+        headers = auth_header(marcom_token)
+        first = client.get("/api/v1/projects/?per_page=2", headers=headers).json()
+        second = client.get(
+            "/api/v1/projects/", params={"per_page": 2, "cursor": first["next_cursor"]},
+            headers=headers,
+        ).json()
+        by_offset = client.get("/api/v1/projects/?per_page=2&page=2", headers=headers).json()
+        assert [p["id"] for p in second["items"]] == [p["id"] for p in by_offset["items"]]
+        assert second["page"] is None
+
+    def test_respects_filters(self, client, marcom_token):
+        for i in range(6):
+            create_project(
+                client, marcom_token,
+                region="TN" if i % 2 else "Kerala",
+                brand_name="Acme" if i % 3 else "Globex",
+            )
+        ids = walk(client, marcom_token, {"per_page": 1, "region": "TN", "brand": "acm"})
+        expected = [
+            p["id"]
+            for p in client.get(
+                "/api/v1/projects/?per_page=100&region=TN&brand=acm",
+                headers=auth_header(marcom_token),
+            ).json()["items"]
+        ]
+        assert ids == expected
+        assert len(ids) == 2
+
+    def test_last_page_has_no_cursor(self, client, marcom_token):
+        create_project(client, marcom_token)
+        resp = client.get("/api/v1/projects/?per_page=1", headers=auth_header(marcom_token))
+        assert resp.json()["next_cursor"] is None
+
+    def test_invalid_cursor(self, client, marcom_token):
+        for cursor in ("not-a-cursor", project_service.encode_cursor("x", 1)[:-2], "MTIz"):
+            resp = client.get(
+                "/api/v1/projects/", params={"cursor": cursor}, headers=auth_header(marcom_token)
+            )
+            assert resp.status_code == 400
+            assert resp.json()["code"] == "BAD_REQUEST"
+
+    def test_cursor_round_trip(self):
+        cursor = project_service.encode_cursor("2026-02-15 10:00:00", 42)
+        assert "=" not in cursor
+        assert project_service.decode_cursor(cursor) == ("2026-02-15 10:00:00", 42)
+
+
+def count_statements(statements):
+    return [s for s in statements if "count(" in s.lower()]
+
+
+class TestTotals:
+    def test_total_can_be_skipped(self, client, marcom_token, query_counter):
+        create_project(client, marcom_token)
+        query_counter.clear()
+        resp = client.get(
+            "/api/v1/projects/?include_total=false", headers=auth_header(marcom_token)
+        )
+        data = resp.json()
+        assert data["total"] is None
+        assert len(data["items"]) == 1
+        assert count_statements(query_counter) == []
+
+    def test_exact_total_cached_until_write(self, client, marcom_token, query_counter):
+        headers = auth_header(marcom_token)
+        create_project(client, marcom_token, region="TN")
+        create_project(client, marcom_token, region="Kerala")
+
+        assert client.get("/api/v1/projects/?region=TN", headers=headers).json()["total"] == 1
+        query_counter.clear()
+        resp = client.get("/api/v1/projects/?region=TN&per_page=5", headers=headers)
+        assert resp.json()["total"] == 1
+        assert count_statements(query_counter) == []
+
+        create_project(client, marcom_token, region="TN")
+        query_counter.clear()
+        resp = client.get("/api/v1/projects/?region=TN", headers=headers)
+        assert resp.json()["total"] == 2
+        assert len(count_statements(query_counter)) == 1
+
+    def test_estimate_falls_back_to_exact(self, client, marcom_token):
+        create_project(client, marcom_token)
+        resp = client.get(
+            "/api/v1/projects/?estimate_total=true", headers=auth_header(marcom_token)
+        )
+        data = resp.json()
+        assert data["total"] == 1
+        assert data["total_is_estimate"] is False
+
+    def test_large_estimates_are_flagged(self, client, marcom_token, monkeypatch):
+        create_project(client, marcom_token)
+        headers = auth_header(marcom_token)
+        monkeypatch.setattr(project_service, "_estimate_count", lambda db, query, filtered: 250_000)
+        data = client.get("/api/v1/projects/?estimate_total=true", headers=headers).json()
+        assert (data["total"], data["total_is_estimate"]) == (250_000, True)
+
+        monkeypatch.setattr(project_service, "_estimate_count", lambda db, query, filtered: 40)
+        data = client.get("/api/v1/projects/?estimate_total=true", headers=headers).json()
+        assert (data["total"], data["total_is_estimate"]) == (1, False)
+
+
+class TestSearch:
+    def test_matches_any_search_field(self, client, marcom_token):
+        create_project(client, marcom_token, brand_name="Sunrise Foods")
+        create_project(client, marcom_token, salesperson_name="Ravi Sunder")
+        create_project(client, marcom_token, city="Sundargarh")
+        create_project(client, marcom_token, brand_name="Acme")
+        resp = client.get("/api/v1/projects/?q=SUN", headers=auth_header(marcom_token))
+        data = resp.json()
+        assert data["total"] == 3
+        assert data["next_cursor"] is None
+
+    def test_ranked_by_relevance(self, client, marcom_token):
+        contains = create_project(client, marcom_token, brand_name="Big Acme Holdings").json()
+        exact = create_project(client, marcom_token, brand_name="acme").json()
+        prefix = create_project(client, marcom_token, brand_name="Acme Retail").json()
+        resp = client.get("/api/v1/projects/?q=Acme", headers=auth_header(marcom_token))
+        assert [p["id"] for p in resp.json()["items"]] == [exact["id"], prefix["id"], contains["id"]]
+
+    def test_wildcards_are_literal(self, client, marcom_token):
+        create_project(client, marcom_token, brand_name="100% Juice")
+        create_project(client, marcom_token, brand_name="1000 Juices")
+        resp = client.get("/api/v1/projects/", params={"q": "100%"}, headers=auth_header(marcom_token))
+        assert [p["brand_name"] for p in resp.json()["items"]] == ["100% Juice"]
+
+    def test_combines_with_filters(self, client, marcom_token):
+        create_project(client, marcom_token, brand_name="Acme", region="TN")
+        create_project(client, marcom_token, brand_name="Acme", region="Kerala")
+        resp = client.get(
+            "/api/v1/projects/?q=acme&region=Kerala", headers=auth_header(marcom_token)
+        )
+        assert [p["region"] for p in resp.json()["items"]] == ["Kerala"]
+
+    def test_rejects_cursor(self, client, marcom_token):
+        cursor = project_service.encode_cursor("2026-02-15 10:00:00", 1)
+        resp = client.get(
+            "/api/v1/projects/", params={"q": "acme", "cursor": cursor},
+            headers=auth_header(marcom_token),
+        )
+        assert resp.status_code == 400
+
+
+class TestSparseFieldsets:
+    def test_returns_only_requested_fields(self, client, marcom_token):
+        pid = create_project(client, marcom_token, status="Deck Shared").json()["id"]
+        resp = client.get(
+            "/api/v1/projects/",
+            params=[("fields", "brand_name"), ("fields", "status"), ("fields", "request_date")],
+            headers=auth_header(marcom_token),
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"]
+        data = resp.json()
+        assert data["total"] == 1
+        assert data["items"] == [{
+            "id": pid, "brand_name": "Acme Corp", "status": "Deck Shared",
+            "request_date": "2026-02-15",
+        }]
+
+    def test_matches_full_items(self, client, marcom_token):
+        create_project(client, marcom_token)
+        headers = auth_header(marcom_token)
+        full = client.get("/api/v1/projects/", headers=headers).json()["items"][0]
+        sparse = client.get(
+            "/api/v1/projects/",
+            params=[("fields", "created_at"), ("fields", "updated_at"), ("fields", "region")],
+            headers=headers,
+        ).json()["items"][0]
+        assert sparse == {key: full[key] for key in ("id", "created_at", "updated_at", "region")}
+
+    def test_selects_only_requested_columns(self, client, marcom_token, query_counter):
+        create_project(client, marcom_token)
+        query_counter.clear()
+        client.get(
+            "/api/v1/projects/",
+            params={"fields": "city", "include_total": "false"},
+            headers=auth_header(marcom_token),
+        )
+        select = next(s for s in query_counter if "FROM projects" in s)
+        assert "projects.city" in select
+        assert "projects.brand_name" not in select
+
+    def test_cursor_pagination(self, client, marcom_token):
+        created = [create_project(client, marcom_token).json()["id"] for _ in range(5)]
+        ids = walk(client, marcom_token, {"per_page": 2, "fields": "city"})
+        assert ids == sorted(created, reverse=True)
+
+    def test_unknown_field(self, client, marcom_token):
+        resp = client.get(
+            "/api/v1/projects/", params={"fields": "password"}, headers=auth_header(marcom_token)
+        )
+        assert resp.status_code == 422
@@ -1,26 +1,10 @@
-import pytest
-
-from tests.conftest import auth_header
-
-
-SAMPLE_PROJECT = {
-    "region": "TN",
-    "request_date": "2026-02-15",
-    "city": "Chennai",
-    "salesperson_name": "John Doe",
-    "brand_name": "Acme Corp",
-    "category": "FMCG",
-    "status": "Brand description generated",
-}
+import csv
+import io
 
+import pytest
 
-def create_project(client, token, **overrides):
-    data = {**SAMPLE_PROJECT, **overrides}
-    return client.post(
-        "/api/v1/projects/",
-        json=data,
-        headers=auth_header(token),
-    )
+from app.services import exports as export_service
+from tests.conftest import SAMPLE_PROJECT, auth_header, create_project
 
 
 class TestCreateProject:
@@ -210,6 +194,60 @@ class TestUpdateProject:
         )
         assert resp.status_code == 404
 
+    def test_version_guards_concurrent_updates(self, client, marcom_token):
+        pid = create_project(client, marcom_token).json()["id"]
+        headers = auth_header(marcom_token)
+
+        resp = client.put(
+            f"/api/v1/projects/{pid}",
+            json={"city": "Mumbai"},
+            headers={**headers, "If-Match": '"1"'},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["version"] == 2
+        assert resp.headers["etag"] == '"2"'
+
+        stale = client.put(
+            f"/api/v1/projects/{pid}",
+            json={"city": "Pune"},
+            headers={**headers, "If-Match": '"1"'},
+        )
+        assert stale.status_code == 412
+        assert client.get(f"/api/v1/projects/{pid}", headers=headers).json()["city"] == "Mumbai"
+
+        resp = client.put(
+            f"/api/v1/projects/{pid}", json={"city": "Pune"}, headers={**headers, "If-Match": "*"}
+        )
+        assert resp.json()["version"] == 3
+
+    def test_detail_etag_is_accepted_by_if_match(self, client, marcom_token):
+        pid = create_project(client, marcom_token).json()["id"]
+        headers = auth_header(marcom_token)
+
+        etag = client.get(f"/api/v1/projects/{pid}", headers=headers).headers["etag"]
+        assert etag == '"1"'
+        resp = client.put(
+            f"/api/v1/projects/{pid}", json={"city": "Mumbai"}, headers={**headers, "If-Match": etag}
+        )
+        assert resp.status_code == 200
+
+        # Compressing proxies weaken ETags on the way back.
+        resp = client.put(
+            f"/api/v1/projects/{pid}", json={"city": "Pune"}, headers={**headers, "If-Match": 'W/"2"'}
+        )
+        assert resp.status_code == 200
+        assert resp.json()["version"] == 3
+
+    def test_one_statement_per_update(self, client, marcom_token, query_counter):
+        pid = create_project(client, marcom_token).json()["id"]
+        query_counter.clear()
+        client.put(
+            f"/api/v1/projects/{pid}", json={"city": "Mumbai"}, headers=auth_header(marcom_token)
+        )
+        assert sum(s.lstrip().startswith("UPDATE projects") for s in query_counter) == 1
+        # No reload after the write; SQLite alone reads the old row first.
+        assert sum("FROM projects" in s for s in query_counter) <= 1
+
 
 class TestDeleteProject:
     def test_delete_success(self, client, marcom_token):
@@ -233,6 +271,16 @@ class TestDeleteProject:
         resp = client.delete("/api/v1/projects/9999", headers=auth_header(marcom_token))
         assert resp.status_code == 404
 
+    def test_delete_with_stale_version(self, client, marcom_token):
+        pid = create_project(client, marcom_token).json()["id"]
+        headers = auth_header(marcom_token)
+        client.put(f"/api/v1/projects/{pid}", json={"city": "Mumbai"}, headers=headers)
+
+        resp = client.delete(f"/api/v1/projects/{pid}", headers={**headers, "If-Match": '"1"'})
+        assert resp.status_code == 412
+        resp = client.delete(f"/api/v1/projects/{pid}", headers={**headers, "If-Match": '"2"'})
+        assert resp.status_code == 204
+
 
 class TestExportCSV:
     def test_export_success(self, client, marcom_token):
@@ -244,3 +292,27 @@ class TestExportCSV:
         assert "Region" in content
         assert "Acme Corp" in content
         assert "Request Date" in content
+
+    def test_export_filters(self, client, marcom_token):
+        create_project(client, marcom_token, brand_name="Acme Corp", region="TN")
+        create_project(client, marcom_token, brand_name="Zenith", region="Kerala")
+        create_project(client, marcom_token, brand_name="Acme Foods", region="Kerala")
+        resp = client.get(
+            "/api/v1/projects/export",
+            params={"region": "Kerala", "brand": "acme"},
+            headers=auth_header(marcom_token),
+        )
+        rows = list(csv.reader(io.StringIO(resp.text)))
+        assert rows[0][0] == "ID"
+        assert [row[5] for row in rows[1:]] == ["Acme Foods"]
+
+    def test_export_streams_in_batches(self, client, db, marcom_token, monkeypatch):
+        for i in range(5):
+            create_project(client, marcom_token, brand_name=f"Brand {i}")
+        monkeypatch.setattr(export_service, "ROW_BATCH_SIZE", 2)
+        chunks = list(export_service.export_projects(db).chunks)
+        # The header, then one chunk per batch of rows.
+        assert len(chunks) == 4
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert [row[5] for row in rows[1:]] == [f"Brand {i}" for i in reversed(range(5))]
+        assert rows[1][1] == "TN" and rows[1][2] == "2026-02-15"
@@ -0,0 +1,112 @@
+from datetime import date
+
+from app.models.project import Project, ProjectStatus, Region
+from app.models.stats import ProjectDailyBrand, ProjectDailyStats
+from app.services import rollups as rollup_service
+from tests.conftest import auth_header, create_project
+
+
+def stats_rows(db):
+    return {
+        (r.request_date, r.region, r.status): r.project_count
+        for r in db.query(ProjectDailyStats).all()
+    }
+
+
+class TestRollupMaintenance:
+    def test_create_increments(self, client, db, marcom_token):
+        create_project(client, marcom_token)
+        create_project(client, marcom_token)
+
+        assert stats_rows(db) == {
+            (date(2026, 2, 15), Region.TN, ProjectStatus.brand_description_generated): 2,
+        }
+        brand = db.query(ProjectDailyBrand).one()
+        assert brand.brand_name == "Acme Corp"
+        assert brand.project_count == 2
+
+    def test_update_moves_counts(self, client, db, marcom_token):
+        pid = create_project(client, marcom_token).json()["id"]
+        client.put(
+            f"/api/v1/projects/{pid}",
+            json={"status": "Client approved", "brand_name": "Beta"},
+            headers=auth_header(marcom_token),
+        )
+
+        assert stats_rows(db) == {
+            (date(2026, 2, 15), Region.TN, ProjectStatus.client_approved): 1,
+        }
+        assert [b.brand_name for b in db.query(ProjectDailyBrand).all()] == ["Beta"]
+
+    def test_delete_removes_rows(self, client, db, marcom_token):
+        pid = create_project(client, marcom_token).json()["id"]
+        client.delete(f"/api/v1/projects/{pid}", headers=auth_header(marcom_token))
+
+        assert db.query(ProjectDailyStats).count() == 0
+        assert db.query(ProjectDailyBrand).count() == 0
+
+
+class TestRollupConsistency:
+    def test_consistent_after_writes(self, client, db, marcom_token):
+        create_project(client, marcom_token, brand_name="A")
+        pid = create_project(client, marcom_token, brand_name="B", region="Kerala").json()["id"]
+        client.put(
+            f"/api/v1/projects/{pid}",
+            json={"status": "Video approved"},
+            headers=auth_header(marcom_token),
+        )
+
+        assert rollup_service.find_discrepancies(db) == []
+
+    def test_detects_and_rebuilds(self, client, db, marcom_token):
+        create_project(client, marcom_token)
+        db.query(Project).delete()
+        db.commit()
+
+        discrepancies = rollup_service.find_discrepancies(db)
+        assert {d["table"] for d in discrepancies} == {
+            "project_daily_stats",
+            "project_daily_brands",
+            "project_monthly_cube",
+            "project_monthly_brands",
+        }
+        assert all(d["expected"] == 0 and d["actual"] == 1 for d in discrepancies)
+
+        rollup_service.rebuild(db)
+        db.commit()
+        assert rollup_service.find_discrepancies(db) == []
+
+
+class _RecordingSession:
+    """Passes statements through to ``db`` and keeps their parameters."""
+
+    def __init__(self, db):
+        self.db = db
+        self.params = []
+
+    def get_bind(self):
+        return self.db.get_bind()
+
+    def execute(self, statement, params=None):
+        self.params.append(params)
+        return self.db.execute(statement, params)
+
+
+class TestLockOrder:
+    def test_opposite_moves_write_rows_in_the_same_order(self, db):
+        a = {"id": 1, "region": Region.TN, "request_date": date(2026, 2, 15), "city": "Chennai",
+             "salesperson_name": "A", "brand_name": "Acme", "category": "FMCG",
+             "status": ProjectStatus.deck_shared}
+        b = {**a, "region": Region.Kerala, "status": ProjectStatus.client_approved}
+
+        orders = []
+        for change in ((a, b), (b, a)):
+            session = _RecordingSession(db)
+            rollup_service.apply_changes(session, [change])
+            orders.append([
+                [{k: v for k, v in row.items() if k != "project_count"} for row in params]
+                for params in session.params
+                if isinstance(params, list) and "project_count" in params[0]
+            ])
+            db.rollback()
+        assert orders[0] == orders[1]
@@ -0,0 +1,71 @@
+from app.models.sketch import BrandSketch
+from app.services.sketches import STANDARD_ERROR, HyperLogLog
+from tests.conftest import auth_header, create_project
+
+
+class TestHyperLogLog:
+    def test_small_cardinality_is_exact(self):
+        sketch = HyperLogLog()
+        for i in range(50):
+            sketch.add(f"brand-{i}")
+            sketch.add(f"brand-{i}")
+        assert round(sketch.cardinality()) == 50
+
+    def test_large_cardinality_within_error_bound(self):
+        sketch = HyperLogLog()
+        for i in range(50_000):
+            sketch.add(f"brand-{i}")
+        assert abs(sketch.cardinality() - 50_000) / 50_000 < 4 * STANDARD_ERROR
+
+    def test_merge_is_union(self):
+        a, b = HyperLogLog(), HyperLogLog()
+        for i in range(300):
+            a.add(f"brand-{i}")
+        for i in range(200, 500):
+            b.add(f"brand-{i}")
+        a.merge(b)
+        assert abs(a.cardinality() - 500) / 500 < 4 * STANDARD_ERROR
+
+    def test_serialization_round_trip(self):
+        sparse, dense = HyperLogLog(), HyperLogLog()
+        for i in range(10):
+            sparse.add(f"brand-{i}")
+        for i in range(20_000):
+            dense.add(f"brand-{i}")
+
+        assert sparse.to_bytes()[:1] == b"\x01"
+        assert len(sparse.to_bytes()) < 40
+        assert dense.to_bytes()[:1] == b"\x00"
+        assert len(dense.to_bytes()) < len(dense.registers)
+        for sketch in (sparse, dense):
+            assert HyperLogLog.from_bytes(sketch.to_bytes()).registers == sketch.registers
+
+
+class TestApproximateClients:
+    def test_sketches_follow_writes(self, client, db, marcom_token):
+        pid = create_project(client, marcom_token).json()["id"]
+        assert db.query(BrandSketch).count() == 1
+
+        client.delete(f"/api/v1/projects/{pid}", headers=auth_header(marcom_token))
+        assert db.query(BrandSketch).count() == 0
+
+    def test_approximate_matches_exact_for_small_ranges(self, client, marcom_token, management_token):
+        create_project(client, marcom_token, brand_name="A", request_date="2026-02-01")
+        create_project(client, marcom_token, brand_name="A", request_date="2026-02-02")
+        create_project(client, marcom_token, brand_name="B", request_date="2026-02-02")
+        pid = create_project(client, marcom_token, brand_name="C", region="Kerala").json()["id"]
+        client.put(
+            f"/api/v1/projects/{pid}", json={"brand_name": "D"}, headers=auth_header(marcom_token)
+        )
+
+        headers = auth_header(management_token)
+        exact = client.get("/api/v1/dashboard/clients-by-region", headers=headers).json()
+        approx = client.get(
+            "/api/v1/dashboard/clients-by-region?approximate=true", headers=headers
+        ).json()
+        assert sorted(exact, key=lambda r: r["region"]) == approx
+        assert approx == [{"region": "Kerala", "count": 1}, {"region": "TN", "count": 2}]
+
+        metrics = client.get("/api/v1/dashboard/metrics?approximate=true", headers=headers).json()
+        assert metrics["total_projects"] == 4
+        assert metrics["clients_by_region"] == approx
@@ -0,0 +1,170 @@
+from datetime import date, timedelta
+from itertools import product
+
+import pytest
+from sqlalchemy import update
+
+from app.models.project import Category, Project, ProjectStatus, Region
+from app.schemas.dashboard import SliceDimension
+from app.services import dashboard as dashboard_service
+from app.services import etags as etag_service
+from tests.conftest import auth_header, create_project
+
+
+def seed(client, token):
+    regions = ["TN", "Kerala", "Delhi"]
+    statuses = ["Client approved", "Video approved", "Campaign signed up"]
+    ids = []
+    for i in range(18):
+        resp = create_project(
+            client,
+            token,
+            region=regions[i % 3],
+            status=statuses[i % 3 if i % 4 else 0],
+            category="FMCG" if i % 2 else "Industrial Goods",
+            salesperson_name=f"Rep {i % 4}",
+            brand_name=f"Brand {i % 5}",
+            request_date=f"2026-02-{1 + i:02d}",
+        )
+        ids.append(resp.json()["id"])
+    return ids
+
+
+SLICES = [
+    dict(),
+    dict(start_date=date(2026, 2, 5), end_date=date(2026, 2, 12)),
+    dict(region=[Region.TN, Region.Delhi]),
+    dict(category=[Category.FMCG], status=[ProjectStatus.client_approved]),
+    dict(salesperson=["Rep 1", "Rep 3", "Nobody"]),
+    dict(region=[Region.Mumbai]),
+]
+
+
+def assert_matches_sql(db):
+    snapshot = dashboard_service.ProjectSnapshot()
+    for filters, group_by in product(SLICES, [None, *SliceDimension]):
+        start_date = filters.get("start_date")
+        end_date = filters.get("end_date")
+        dimensions = {
+            SliceDimension.region: filters.get("region"),
+            SliceDimension.category: filters.get("category"),
+            SliceDimension.status: filters.get("status"),
+            SliceDimension.salesperson: filters.get("salesperson"),
+        }
+        expected = dashboard_service._slice_sql(db, start_date, end_date, dimensions, group_by)
+        actual = snapshot.slice(db, start_date, end_date, dimensions, group_by)
+        assert actual == expected, (filters, group_by)
+    return snapshot
+
+
+class TestSliceEndpoint:
+    def test_group_by_region(self, client, marcom_token, management_token):
+        seed(client, marcom_token)
+        resp = client.get(
+            "/api/v1/dashboard/slice",
+            params={"group_by": "region", "category": "FMCG"},
+            headers=auth_header(management_token),
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["projects"] == 9
+        assert sum(g["projects"] for g in data["groups"]) == 9
+        assert [g["key"] for g in data["groups"]] == sorted(g["key"] for g in data["groups"])
+
+    def test_repeated_filter_matches_any_value(self, client, marcom_token, management_token):
+        seed(client, marcom_token)
+        resp = client.get(
+            "/api/v1/dashboard/slice?region=TN&region=Kerala",
+            headers=auth_header(management_token),
+        )
+        assert resp.json()["projects"] == 12
+
+    def test_sql_fallback(self, client, marcom_token, management_token, monkeypatch):
+        seed(client, marcom_token)
+        params = {"group_by": "status", "region": "TN"}
+        headers = auth_header(management_token)
+        from_snapshot = client.get("/api/v1/dashboard/slice", params=params, headers=headers)
+
+        monkeypatch.setattr(dashboard_service.settings, "DASHBOARD_SNAPSHOT_ENABLED", False)
+        from_sql = client.get("/api/v1/dashboard/slice", params=params, headers=headers)
+        assert from_sql.json() == from_snapshot.json()
+
+    def test_requires_management(self, client, sales_token):
+        resp = client.get("/api/v1/dashboard/slice", headers=auth_header(sales_token))
+        assert resp.status_code == 403
+
+
+class TestProjectSnapshot:
+    @pytest.fixture(autouse=True)
+    def require_numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_matches_sql(self, client, db, marcom_token):
+        seed(client, marcom_token)
+        assert_matches_sql(db)
+
+    def test_incremental_refresh_matches_sql(self, client, db, marcom_token):
+        ids = seed(client, marcom_token)
+        snapshot = assert_matches_sql(db)
+
+        headers = auth_header(marcom_token)
+        client.put(
+            f"/api/v1/projects/{ids[0]}",
+            json={"status": "Video approved", "salesperson_name": "Rep 9"},
+            headers=headers,
+        )
+        client.delete(f"/api/v1/projects/{ids[1]}", headers=headers)
+        create_project(client, marcom_token, brand_name="Brand new", region="Gujarat")
+
+        filters = {dimension: None for dimension in SliceDimension}
+        for group_by in [None, *SliceDimension]:
+            expected = dashboard_service._slice_sql(db, None, None, filters, group_by)
+            assert snapshot.slice(db, None, None, filters, group_by) == expected
+        assert snapshot.stats()["snapshot_rows"] == 18
+
+    def test_late_commits_trigger_a_reload(self, client, db, marcom_token):
+        ids = seed(client, marcom_token)
+        snapshot = assert_matches_sql(db)
+
+        # Stamped well before the snapshot's watermark, as the rows of a long
+        # import or bulk batch are when it finally commits.
+        stamp = snapshot.watermark - timedelta(hours=1)
+        db.execute(
+            update(Project)
+            .where(Project.id == ids[0])
+            .values(
+                status=ProjectStatus.deck_shared, version=Project.version + 1, updated_at=stamp
+            )
+        )
+        user_id = db.get(Project, ids[1]).user_id
+        db.add(Project(
+            user_id=user_id, region=Region.Mumbai, request_date=date(2026, 2, 3), city="Pune",
+            salesperson_name="Rep 7", brand_name="Late Co", category=Category.FMCG,
+            created_at=stamp,
+        ))
+        etag_service.bump(db)
+        db.commit()
+
+        filters = {dimension: None for dimension in SliceDimension}
+        for group_by in [None, *SliceDimension]:
+            expected = dashboard_service._slice_sql(db, None, None, filters, group_by)
+            assert snapshot.slice(db, None, None, filters, group_by) == expected
+        assert snapshot.stats()["snapshot_rows"] == 19
+
+    def test_refresh_skipped_when_unchanged(self, client, db, marcom_token, query_counter):
+        seed(client, marcom_token)
+        snapshot = dashboard_service.ProjectSnapshot()
+        filters = {dimension: None for dimension in SliceDimension}
+        snapshot.slice(db, None, None, filters, None)
+
+        query_counter.clear()
+        snapshot.slice(db, None, None, filters, SliceDimension.status)
+        assert len(query_counter) == 1  # the data version check
+
+    def test_memory_stats(self, client, db, marcom_token):
+        seed(client, marcom_token)
+        snapshot = assert_matches_sql(db)
+        stats = snapshot.stats()
+        assert stats["snapshot_rows"] == 18
+        # Seven small integer columns plus the int64 ids per row, plus the dictionaries.
+        assert 18 * (8 + 3 + 4 + 4 + 4 + 4) <= stats["snapshot_bytes"] < 10_000
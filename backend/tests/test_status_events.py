@@ -0,0 +1,102 @@
+from datetime import datetime
+
+from app.models.project import ProjectStatus, Region
+from app.models.status_event import ProjectStatusEvent
+from tests.conftest import auth_header, create_project
+
+
+def update_status(client, token, pid, status):
+    return client.put(
+        f"/api/v1/projects/{pid}", json={"status": status}, headers=auth_header(token)
+    )
+
+
+class TestStatusEventLog:
+    def test_create_and_status_change_append_events(self, client, db, marcom_token):
+        pid = create_project(client, marcom_token).json()["id"]
+        update_status(client, marcom_token, pid, "Deck in progress")
+        client.put(
+            f"/api/v1/projects/{pid}", json={"city": "Madurai"}, headers=auth_header(marcom_token)
+        )
+
+        events = db.query(ProjectStatusEvent).order_by(ProjectStatusEvent.id).all()
+        assert [(e.from_status, e.status) for e in events] == [
+            (None, ProjectStatus.brand_description_generated),
+            (ProjectStatus.brand_description_generated, ProjectStatus.deck_in_progress),
+        ]
+
+
+class TestFunnel:
+    def test_funnel_counts_furthest_stage(self, client, marcom_token, management_token):
+        a = create_project(client, marcom_token, brand_name="A").json()["id"]
+        create_project(client, marcom_token, brand_name="B")
+        update_status(client, marcom_token, a, "Deck Shared")
+        create_project(client, marcom_token, brand_name="C", status="Client approved")
+
+        resp = client.get("/api/v1/dashboard/funnel", headers=auth_header(management_token))
+        assert resp.status_code == 200
+        stages = {s["status"]: s for s in resp.json()}
+        assert "Client rejected" not in stages
+        assert stages["Brand description generated"]["projects"] == 3
+        assert stages["Deck in progress"]["projects"] == 2
+        assert stages["Deck Shared"]["projects"] == 2
+        assert stages["Client approved"]["projects"] == 1
+        assert stages["Client approved"]["conversion_rate"] == 1 / 3
+        assert stages["Client approved"]["step_conversion_rate"] == 0.5
+        assert stages["Campaign signed up"]["projects"] == 0
+
+    def test_funnel_region_filter(self, client, marcom_token, management_token):
+        create_project(client, marcom_token, brand_name="A", region="TN")
+        create_project(client, marcom_token, brand_name="B", region="Kerala")
+
+        resp = client.get(
+            "/api/v1/dashboard/funnel?region=Kerala", headers=auth_header(management_token)
+        )
+        assert resp.json()[0]["projects"] == 1
+
+    def test_funnel_follows_region_changes(self, client, marcom_token, management_token):
+        pid = create_project(client, marcom_token, region="TN").json()["id"]
+        update_status(client, marcom_token, pid, "Deck Shared")
+        client.put(
+            f"/api/v1/projects/{pid}", json={"region": "Kerala"}, headers=auth_header(marcom_token)
+        )
+
+        headers = auth_header(management_token)
+        kerala = client.get("/api/v1/dashboard/funnel?region=Kerala", headers=headers).json()
+        tn = client.get("/api/v1/dashboard/funnel?region=TN", headers=headers).json()
+        assert [s["projects"] for s in kerala][:3] == [1, 1, 1]
+        assert tn[0]["projects"] == 0
+
+    def test_funnel_forbidden_sales(self, client, sales_token):
+        resp = client.get("/api/v1/dashboard/funnel", headers=auth_header(sales_token))
+        assert resp.status_code == 403
+
+
+class TestTimeInStage:
+    def test_median_and_p90_per_region(self, client, db, marcom_token, management_token):
+        durations = [60, 120, 180, 240, 300]
+        for i, seconds in enumerate(durations):
+            pid = create_project(client, marcom_token, brand_name=f"B{i}").json()["id"]
+            db.query(ProjectStatusEvent).filter(ProjectStatusEvent.project_id == pid).update(
+                {"at": datetime(2026, 3, 1, 10, 0, 0)}
+            )
+            db.add(ProjectStatusEvent(
+                project_id=pid,
+                from_status=ProjectStatus.brand_description_generated,
+                status=ProjectStatus.deck_in_progress,
+                region=Region.TN,
+                at=datetime(2026, 3, 1, 10, seconds // 60, 0),
+            ))
+        db.commit()
+
+        resp = client.get(
+            "/api/v1/dashboard/time-in-stage?start_date=2026-03-01",
+            headers=auth_header(management_token),
+        )
+        assert resp.status_code == 200
+        [stage] = resp.json()
+        assert stage["region"] == "TN"
+        assert stage["status"] == "Brand description generated"
+        assert stage["stints"] == 5
+        assert round(stage["median_seconds"]) == 180
+        assert round(stage["p90_seconds"]) == 276
@@ -0,0 +1,113 @@
+from app.schemas.project import SuggestField
+from app.services import suggestions as suggestion_service
+from tests.conftest import auth_header, create_project
+
+
+def seed(client, token):
+    ids = []
+    for brand, copies in [("Acme Corp", 3), ("acme labs", 1), ("Acorn", 2), ("Bolt", 4)]:
+        for _ in range(copies):
+            ids.append(create_project(client, token, brand_name=brand).json()["id"])
+    return ids
+
+
+def suggest(client, token, field="brand", **params):
+    resp = client.get(
+        "/api/v1/projects/suggest",
+        params={"field": field, **params},
+        headers=auth_header(token),
+    )
+    assert resp.status_code == 200
+    return [(s["value"], s["count"]) for s in resp.json()]
+
+
+class TestSuggest:
+    def test_prefix_ranked_by_count(self, client, marcom_token):
+        seed(client, marcom_token)
+        assert suggest(client, marcom_token, prefix="ac") == [
+            ("Acme Corp", 3),
+            ("Acorn", 2),
+            ("acme labs", 1),
+        ]
+        assert suggest(client, marcom_token, prefix="ACME") == [("Acme Corp", 3), ("acme labs", 1)]
+        assert suggest(client, marcom_token, prefix="zz") == []
+
+    def test_empty_prefix_and_limit(self, client, marcom_token):
+        seed(client, marcom_token)
+        assert suggest(client, marcom_token, limit=2) == [("Bolt", 4), ("Acme Corp", 3)]
+
+    def test_other_fields(self, client, marcom_token):
+        create_project(client, marcom_token, city="Coimbatore", salesperson_name="Jane Roe")
+        create_project(client, marcom_token)
+        assert suggest(client, marcom_token, field="city", prefix="c") == [
+            ("Chennai", 1),
+            ("Coimbatore", 1),
+        ]
+        assert suggest(client, marcom_token, field="salesperson", prefix="j") == [
+            ("Jane Roe", 1),
+            ("John Doe", 1),
+        ]
+
+    def test_kept_current_by_writes(self, client, marcom_token):
+        ids = seed(client, marcom_token)
+        assert suggest(client, marcom_token, prefix="a")[0] == ("Acme Corp", 3)
+
+        headers = auth_header(marcom_token)
+        client.put(f"/api/v1/projects/{ids[0]}", json={"brand_name": "Acorn"}, headers=headers)
+        client.delete(f"/api/v1/projects/{ids[3]}", headers=headers)
+        create_project(client, marcom_token, brand_name="Aardvark")
+        assert suggest(client, marcom_token, prefix="a") == [
+            ("Acorn", 3),
+            ("Acme Corp", 2),
+            ("Aardvark", 1),
+        ]
+
+    def test_hot_path_skips_database(self, client, db, marcom_token, query_counter):
+        seed(client, marcom_token)
+        index = suggestion_service.SuggestionIndex()
+        index.suggest(db, SuggestField.brand, "a")
+
+        query_counter.clear()
+        assert index.suggest(db, SuggestField.brand, "b") == [{"value": "Bolt", "count": 4}]
+        # Only the data version is read, to notice writes made elsewhere.
+        assert len(query_counter) == 1
+        assert "FROM data_versions" in query_counter[0]
+
+    def test_write_from_another_process_reloads(self, client, marcom_token, monkeypatch):
+        seed(client, marcom_token)
+        assert suggest(client, marcom_token, prefix="b") == [("Bolt", 4)]
+
+        # Nothing in this process hears about the write.
+        monkeypatch.setattr(suggestion_service.suggestion_index, "publish", lambda *args: None)
+        create_project(client, marcom_token, brand_name="Bolt")
+        assert suggest(client, marcom_token, prefix="b") == [("Bolt", 5)]
+
+    def test_write_published_after_load_is_not_counted_twice(
+        self, client, marcom_token, monkeypatch
+    ):
+        ids = [create_project(client, marcom_token, brand_name="Zed").json()["id"] for _ in "ab"]
+        assert suggest(client, marcom_token, prefix="z") == [("Zed", 2)]
+
+        published = []
+        monkeypatch.setattr(
+            suggestion_service.suggestion_index, "publish", lambda *args: published.append(args)
+        )
+        client.delete(f"/api/v1/projects/{ids[0]}", headers=auth_header(marcom_token))
+        monkeypatch.undo()
+
+        # Reloaded after the delete committed but before it was published.
+        assert suggest(client, marcom_token, prefix="z") == [("Zed", 1)]
+        suggestion_service.suggestion_index.publish(*published[0])
+        assert suggest(client, marcom_token, prefix="z") == [("Zed", 1)]
+
+    def test_invalid_field(self, client, marcom_token):
+        resp = client.get(
+            "/api/v1/projects/suggest",
+            params={"field": "region"},
+            headers=auth_header(marcom_token),
+        )
+        assert resp.status_code == 422
+
+    def test_unauthenticated(self, client):
+        resp = client.get("/api/v1/projects/suggest", params={"field": "brand"})
+        assert resp.status_code == 401